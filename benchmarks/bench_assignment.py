@@ -0,0 +1,52 @@
+"""Benchmark: validated in-place edits vs. rebuilding the block to re-validate it.
+
+Usage:
+    python benchmarks/bench_assignment.py
+"""
+
+from dataclasses import fields
+
+from layouts import time_call
+
+from slack_tools.blocks.blocks import RichTextList, SectionBlock
+from slack_tools.blocks.interactive import Button
+from slack_tools.blocks.text import PlainText
+from slack_tools.blocks.validation import assignment_checks
+
+SECTION = SectionBlock.create('Hello', accessory=Button.create('Open', action_id='open'))
+LIST = RichTextList(elements=[])
+TEXT = PlainText.create('Updated text')
+
+
+def rebuild(block, **changes):
+    return type(block)(**{f.name: getattr(block, f.name) for f in fields(block) if f.init} | changes)
+
+
+def assign_text():
+    SECTION.text = TEXT
+
+
+def assign_indent():
+    LIST.indent = 4
+
+
+CASES = {
+    'section.text = ...': (assign_text, lambda: rebuild(SECTION, text=TEXT)),
+    'rich_text_list.indent = 4': (assign_indent, lambda: rebuild(LIST, indent=4)),
+}
+
+
+def main():
+    for name, (assign, rebuilt) in CASES.items():
+        unchecked_us = time_call(assign, 20000)
+        with assignment_checks():
+            checked_us = time_call(assign, 20000)
+        rebuild_us = time_call(rebuilt, 20000)
+        print(
+            f'{name:27s} unchecked: {unchecked_us:6.2f} us  checked: {checked_us:6.2f} us  '
+            f'rebuild: {rebuild_us:6.2f} us  ({rebuild_us / checked_us:.1f}x)'
+        )
+
+
+if __name__ == '__main__':
+    main()
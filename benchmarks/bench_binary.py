@@ -0,0 +1,48 @@
+"""Benchmark: binary storage encoding vs. JSON, for size and decoding speed.
+
+"to blocks" compares `json.loads` + `decode()` with `binary.decode_objects()`,
+leaving out the `BlockKit()` both `from_json()` and `from_binary()` build.
+
+Usage:
+    python benchmarks/bench_binary.py
+"""
+
+import json
+
+from layouts import build_layout, time_call
+
+from slack_tools.block_kit import BlockKit
+from slack_tools.serialization import binary
+from slack_tools.serialization.decoder import decode
+
+
+def main():
+    for count in (5, 50, 500):
+        layout = build_layout(count)
+        text = layout.to_json()
+        data = layout.to_binary()
+        assert binary.decode(data) == layout.to_dict()
+        assert BlockKit.from_binary(data).blocks == BlockKit.from_json(text).blocks
+
+        compact = json.dumps(layout.to_dict(), separators=(',', ':'))
+        print(
+            f'{count:4d} blocks  json: {len(text):8d} B  compact: {len(compact):8d} B  '
+            f'binary: {len(data):7d} B  ({len(text) / len(data):.1f}x smaller)'
+        )
+
+        number = max(5, 2000 // count)
+        loads_us = time_call(lambda: json.loads(text), number)
+        from_json_us = time_call(lambda: decode(json.loads(text)['blocks']), number)
+        decode_us = time_call(lambda: binary.decode(data), number)
+        from_binary_us = time_call(lambda: binary.decode_objects(data), number)
+        encode_us = time_call(lambda: binary.encode(layout), number)
+        print(f'      to wire   json.loads:  {loads_us:9.1f} us  binary.decode:      {decode_us:9.1f} us')
+        print(
+            f'      to blocks json+decode: {from_json_us:9.1f} us  decode_objects:     {from_binary_us:9.1f} us'
+            f'  ({from_json_us / from_binary_us:.1f}x)'
+        )
+        print(f'      encode    to_binary:   {encode_us:9.1f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark: `to_api()` on a cached layout (see `cache()`), unchanged and after a single change.
+
+Usage:
+    python benchmarks/bench_cache.py
+"""
+
+from layouts import build_layout, clear_caches, time_call
+
+from slack_tools.blocks.text import PlainText
+from slack_tools.serialization.encoder import cache_stats
+
+
+def main():
+    layout = build_layout(50).cache()
+    layout.to_api()
+    layout.to_api()
+    button = layout.blocks[3].elements[0]
+
+    def change_one():
+        button.text = PlainText('Approve')
+        return layout.to_api()
+
+    stats = cache_stats()
+    stats.reset()
+    change_one()
+    print(f'single change: {stats.misses} misses, {stats.hits} hits')
+
+    walk = time_call(lambda: clear_caches(layout), 200)
+    cold = time_call(lambda: clear_caches(layout) or layout.to_api(), 200) - walk
+    uncached = build_layout(50)
+    print(f'to_api  uncached:      {time_call(uncached.to_api, 200):9.2f} us')
+    print(f'to_api  cold:          {cold:9.2f} us')
+    print(f'to_api  one change:    {time_call(change_one, 200):9.2f} us')
+    print(f'to_api  unchanged:     {time_call(layout.to_api, 20000):9.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+"""Benchmark: splitting long mrkdwn reports into sections, at growing sizes.
+
+Usage:
+    python benchmarks/bench_chunking.py
+"""
+
+from layouts import md, time_call
+
+from slack_tools.blocks.blocks import SectionBlock
+from slack_tools.mrkdwn.base import MarkdownStr
+
+
+def build_report(lines: int) -> MarkdownStr:
+    """A report mixing bold, links, mentions and code blocks, with a line break every few tokens."""
+    parts = []
+    for i in range(lines):
+        parts.append(
+            f'{md.bold(f"Build #{i}")} by {md.mention(f"@U{i:06d}")}: '
+            f'{md.link(f"https://ci.example.com/builds/{i}_log", "log")} passed in {i % 90}s'
+        )
+        if i % 10 == 0:
+            parts.append(md.code_block(f'step_{i}: ok\nstep_{i + 1}: ok'))
+    return MarkdownStr('\n'.join(parts))
+
+
+def main():
+    for lines in (100, 1000, 10000):
+        report = build_report(lines)
+        sections = SectionBlock.create(report, overflow='split')
+        split_us = time_call(lambda: SectionBlock.create(report, overflow='split'), 10)
+        print(
+            f'split {len(report):8d} chars into {len(sections):4d} sections: '
+            f'{split_us:10.1f} us  ({split_us * 1000 / len(report):.1f} ns/char)'
+        )
+
+
+if __name__ == '__main__':
+    main()
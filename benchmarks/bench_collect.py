@@ -0,0 +1,49 @@
+"""Benchmark: adding an item to a frozen collector block vs. rebuilding and re-freezing it.
+
+Usage:
+    python benchmarks/bench_collect.py
+"""
+
+from layouts import time_call
+
+from slack_tools.block_kit import BlockKit
+
+bk = BlockKit()
+
+
+def context_items(n: int) -> list:
+    return [bk.plain_text(f'Label {i}') for i in range(n)]
+
+
+def option_items(n: int) -> list:
+    return [bk.option(f'Option {i}', value=f'option-{i}') for i in range(n)]
+
+
+CASES = {
+    'context (9 + 1 elements)': (bk.context, context_items(9), bk.plain_text('New label').freeze()),
+    'static_select (99 + 1 options)': (
+        bk.static_select,
+        option_items(99),
+        bk.option('New option', value='new').freeze(),
+    ),
+}
+
+
+def main():
+    for name, (collector, items, item) in CASES.items():
+        frozen = collector[tuple(items)].freeze()
+        assert frozen[item].to_dict() == collector[(*items, item)].freeze().to_dict()
+
+        shared_us = time_call(lambda: frozen[item], 5000)
+        rebuilt_us = time_call(lambda: collector[(*items, item)].freeze(), 5000)
+        print(
+            f'{name:31s} frozen[item]: {shared_us:7.2f} us  rebuild + freeze: {rebuilt_us:7.2f} us  '
+            f'({rebuilt_us / shared_us:.1f}x)'
+        )
+
+        hash(frozen)
+        print(f'{"":31s} hash(frozen): {time_call(lambda: hash(frozen), 20000):7.2f} us')
+
+
+if __name__ == '__main__':
+    main()
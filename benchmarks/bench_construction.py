@@ -0,0 +1,84 @@
+"""Benchmark: block construction with compiled vs. per-call type validation, and per validation mode.
+
+"per-call" is the previous `validate_field_type`, which re-inspected the
+annotations with `get_origin`/`get_args` on every construction.
+
+Usage:
+    python benchmarks/bench_construction.py
+"""
+
+from typing import Union, get_args, get_origin
+
+from layouts import build_layout, time_call
+
+from slack_tools.blocks.blocks import ContextBlock, SectionBlock
+from slack_tools.blocks.interactive import Button
+from slack_tools.blocks.mixins.validator import TypeValidatorMixin
+from slack_tools.blocks.text import MarkdownText, PlainText
+from slack_tools.blocks.validation import ValidationMode, validation
+
+
+def per_call_validate_field_type(self, field_name):
+    value = getattr(self, field_name)
+    if value is None:
+        return
+    field_type = self.__annotations__[field_name]
+    origin_type = get_origin(field_type)
+    if origin_type is Union:
+        allowed_types = tuple(t for t in get_args(field_type) if t != type(None))
+        if not isinstance(value, allowed_types):
+            raise ValueError(field_name)
+        return
+    if origin_type is list:
+        element_type = get_args(field_type)[0]
+        if get_origin(element_type) is Union:
+            element_type = get_args(element_type)
+        if not all(isinstance(elem, element_type) for elem in value):
+            raise ValueError(field_name)
+        return
+    if not isinstance(value, field_type):
+        raise ValueError(field_name)
+
+
+CASES = {
+    'SectionBlock.create': lambda: SectionBlock.create('Hello', accessory=Button.create('Open', action_id='open')),
+    'ContextBlock[...]': lambda: ContextBlock()[
+        PlainText.create('a'), MarkdownText.create('*b*'), PlainText.create('c')
+    ],
+}
+
+
+def main():
+    compiled = TypeValidatorMixin.validate_field_type
+    section = SectionBlock.create('Hello', accessory=Button.create('Open', action_id='open'))
+
+    def validate():
+        section.validate_field_type('text')
+        section.validate_field_type('accessory')
+        section.validate_field_type('fields')
+
+    CASES['validate (3 fields)'] = validate
+    for name, build in CASES.items():
+        TypeValidatorMixin.validate_field_type = per_call_validate_field_type
+        before_us = time_call(build, 5000)
+        TypeValidatorMixin.validate_field_type = compiled
+        after_us = time_call(build, 5000)
+        print(
+            f'{name:20s} per-call: {1e6 / before_us:9.0f}/s  compiled: {1e6 / after_us:9.0f}/s'
+            f'  ({before_us / after_us:.2f}x)'
+        )
+
+    print()
+    build = CASES['SectionBlock.create']
+    for mode in ValidationMode:
+        with validation(mode):
+            print(f'SectionBlock.create  {mode:8s}: {1e6 / time_call(build, 5000):9.0f}/s')
+
+    print()
+    for mode in ValidationMode:
+        with validation(mode):
+            print(f'build_layout(50)+to_api {mode:8s}: {time_call(lambda: build_layout(50).to_api(), 50):9.1f} us')
+
+
+if __name__ == '__main__':
+    main()
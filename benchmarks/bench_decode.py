@@ -0,0 +1,84 @@
+"""Benchmark: `BlockKit.from_api()` vs. a naive recursive loader, and full round trips.
+
+The naive loader is what you'd write without the registry: scan the schema
+classes for one whose `type` matches, then recurse into each field using the
+class's type hints.
+
+Usage:
+    python benchmarks/bench_decode.py
+"""
+
+import json
+import typing
+from dataclasses import fields, is_dataclass
+
+from layouts import build_layout, time_call
+
+from slack_tools.block_kit import BlockKit
+from slack_tools.blocks.schemas.base import BaseSchema
+
+
+def schema_classes() -> list[type]:
+    """Every dataclass schema, most derived (builder) classes first."""
+    found, stack = [], [BaseSchema]
+    while stack:
+        cls = stack.pop()
+        stack.extend(cls.__subclasses__())
+        if is_dataclass(cls):
+            found.append(cls)
+    return found[::-1]
+
+
+CLASSES = schema_classes()
+
+
+def naive_load(value, hint=None):
+    if isinstance(value, list):
+        return [naive_load(item, hint) for item in value]
+    if not isinstance(value, dict):
+        return value
+
+    cls = None
+    for candidate in CLASSES:
+        type_field = candidate.__dataclass_fields__.get('type')
+        if 'type' in value and type_field is not None and type_field.default == value['type']:
+            cls = candidate
+            break
+    if cls is None:
+        cls = next(c for c in typing.get_args(hint) or (hint,) if isinstance(c, type) and is_dataclass(c))
+
+    hints = typing.get_type_hints(cls)
+    kwargs, late = {}, {}
+    for f in fields(cls):
+        if f.name in value:
+            target = kwargs if f.init else late
+            target[f.name] = naive_load(value[f.name], hints.get(f.name))
+    obj = cls(**kwargs)
+    for name, item in late.items():
+        setattr(obj, name, item)
+    return obj
+
+
+def main():
+    payload = build_layout(50).to_api()
+    blocks = json.loads(payload)
+
+    assert BlockKit.from_api(blocks).to_api() == payload
+    naive = BlockKit()
+    naive.blocks.extend(naive_load(blocks))
+    assert naive.to_api() == payload
+
+    naive_us = time_call(lambda: naive_load(blocks), 50)
+    registry_us = time_call(lambda: BlockKit.from_api(blocks), 50)
+    print(f'decode    naive loader:      {naive_us:9.1f} us')
+    print(f'decode    registry:          {registry_us:9.1f} us  ({naive_us / registry_us:.1f}x)')
+
+    def round_trip():
+        return BlockKit.from_json(payload).to_api()
+
+    per_second = 1e6 / time_call(round_trip, 50)
+    print(f'round trip from_json+to_api: {per_second:9.0f} layouts/s (50 blocks each)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""Benchmark: `diff()`/`is_unchanged()` vs. serializing the layout again.
+
+Usage:
+    python benchmarks/bench_diff.py
+"""
+
+from layouts import build_layout, clear_caches, time_call
+
+from slack_tools.blocks.text import PlainText
+from slack_tools.serialization.diff import diff, is_unchanged
+
+
+def main():
+    previous = build_layout(50).cache()
+    previous.to_api()
+
+    # Long-lived layout, edited in place between updates.
+    layout = build_layout(50).cache()
+    layout.to_api()
+    sent = layout.to_dict()
+    button = layout.blocks[3].elements[0]
+
+    def edit_and_diff():
+        button.text = PlainText('Approved')
+        return diff(sent, layout)
+
+    assert len(edit_and_diff()) == 1
+    print(f'one edit:      diff          {time_call(edit_and_diff, 200):9.2f} us')
+    print(f'               is_unchanged  {time_call(lambda: is_unchanged(layout, layout), 20000):9.2f} us')
+
+    # Layout rebuilt from scratch with the same content.
+    rebuilt = build_layout(50).cache()
+    rebuilt.to_dict()
+    assert diff(previous, rebuilt) == []
+    print(f'rebuilt:       diff          {time_call(lambda: diff(previous, rebuilt), 200):9.2f} us')
+    print(f'               is_unchanged  {time_call(lambda: is_unchanged(previous, rebuilt), 200):9.2f} us')
+    print(f'               dataclass ==  {time_call(lambda: previous.blocks == rebuilt.blocks, 200):9.2f} us')
+
+    walk = time_call(lambda: clear_caches(rebuilt), 200)
+    cold = time_call(lambda: clear_caches(rebuilt) or rebuilt.to_api(), 200) - walk
+    print(f'reference:     to_api cold   {cold:9.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Benchmark: `to_api()` with static blocks frozen vs. re-serialized every time.
+
+Usage:
+    python benchmarks/bench_frozen.py
+"""
+
+from layouts import md, time_call
+
+from slack_tools.block_kit import BlockKit
+
+
+def build(bk: BlockKit, static: list, user: int) -> BlockKit:
+    header, actions, divider = static
+    blocks = []
+    for i in range(10):
+        blocks.extend([header, bk.section(md.bold(f'Hi user {user}, item {i}')), actions, divider])
+    return bk[tuple(blocks)]
+
+
+def static_blocks(bk: BlockKit) -> list:
+    return [
+        bk.header('Daily digest'),
+        bk.actions[tuple(bk.button(f'Action {i}', action_id=f'action-{i}') for i in range(5))],
+        bk.divider(),
+    ]
+
+
+def main():
+    bk = BlockKit()
+    dynamic = build(BlockKit(), static_blocks(bk), user=1)
+    frozen = build(BlockKit(), [block.freeze() for block in static_blocks(bk)], user=1)
+    assert dynamic.to_api() == frozen.to_api()
+
+    plain = time_call(dynamic.to_api, number=500)
+    spliced = time_call(frozen.to_api, number=500)
+    print(f'to_api  unfrozen: {plain:8.1f} us')
+    print(f'to_api  frozen:   {spliced:8.1f} us  ({plain / spliced:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
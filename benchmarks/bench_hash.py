@@ -0,0 +1,42 @@
+"""Benchmark: incremental `content_hash()` vs. hashing the whole canonical JSON again.
+
+Usage:
+    python benchmarks/bench_hash.py
+"""
+
+import hashlib
+
+from layouts import build_layout, clear_caches, time_call
+
+from slack_tools.blocks.text import PlainText
+from slack_tools.serialization.canonical import canonical_json
+
+
+def main():
+    layout = build_layout(50).cache()
+    button = layout.blocks[3].elements[0]
+    labels = iter(range(10**9))
+
+    def edit():
+        button.text = PlainText(f'Approve {next(labels)}')
+
+    def edit_and_hash():
+        edit()
+        return layout.content_hash()
+
+    def edit_and_rehash():
+        edit()
+        return hashlib.sha256(canonical_json(layout.to_dict())).hexdigest()
+
+    walk = time_call(lambda: clear_caches(layout), 200)
+    cold = time_call(lambda: clear_caches(layout) or layout.content_hash(), 200) - walk
+    layout.content_hash()
+
+    print(f'content_hash  cold:        {cold:9.2f} us')
+    print(f'content_hash  one edit:    {time_call(edit_and_hash, 200):9.2f} us')
+    print(f'content_hash  unchanged:   {time_call(layout.content_hash, 20000):9.2f} us')
+    print(f'full rehash   one edit:    {time_call(edit_and_rehash, 200):9.2f} us')
+
+
+if __name__ == '__main__':
+    main()
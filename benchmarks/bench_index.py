@@ -0,0 +1,48 @@
+"""Benchmark: finding an element by `action_id` with the layout index vs. scanning the layout.
+
+Usage:
+    python benchmarks/bench_index.py
+"""
+
+from dataclasses import fields, is_dataclass
+
+from layouts import build_layout, time_call
+
+
+def scan(node, action_id):
+    """Depth-first search, as handlers had to do before the index."""
+    if isinstance(node, (list, tuple)):
+        for item in node:
+            found = scan(item, action_id)
+            if found is not None:
+                return found
+        return None
+    if not is_dataclass(node):
+        return None
+    if getattr(node, 'action_id', None) == action_id:
+        return node
+    for f in fields(node):
+        if not f.name.startswith('_'):
+            found = scan(getattr(node, f.name), action_id)
+            if found is not None:
+                return found
+    return None
+
+
+def main():
+    for n_blocks in (10, 50, 100):
+        kit = build_layout(n_blocks)
+        last = f'reject-{n_blocks // 5 - 1}'
+        assert kit.index.find(action_id=last) is scan(kit.blocks, last)
+
+        indexed = time_call(lambda: kit.index.find(action_id=last, block_id=None), 20000)
+        scanned = time_call(lambda: scan(kit.blocks, last), 200)
+        built = time_call(lambda: build_layout(n_blocks), 50)
+        print(
+            f'{n_blocks:3d} blocks  index.find: {indexed:6.2f} us  scan: {scanned:8.1f} us  '
+            f'({scanned / indexed:.0f}x)  build_layout: {built:7.1f} us'
+        )
+
+
+if __name__ == '__main__':
+    main()
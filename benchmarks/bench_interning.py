@@ -0,0 +1,97 @@
+"""Benchmark: memory of a 10k-layout batch with and without interning.
+
+Each layout is personalised (header and summary text), but shares its buttons,
+confirmation dialog, select options and actions block with every other one.
+
+Usage:
+    python benchmarks/bench_interning.py
+"""
+
+import gc
+import time
+import tracemalloc
+
+from slack_tools.block_kit import BlockKit
+from slack_tools.blocks.blocks import ActionsBlock, HeaderBlock, SectionBlock
+from slack_tools.blocks.interactive import Button
+from slack_tools.blocks.interning import interning
+from slack_tools.blocks.menus import StaticSelectMenu
+from slack_tools.blocks.objects import Option
+from slack_tools.blocks.schemas.objects import ConfirmationDialogSchema
+from slack_tools.blocks.text import PlainText
+
+N_LAYOUTS = 10_000
+
+
+def build_layout(user: int) -> BlockKit:
+    confirm = ConfirmationDialogSchema(
+        title=PlainText.create('Are you sure?'),
+        text=PlainText.create('This cannot be undone.'),
+        confirm=PlainText.create('Yes'),
+        deny=PlainText.create('No'),
+    )
+    priority = StaticSelectMenu(
+        options=[Option.create(f'P{level}', value=str(level)) for level in range(5)],
+        confirm=confirm,
+        action_id='priority',
+    )
+    bk = BlockKit()
+    return bk[
+        HeaderBlock.create(f'Daily report for user {user}'),
+        SectionBlock.create(f'You have {user % 7} open tickets.'),
+        ActionsBlock(
+            elements=[
+                Button.create('Approve', action_id='approve', style='primary'),
+                Button.create('Reject', action_id='reject', style='danger'),
+                priority,
+            ]
+        ),
+        SectionBlock.create('Escalate?', accessory=Button.create('Escalate', action_id='escalate')),
+    ]
+
+
+def measure(interned: bool, send: bool) -> float:
+    """Return the memory (MiB) retained by the blocks of a batch of layouts."""
+    gc.collect()
+    tracemalloc.start()
+    with interning(interned):
+        layouts = [build_layout(user) for user in range(N_LAYOUTS)]
+    if send:
+        for layout in layouts:
+            layout.to_api()
+    batch = [layout.blocks for layout in layouts]
+    del layouts
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    assert len(batch) == N_LAYOUTS
+    return current / 2**20
+
+
+def build_and_send_us(interned: bool, number: int = 2000) -> float:
+    layouts = []
+    start = time.perf_counter()
+    with interning(interned):
+        for user in range(number):
+            layouts.append(build_layout(user))
+            layouts[-1].to_api()
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main():
+    expected = build_layout(1).to_api()
+    with interning():
+        assert build_layout(1).to_api() == expected
+
+    print(f'{N_LAYOUTS} layouts, memory retained by their blocks (tracemalloc)')
+    for send, label in ((False, 'built'), (True, 'after to_api()')):
+        plain = measure(interned=False, send=send)
+        interned = measure(interned=True, send=send)
+        print(f'  {label:<15} plain {plain:6.1f} MiB   interned {interned:6.1f} MiB  ({1 - interned / plain:.0%} less)')
+
+    plain_us, interned_us = build_and_send_us(False), build_and_send_us(True)
+    print(f'build + to_api per layout: plain {plain_us:.0f} us, interned {interned_us:.0f} us')
+
+
+if __name__ == '__main__':
+    main()
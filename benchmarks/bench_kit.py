@@ -0,0 +1,41 @@
+"""Benchmark: creating a `BlockKit`, with builders created on first use.
+
+`eager` touches every collector prototype right after creating the kit, which is
+what every `BlockKit()` used to cost.
+
+Usage:
+    python benchmarks/bench_kit.py
+"""
+
+from layouts import time_call
+
+from slack_tools.block_kit import BlockKit, _Prototype
+
+PROTOTYPES = [name for name, value in vars(BlockKit).items() if isinstance(value, _Prototype)]
+
+
+def eager() -> BlockKit:
+    kit = BlockKit()
+    for name in PROTOTYPES:
+        getattr(kit, name)
+    return kit
+
+
+def per_request() -> BlockKit:
+    bk = BlockKit()
+    return bk[
+        bk.section('Deploy finished'),
+        bk.actions[bk.button('Approve', action_id='approve'), bk.button('Reject', action_id='reject')],
+    ]
+
+
+def main():
+    created = time_call(BlockKit, 20000)
+    prototypes = time_call(eager, 2000)
+    print(f'BlockKit()               : {created:8.2f} us')
+    print(f'BlockKit() + {len(PROTOTYPES)} prototypes: {prototypes:8.2f} us  ({prototypes / created:.0f}x)')
+    print(f'per-request layout       : {time_call(per_request, 2000):8.2f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: checking platform limits per append, incrementally vs. by re-serializing, and `split()`.
+
+Usage:
+    python benchmarks/bench_limits.py
+"""
+
+from layouts import build_layout, time_call
+
+from slack_tools.block_kit import BlockKit
+
+BLOCKS = build_layout(100).blocks
+
+
+def append_untracked():
+    kit = BlockKit()
+    for block in BLOCKS:
+        kit[block]
+
+
+def append_tracked():
+    kit = BlockKit().track_limits('modal', warn_at=None)
+    for block in BLOCKS:
+        kit[block]
+    return kit
+
+
+def append_reserialized():
+    kit = BlockKit()
+    for block in BLOCKS:
+        kit[block]
+        assert len(kit.blocks) <= 100 and len(kit.to_api()) > 0
+
+
+def main():
+    kit = append_tracked()
+    assert kit.budget.bytes == len(kit.to_api())
+
+    untracked_us = time_call(append_untracked, 50)
+    tracked_us = time_call(append_tracked, 50)
+    reserialized_us = time_call(append_reserialized, 20)
+    print(f'append 100 blocks, no checks:       {untracked_us:9.1f} us')
+    print(
+        f'append 100 blocks, LayoutBudget:    {tracked_us:9.1f} us  (+{(tracked_us - untracked_us) / 100:.2f} us/block)'
+    )
+    print(f'append 100 blocks, to_api() each:   {reserialized_us:9.1f} us')
+
+    for count in (250, 1000):
+        layout = build_layout(count)
+        split_us = time_call(lambda: list(layout.split('message')), 20)
+        print(f'split {count:4d} blocks into messages:  {split_us:9.1f} us  ({split_us / count:.2f} us/block)')
+
+
+if __name__ == '__main__':
+    main()
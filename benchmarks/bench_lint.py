@@ -0,0 +1,37 @@
+"""Benchmark: linting a corpus of stored layouts, in this process vs. a process pool.
+
+Usage:
+    python benchmarks/bench_lint.py [N_FILES]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from layouts import build_layout
+
+from slack_tools.lint import lint_paths
+
+
+def write_corpus(directory: Path, count: int) -> None:
+    layouts = [build_layout(n).to_json() for n in (10, 25, 50)]
+    for i in range(count):
+        (directory / f'{i:05d}.json').write_text(layouts[i % len(layouts)])
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    with tempfile.TemporaryDirectory() as tmp:
+        write_corpus(Path(tmp), count)
+        for jobs in dict.fromkeys((1, os.cpu_count() or 1)):
+            start = time.perf_counter()
+            reports = lint_paths([tmp], jobs=jobs)
+            seconds = time.perf_counter() - start
+            assert len(reports) == count and all(report.ok for report in reports)
+            print(f'lint {count} files, {jobs:2d} job(s): {seconds:6.2f} s  ({seconds / count * 1e3:.2f} ms/file)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark: a 100-option static menu built from `Option`s vs. from an `OptionSet`.
+
+`OptionSet` is built and serialized once, and shared by every menu using it;
+`fresh set` includes building and serializing the set for each menu.
+
+Usage:
+    python benchmarks/bench_option_set.py
+"""
+
+import tracemalloc
+
+from layouts import time_call
+
+from slack_tools.blocks.menus import StaticSelectMenu
+from slack_tools.blocks.objects import Option, OptionSet
+
+RECORDS = [(f'Team member {i}', f'U{i:08d}') for i in range(100)]
+SHARED = OptionSet.from_records(RECORDS)
+
+
+def options() -> dict:
+    return StaticSelectMenu(
+        options=[Option.create(text, value=value) for text, value in RECORDS], action_id='owner'
+    ).to_dict()
+
+
+def fresh_set() -> dict:
+    return StaticSelectMenu(options=OptionSet.from_records(RECORDS), action_id='owner').to_dict()
+
+
+def shared_set() -> dict:
+    return StaticSelectMenu(options=SHARED, action_id='owner').to_dict()
+
+
+def allocated(fn) -> int:
+    """Bytes still held by the options `fn` builds, once they've been serialized."""
+    tracemalloc.start()
+    built = fn()
+    StaticSelectMenu(options=built, action_id='owner').to_dict()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del built
+    return size
+
+
+def main():
+    assert options() == fresh_set() == shared_set()
+    baseline = time_call(options, 200)
+    for name, fn in (('Option list', options), ('fresh set', fresh_set), ('shared set', shared_set)):
+        took = time_call(fn, 200)
+        print(f'{name:12s}: {took:8.1f} us  ({baseline / took:5.1f}x)')
+
+    as_options = allocated(lambda: [Option.create(text, value=value) for text, value in RECORDS])
+    as_set = allocated(lambda: OptionSet.from_records(RECORDS))
+    print(f'held after serializing: Option list {as_options / 1024:.1f} KiB, OptionSet {as_set / 1024:.1f} KiB')
+
+
+if __name__ == '__main__':
+    main()
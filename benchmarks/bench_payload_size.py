@@ -0,0 +1,62 @@
+"""Report: bytes saved by minimal payloads (`to_api(minimal=True)`) on the examples.
+
+Usage:
+    python benchmarks/bench_payload_size.py
+"""
+
+import contextlib
+import io
+import runpy
+from pathlib import Path
+
+from layouts import build_layout, time_call
+
+from slack_tools.blocks.interactive import NumberInput, PlainTextInput
+from slack_tools.blocks.menus import ExternalSelectMenu
+from slack_tools.blocks.schemas.blocks import InputBlockSchema
+from slack_tools.blocks.surfaces.modals import ModalSurface
+from slack_tools.blocks.text import PlainText
+
+EXAMPLES = Path(__file__).parent.parent / 'examples'
+
+
+def example_layout(name: str):
+    """Run an example script quietly and return its `layout`."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return runpy.run_path(str(EXAMPLES / name))['layout']
+
+
+def build_modal(n_inputs: int = 20) -> ModalSurface:
+    """Build a form modal with a mix of text, number and external select inputs."""
+    blocks = []
+    for i in range(n_inputs):
+        element = [
+            PlainTextInput.create(action_id=f'name-{i}'),
+            NumberInput.create(action_id=f'count-{i}'),
+            ExternalSelectMenu(options=[], action_id=f'owner-{i}'),
+        ][i % 3]
+        blocks.append(InputBlockSchema(label=PlainText.create(f'Field {i}'), element=element))
+    return ModalSurface(title=PlainText.create('Request'), submit=PlainText.create('Send'), blocks=blocks)
+
+
+def main():
+    modal = build_modal()
+    payloads = {
+        'basic_example': example_layout('basic_example.py').to_api,
+        'actions_example': example_layout('actions_example.py').to_api,
+        'layout (50 blocks)': build_layout(50).to_api,
+        'modal (20 inputs)': lambda minimal=False: modal.to_json(minimal=minimal),
+    }
+
+    print(f'{"payload":<22}{"default":>10}{"minimal":>10}{"saved":>16}')
+    for name, to_api in payloads.items():
+        full = len(to_api().encode())
+        minimal = len(to_api(minimal=True).encode())
+        print(f'{name:<22}{full:>10}{minimal:>10}{full - minimal:>9} ({1 - minimal / full:.0%})')
+
+    layout = build_layout(50)
+    print(f'\nto_api(minimal=True) 50 blocks: {time_call(lambda: layout.to_api(minimal=True), 200):.1f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""Benchmark: compiled serializers vs. `asdict` + `remove_none`.
+
+The layout isn't cached (see `cache()`), so every call serializes it from
+scratch, as a worker building a fresh payload per message does.
+
+Usage:
+    python benchmarks/bench_serialization.py
+"""
+
+import json
+from dataclasses import asdict
+
+from layouts import build_layout, time_call
+
+from slack_tools.utils.dataclass_utils import remove_none
+
+
+def main():
+    layout = build_layout(50)
+    assert remove_none(asdict(layout)) == layout.to_dict()
+
+    legacy = time_call(lambda: remove_none(asdict(layout)), number=200)
+    compiled = time_call(layout.to_dict, number=200)
+    legacy_api = time_call(lambda: json.dumps(remove_none(asdict(layout))['blocks']), number=200)
+    compiled_api = time_call(layout.to_api, number=200)
+
+    print(f'to_dict  asdict+remove_none: {legacy:9.1f} us')
+    print(f'to_dict  compiled:           {compiled:9.1f} us  ({legacy / compiled:.1f}x)')
+    print(f'to_api   asdict+remove_none: {legacy_api:9.1f} us')
+    print(f'to_api   compiled:           {compiled_api:9.1f} us  ({legacy_api / compiled_api:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
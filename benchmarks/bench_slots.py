@@ -0,0 +1,66 @@
+"""Benchmark: memory and attribute access of schema instances.
+
+Measures, with `tracemalloc`, the memory held by many small objects
+(`PlainText`, `Option`, `RichText`) as built and once serialized inside a
+parent (which fills in their caches), and the time to read a field and the
+cache state every serialization and assignment checks.
+
+Run it on two revisions to compare slotted and `__dict__`-backed classes.
+
+Usage:
+    python benchmarks/bench_slots.py
+"""
+
+import gc
+import timeit
+import tracemalloc
+
+from layouts import time_call
+
+from slack_tools.blocks.blocks import ContextBlock, RichSection
+from slack_tools.blocks.menus import StaticSelectMenu
+from slack_tools.blocks.objects import Option
+from slack_tools.blocks.rich_text import RichText
+from slack_tools.blocks.text import PlainText
+from slack_tools.blocks.validation import validation
+
+COUNT = 20_000
+"""Objects per measurement, built 10 to a parent."""
+
+PARENTS = {
+    'PlainText': lambda i: ContextBlock(elements=[PlainText.create(f'label {i}.{j}') for j in range(10)]),
+    'Option': lambda i: StaticSelectMenu(
+        options=[Option.create(f'label {i}.{j}', value=f'{i}.{j}') for j in range(10)]
+    ),
+    'RichText': lambda i: RichSection(elements=[RichText.create(f'word {i}.{j}') for j in range(10)]),
+}
+
+
+def measure_memory(build) -> tuple[float, float]:
+    """Return the bytes per object held by `COUNT` objects, as built and after serializing their parents."""
+    gc.collect()
+    tracemalloc.start()
+    with validation('off'):
+        parents = [build(i) for i in range(COUNT // 10)]
+    built, _ = tracemalloc.get_traced_memory()
+    for parent in parents:
+        parent.to_dict()
+    serialized, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return built / COUNT, serialized / COUNT
+
+
+def main():
+    for name, build in PARENTS.items():
+        built, serialized = measure_memory(build)
+        print(f'{name:10s} built: {built:6.1f} B/object  serialized: {serialized:6.1f} B/object')
+
+    text = PlainText.create('label')
+    for name in ('text', '_wire_cache', '_frozen_json'):
+        seconds = min(timeit.repeat(f'text.{name}', globals={'text': text}, number=1_000_000, repeat=5))
+        print(f'text.{name:13s} {seconds * 1000:5.1f} ns/read')
+    print(f'PlainText.create  {time_call(lambda: PlainText.create("label"), 50_000) * 1000:5.0f} ns')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+"""Benchmark: peak memory of `to_api()` vs. `write_api()` for a 100-block layout.
+
+Usage:
+    python benchmarks/bench_stream.py
+"""
+
+import io
+import tracemalloc
+
+from layouts import build_layout, time_call
+
+
+class NullWriter(io.RawIOBase):
+    """Binary sink that discards everything, like a socket buffer that's drained."""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return len(data)
+
+
+def peak_kib(fn) -> float:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 1024
+
+
+def main():
+    layout = build_layout(100)
+    sink = NullWriter()
+
+    whole = peak_kib(lambda: sink.write(layout.to_api().encode()))
+    streamed = peak_kib(lambda: layout.write_api(sink, chunk_size=4096))
+
+    print(f'payload size:            {len(layout.to_api()) / 1024:8.1f} KiB')
+    print(f'to_api().encode() peak:  {whole:8.1f} KiB  {time_call(lambda: layout.to_api().encode(), 100):8.1f} us')
+    print(f'write_api() peak:        {streamed:8.1f} KiB  {time_call(lambda: layout.write_api(sink), 100):8.1f} us')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Benchmark: whole-tree validation of layouts sharing frozen templates, with and without validated marks.
+
+Each layout has a personalised header and summary, plus a frozen footer and a
+frozen 50-option select menu. Shared templates are marked as validated once and
+skipped by `validate_tree()` from then on; as a baseline, each layout gets its
+own unmarked copy (frozen in `off` mode), which is walked in full, as every
+layout was before.
+
+Usage:
+    python benchmarks/bench_validation_cache.py
+"""
+
+import time
+
+from slack_tools.block_kit import BlockKit
+from slack_tools.blocks.blocks import ActionsBlock, ContextBlock, HeaderBlock, SectionBlock
+from slack_tools.blocks.menus import StaticSelectMenu
+from slack_tools.blocks.objects import Option
+from slack_tools.blocks.schemas.objects import ConfirmationDialogSchema
+from slack_tools.blocks.text import MarkdownText, PlainText
+from slack_tools.blocks.validation import validate_tree, validation
+
+N_LAYOUTS = 100
+
+
+def footer() -> ContextBlock:
+    return ContextBlock(
+        elements=[MarkdownText.create(f'*Team {i}* · <https://example.com/{i}|runbook>') for i in range(5)]
+    ).freeze()
+
+
+def picker() -> ActionsBlock:
+    return ActionsBlock(
+        elements=[
+            StaticSelectMenu(
+                options=[Option.create(f'Assignee {i}', value=str(i)) for i in range(50)],
+                confirm=ConfirmationDialogSchema(
+                    title=PlainText.create('Reassign?'),
+                    text=PlainText.create('The current assignee is notified.'),
+                    confirm=PlainText.create('Yes'),
+                    deny=PlainText.create('No'),
+                ),
+                action_id='assign',
+            )
+        ]
+    ).freeze()
+
+
+def build_layouts(shared: bool) -> list[BlockKit]:
+    templates = (picker(), footer())
+    layouts = []
+    for i in range(N_LAYOUTS):
+        if not shared:
+            with validation('off'):
+                templates = (picker(), footer())
+        layouts.append(
+            BlockKit()[
+                HeaderBlock.create(f'Ticket {i}'),
+                SectionBlock.create(f'Opened by user {i} with priority {i % 5}.'),
+                *templates,
+            ]
+        )
+    return layouts
+
+
+def time_validation(shared: bool) -> float:
+    """Return the best time (us) to validate a fresh batch of layouts."""
+    best = float('inf')
+    for _ in range(5):
+        layouts = build_layouts(shared)
+        start = time.perf_counter()
+        for layout in layouts:
+            validate_tree(layout)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def main():
+    unshared_us = time_validation(shared=False)
+    shared_us = time_validation(shared=True)
+    print(f'validate {N_LAYOUTS} layouts, each template walked: {unshared_us:9.1f} us')
+    print(f'validate {N_LAYOUTS} layouts, templates skipped:    {shared_us:9.1f} us  ({unshared_us / shared_us:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
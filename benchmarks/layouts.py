@@ -0,0 +1,51 @@
+"""Shared layouts for the benchmark scripts."""
+
+from slack_tools.block_kit import BlockKit
+from slack_tools.mrkdwn_kit import MarkdownKit
+
+md = MarkdownKit()
+
+
+def build_layout(n_blocks: int = 50) -> BlockKit:
+    """Build a mixed layout with roughly `n_blocks` top-level blocks."""
+    bk = BlockKit()
+    blocks = []
+    for i in range(n_blocks // 5):
+        blocks.extend(
+            [
+                bk.header(f'Report {i}'),
+                bk.section(md.bold(f'Build #{i} finished'), accessory=bk.button('Open', action_id=f'open-{i}')),
+                bk.section(f'Plain summary line for build {i}'),
+                bk.actions[
+                    bk.button('Approve', action_id=f'approve-{i}', style='primary'),
+                    bk.button('Reject', action_id=f'reject-{i}', style='danger'),
+                ],
+                bk.divider(),
+            ]
+        )
+    return bk[tuple(blocks)]
+
+
+def clear_caches(value) -> None:
+    """Drop every cached serialization in the tree so the next call runs cold."""
+    if isinstance(value, (list, tuple)):
+        for item in value:
+            clear_caches(item)
+        return
+    if getattr(value, '_wire_cache', None) is not None or getattr(value, '_api_cache', None) is not None:
+        object.__setattr__(value, '_wire_cache', None)
+        object.__setattr__(value, '_canonical_cache', None)
+        object.__setattr__(value, '_hash_cache', None)
+        if hasattr(value, '_api_cache'):
+            object.__setattr__(value, '_api_cache', None)
+            object.__setattr__(value, '_api_source', None)
+    for name in getattr(value, '__dataclass_fields__', ()):
+        if not name.startswith('_'):
+            clear_caches(getattr(value, name))
+
+
+def time_call(fn, number: int) -> float:
+    """Return the mean wall time of `fn()` in microseconds."""
+    import timeit
+
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
@@ -0,0 +1,22 @@
+"""Command line: `python -m slack_tools COMMAND ...`."""
+
+import argparse
+import sys
+
+from slack_tools import lint
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m slack_tools')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    lint_parser = commands.add_parser('lint', help='validate stored Block Kit JSON files')
+    lint.add_arguments(lint_parser)
+    lint_parser.set_defaults(run=lint.run)
+
+    args = parser.parse_args(argv)
+    return args.run(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
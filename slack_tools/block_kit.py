@@ -1,6 +1,6 @@
 import json
-from dataclasses import asdict, dataclass, is_dataclass
-from typing import Callable, Self
+from dataclasses import dataclass, is_dataclass
+from typing import IO, Any, Callable, Iterable, Iterator, Self
 
 from slack_tools.actions.handler import ActionHandler
 from slack_tools.blocks.blocks import (
@@ -17,6 +17,7 @@ from slack_tools.blocks.blocks import (
     RichTextList,
     SectionBlock,
 )
+from slack_tools.blocks.index import LayoutIndex
 from slack_tools.blocks.interactive import (
     Button,
     Checkboxes,
@@ -29,6 +30,8 @@ from slack_tools.blocks.interactive import (
     TimePicker,
     URLInput,
 )
+from slack_tools.blocks.interning import intern, interning_enabled
+from slack_tools.blocks.limits import SURFACE_LIMITS, LayoutBudget, SurfaceLimits, split_blocks
 from slack_tools.blocks.menus import (
     ChannelMultiSelectMenu,
     ChannelSelectMenu,
@@ -43,7 +46,7 @@ from slack_tools.blocks.menus import (
     UserSelectMenu,
 )
 from slack_tools.blocks.mixins.preview import BlockKitPreviewMixin
-from slack_tools.blocks.objects import Option
+from slack_tools.blocks.objects import Option, OptionSet
 from slack_tools.blocks.rich_text import (
     RichBroadcast,
     RichChannel,
@@ -51,133 +54,404 @@ from slack_tools.blocks.rich_text import (
     RichDate,
     RichEmoji,
     RichLink,
-    RichText,
     RichUser,
     RichUserGroup,
 )
 from slack_tools.blocks.text import MarkdownText, PlainText
-from slack_tools.utils.dataclass_utils import remove_none
+from slack_tools.blocks.validation import ValidationMode, validate_tree, validation_mode
+from slack_tools.serialization import binary
+from slack_tools.serialization.canonical import canonical_json, content_hash, to_canonical_bytes
+from slack_tools.serialization.decoder import decode
+from slack_tools.serialization.encoder import (
+    get_minimal_serializer,
+    get_serializer,
+    serialize,
+    serialize_minimal,
+)
+from slack_tools.serialization.stream import (
+    COMPACT_SEPARATORS,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_SEPARATORS,
+    iter_json_chunks,
+    write_json,
+)
 
 
 class BlockKitActions:
     action_handler: ActionHandler
 
 
+class _Prototype:
+    """An empty builder (e.g. `bk.actions`), built on first use and then kept on the kit.
+
+    Each kit gets its own, so changing one never affects another kit.
+    """
+
+    def __init__(self, cls: type, collect_field: str | None = None):
+        self.cls = cls
+        self.collect_field = collect_field
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, kit: object | None, owner: type | None = None) -> Any:
+        if kit is None:
+            return self
+        # Stored in the instance `__dict__`, which takes precedence over this (non-data) descriptor from then on.
+        value = kit.__dict__[self.name] = self.cls(**{self.collect_field: []}) if self.collect_field else self.cls()
+        return value
+
+
 @dataclass
 class BlockKit(BlockKitActions, BlockKitPreviewMixin):
-    """BlockKit Kit."""
+    """BlockKit Kit.
+
+    After `cache()`, serialized forms are kept until a block is added or any
+    nested block changes (see `SerializableMixin.cache()`). After replacing
+    `blocks` or changing it in place, call `mark_dirty()`.
+    """
 
     blocks: list[AnyBlock]
 
+    _wire_cache = None
+    _cached = False
+    _linked = False
+    _parent_refs = None
+    _frozen_json = None
+    _api_cache = None
+    _api_source = None
+    _canonical_cache = None
+    _hash_cache = None
+    _deferred_validation = False
+    _index = None
+    _budget: LayoutBudget | None = None
+
+    # Factories and collector prototypes are class attributes, so creating a kit
+    # (one per request, or per chunk in `split()`) only sets up its blocks and handler.
+
+    # Objects
+    option = Option.create
+    option_set = OptionSet.from_records
+    image = Image.create
+
+    # Elements
+    plain_text = PlainText.create
+    mrkdwn_text = MarkdownText.create
+
+    # Rich Elements
+    rich_broadcast = RichBroadcast.create
+    rich_color = RichColor.create
+    rich_channel = RichChannel.create
+    rich_date = RichDate.create
+    rich_emoji = RichEmoji.create
+    rich_link = RichLink.create
+    rich_user = RichUser.create
+    rich_user_group = RichUserGroup.create
+
+    # Interactive
+    button = Button.create
+    checkboxes = _Prototype(Checkboxes, 'options')
+
+    # Inputs
+    email_input = EmailInput.create
+    plain_text_input = PlainTextInput.create
+    url_input = URLInput.create
+    number_input = NumberInput.create
+
+    # Selects
+    overflow_menu = _Prototype(OverflowMenu, 'options')
+    radio_buttons = _Prototype(RadioButtons, 'options')
+    static_select = _Prototype(StaticSelectMenu, 'options')
+    static_multi_select = _Prototype(StaticMultiSelectMenu, 'options')
+    external_select = _Prototype(ExternalSelectMenu, 'options')
+    external_multi_select = _Prototype(ExternalMultiSelectMenu)
+    user_select = _Prototype(UserSelectMenu)
+    user_multi_select = _Prototype(UserMultiSelectMenu)
+    conversation_select = _Prototype(ConversationSelectMenu)
+    conversation_multi_select = _Prototype(ConversationMultiSelectMenu)
+    channel_select = _Prototype(ChannelSelectMenu)
+    channel_multi_select = _Prototype(ChannelMultiSelectMenu)
+
+    # Date Pickers
+    date_picker = DatePicker.create
+    date_time_picker = DateTimePicker.create
+    time_picker = TimePicker.create
+
+    # Blocks
+    divider = DividerBlock.create
+    header = HeaderBlock.create
+    section = SectionBlock.create
+    # Collectors
+    actions = _Prototype(ActionsBlock, 'elements')
+    context = _Prototype(ContextBlock, 'elements')
+    rich_section = _Prototype(RichSection, 'elements')
+    rich_text_section = _Prototype(RichSection, 'elements')
+    rich_text_list = _Prototype(RichTextList, 'elements')
+    rich_text_preformatted = _Prototype(RichPreformatted, 'elements')
+    rich_text_quote = _Prototype(RichQuote, 'elements')
+    rich_text = _Prototype(RichTextBlock, 'elements')
+
     def __init__(self, handler: ActionHandler | None = None):
         self.blocks = []
-
         self.action_handler = handler if handler else ActionHandler()
 
-        # Objects
-        self.option = Option.create
-        self.image = Image.create
-
-        # Elements
-        self.plain_text = PlainText.create
-        self.mrkdwn_text = MarkdownText.create
-
-        # Rich Elements
-        self.rich_broadcast = RichBroadcast.create
-        self.rich_color = RichColor.create
-        self.rich_channel = RichChannel.create
-        self.rich_date = RichDate.create
-        self.rich_emoji = RichEmoji.create
-        self.rich_link = RichLink.create
-        self.rich_text = RichText.create
-        self.rich_user = RichUser.create
-        self.rich_user_group = RichUserGroup.create
-
-        # Interactive
-        self.button = Button.create
-        self.checkboxes = Checkboxes(options=[])
-
-        # Inputs
-        self.email_input = EmailInput.create
-        self.plain_text_input = PlainTextInput.create
-        self.url_input = URLInput.create
-        self.number_input = NumberInput.create
-
-        # Selects
-        self.overflow_menu = OverflowMenu(options=[])
-        self.radio_buttons = RadioButtons(options=[])
-        self.static_select = StaticSelectMenu(options=[])
-        self.static_multi_select = StaticMultiSelectMenu(options=[])
-        self.external_select = ExternalSelectMenu(options=[])
-        self.external_multi_select = ExternalMultiSelectMenu()
-        self.user_select = UserSelectMenu()
-        self.user_multi_select = UserMultiSelectMenu()
-        self.conversation_select = ConversationSelectMenu()
-        self.conversation_multi_select = ConversationMultiSelectMenu()
-        self.channel_select = ChannelSelectMenu()
-        self.channel_multi_select = ChannelMultiSelectMenu()
-
-        # Date Pickers
-        self.date_picker = DatePicker.create
-        self.date_time_picker = DateTimePicker.create
-        self.time_picker = TimePicker.create
-
-        # Blocks
-        self.divider = DividerBlock.create
-        self.header = HeaderBlock.create
-        self.section = SectionBlock.create
-        # Collectors
-        self.actions = ActionsBlock(elements=[])
-        self.context = ContextBlock(elements=[])
-        self.rich_section = RichSection(elements=[])
-        self.rich_text_section = RichSection(elements=[])
-        self.rich_text_list = RichTextList(elements=[])
-        self.rich_text_preformatted = RichPreformatted(elements=[])
-        self.rich_text_quote = RichQuote(elements=[])
-        self.rich_text = RichTextBlock(elements=[])
-
     def get_callback_fn(self, action_id: str) -> Callable:
         if not self.action_handler:
             raise ValueError('Action handler not set')
 
         return self.action_handler.get_callback_callable(action_id)
 
-    def __getitem__(self, blocks: AnyBlock | tuple[AnyBlock, ...]) -> Self:
+    def __getitem__(self, blocks: AnyBlock | list[AnyBlock] | tuple[AnyBlock | list[AnyBlock], ...]) -> Self:
         """Add blocks to the kit."""
-        if not isinstance(blocks, tuple):
-            blocks = (blocks,)
-
-        for block in blocks:
-            if hasattr(block, 'get_action') and callable(getattr(block, 'get_action')):
-                callback = block.get_action()
-                if callback:
-                    self.action_handler.add_callback(
-                        callback.action_id,
-                        callback.callback,
-                    )
-
-        self.blocks.extend(blocks)
+        items = blocks if isinstance(blocks, tuple) else (blocks,)
+        # Lists are spliced in, e.g. the sections from `section(text, overflow='split')`.
+        added: tuple[AnyBlock, ...] = tuple(
+            item for block in items for item in (block if isinstance(block, list) else (block,))
+        )
+
+        if self._budget is not None:
+            self._budget.add(added)
+
+        # Before interning, which may swap a `Button` for an equal one with another callback.
+        for callback in self.index.add(added):
+            self.action_handler.add_callback(callback.action_id, callback.callback)
+
+        if interning_enabled():
+            added = intern(added)
+
+        if validation_mode() is ValidationMode.DEFERRED:
+            self._deferred_validation = True
+
+        if self._cached:
+            for block in added:
+                if block is not None:
+                    block.cache()
+
+        self.blocks.extend(added)
+        self._invalidate()
         return self
 
-    def to_dict(self) -> dict:
-        """Return dictionary representation."""
+    @property
+    def budget(self) -> LayoutBudget | None:
+        """Platform-limits tracker, set by `track_limits()`."""
+        return self._budget
+
+    @property
+    def index(self) -> LayoutIndex:
+        """Where each `block_id` and `action_id` in the kit is, kept up to date as blocks are added.
+
+        Blocks added to `blocks` directly are indexed, and their callbacks
+        registered, the next time the index is used.
+        """
+        index = self._index
+        if index is None or index.blocks is not self.blocks:
+            index = self._index = LayoutIndex(self.blocks)
+        for callback in index.sync():
+            self.action_handler.add_callback(callback.action_id, callback.callback)
+        return index
+
+    def track_limits(self, surface: str = 'message', **kwargs) -> Self:
+        """Check Slack's platform limits for `surface` as blocks are added.
+
+        Blocks already in the kit are counted once; after that each `kit[...]`
+        only measures the new blocks. Keyword arguments go to `LayoutBudget`.
+
+        Raises:
+            LimitExceededError: From `kit[...]`, if a limit would be crossed.
+        """
+        self._budget = LayoutBudget(surface, **kwargs)
+        self._budget.add(self.blocks)
+        return self
+
+    def split(self, surface: str = 'message', *, limits: SurfaceLimits | None = None) -> Iterator[Self]:
+        """Cut the kit into kits that each fit within `surface`'s platform limits.
+
+        One pass over the blocks; kits are yielded as soon as they're full, so
+        the first message can be sent while the rest are cut. Headers stay with
+        the block after them, and blocks themselves are never cut. The kits
+        share this kit's action handler. See `split_blocks`.
+
+        Raises:
+            LimitExceededError: If a block doesn't fit in a message on its own.
+        """
+        for chunk in split_blocks(self.blocks, limits or SURFACE_LIMITS[surface]):
+            kit = type(self)(self.action_handler)
+            kit.blocks.extend(chunk)
+            yield kit
+
+    def _validate_deferred(self) -> None:
+        """Validate the whole kit if blocks were added in `deferred` validation mode."""
+        if self._deferred_validation:
+            validate_tree(self)
+            self._deferred_validation = False
+
+    def _invalidate(self) -> None:
+        self._wire_cache = None
+        self._api_cache = None
+        self._canonical_cache = None
+        self._hash_cache = None
+
+    def mark_dirty(self) -> Self:
+        """Invalidate the cached serialization after an in-place change."""
+        self._invalidate()
+        if self._cached:
+            self._cache_blocks()
+        return self
+
+    def cache(self) -> Self:
+        """Cache serialized forms between calls, for layouts serialized more than once.
+
+        A second `to_api()` on an unchanged kit then costs almost nothing, and
+        after an edit only the changed path is rebuilt. Blocks added later
+        are cached too. See `SerializableMixin.cache()`.
+        """
+        if not self._cached:
+            self._cached = True
+            self._cache_blocks()
+        return self
+
+    def _cache_blocks(self) -> None:
+        for block in self.blocks:
+            if block is not None:
+                block.cache()
+
+    @classmethod
+    def from_dict(cls, data: dict, handler: ActionHandler | None = None) -> Self:
+        """Build a kit from its dictionary representation (`{'blocks': [...]}`)."""
+        return cls.from_api(data['blocks'], handler)
+
+    @classmethod
+    def from_json(cls, text: str | bytes, handler: ActionHandler | None = None) -> Self:
+        """Build a kit from `to_json()` or `to_api()` output."""
+        data = json.loads(text)
+        if isinstance(data, list):
+            return cls.from_api(data, handler)
+        return cls.from_dict(data, handler)
+
+    @classmethod
+    def from_api(cls, blocks: list[dict], handler: ActionHandler | None = None) -> Self:
+        """Build a kit from a list of block dictionaries, e.g. the `blocks` of a view."""
+        kit = cls(handler)
+        kit.blocks.extend(decode(blocks))
+        return kit
+
+    @classmethod
+    def from_binary(cls, data: bytes, handler: ActionHandler | None = None) -> Self:
+        """Build a kit from `to_binary()` output, without re-running validation."""
+        result = binary.decode_objects(data)
+        kit = cls(handler)
+        kit.blocks.extend(result if isinstance(result, list) else result['blocks'])
+        return kit
+
+    def to_dict(self, minimal: bool = False) -> dict:
+        """Return dictionary representation.
+
+        Args:
+            minimal: Also omit fields left at Slack's default value.
+
+        Raises:
+            BlockValidationError: If blocks added in `deferred` validation mode are invalid.
+        """
+        self._validate_deferred()
         if is_dataclass(self):
-            block_dict = asdict(self)
+            if minimal:
+                return get_minimal_serializer(type(self))(self)
+            return get_serializer(type(self))(self)
         elif isinstance(self, dict):
-            block_dict = self
+            return self
         else:
             raise ValueError(f'Invalid type: {type(self)}')
 
-        return remove_none(block_dict)
-
     def to_json(self, indent: int | None = None) -> str:
         """Return JSON string representation."""
         return json.dumps(self.to_dict(), indent=indent)
 
-    def to_api(self) -> str:
-        """Return JSON string representation for API."""
-        render_blocks = self.to_dict()
-        if 'blocks' in render_blocks:
-            render_blocks = render_blocks['blocks']
+    def to_api(self, minimal: bool = False) -> str:
+        """Return JSON string representation for API.
+
+        Frozen blocks are spliced in from their pre-encoded JSON. On a cached
+        kit (see `cache()`), the result is kept until the layout changes.
+
+        Args:
+            minimal: Omit fields left at Slack's default value and use compact
+                separators. Minimal payloads are not cached.
+
+        Raises:
+            BlockValidationError: If blocks added in `deferred` validation mode are invalid.
+        """
+        self._validate_deferred()
+        if minimal:
+            blocks, separators = self._api_items(minimal=True)
+            return json.dumps(list(blocks), separators=separators)
+        if not self._cached:
+            return '[' + ', '.join(self._iter_block_json()) + ']'
+
+        # The cached `dict` is checked (and counted as a hit) by `to_dict()`; the JSON is kept as long as it is.
+        data = self.to_dict()
+        if self._api_cache is None or self._api_source is not data:
+            self._api_cache = '[' + ', '.join(self._iter_block_json(data['blocks'])) + ']'
+            self._api_source = data
+        return self._api_cache
+
+    def _iter_block_json(self, serialized: list[dict] | None = None) -> Iterator[str]:
+        """Yield JSON for runs of blocks, encoding consecutive unfrozen blocks in one call.
+
+        Args:
+            serialized: The blocks' `to_dict()` forms, if already built.
+        """
+        blocks = [block for block in self.blocks if block is not None]
+        pending: list = []
+        for index, block in enumerate(blocks):
+            frozen = getattr(block, '_frozen_json', None)
+            if frozen is None:
+                pending.append(serialize(block) if serialized is None else serialized[index])
+                continue
+            if pending:
+                yield json.dumps(pending)[1:-1]
+                pending = []
+            yield frozen
+        if pending:
+            yield json.dumps(pending)[1:-1]
+
+    def to_canonical_bytes(self) -> bytes:
+        """Return canonical JSON: sorted keys, compact, UTF-8, without `None` values.
+
+        On a cached kit, built from the cached canonical JSON of each block, so
+        after an edit only the changed block is re-encoded.
+        """
+        data = self.to_dict()
+        if not self._cached:
+            return canonical_json(data)
+        cached = self._canonical_cache
+        if cached is None or cached[0] is not data:
+            blocks = b','.join(to_canonical_bytes(block) for block in self.blocks if block is not None)
+            cached = self._canonical_cache = (data, b'{"blocks":[' + blocks + b']}')
+        return cached[1]
+
+    def content_hash(self) -> str:
+        """Return the SHA-256 of `to_canonical_bytes()`, e.g. to skip unchanged updates."""
+        return content_hash(self)
+
+    def to_binary(self) -> bytes:
+        """Return the compact binary encoding of `to_dict()`, for storing sent layouts."""
+        return binary.encode(self)
+
+    def iter_api_chunks(self, chunk_size: int = DEFAULT_CHUNK_SIZE, minimal: bool = False) -> Iterator[str]:
+        """Yield the `to_api()` JSON in chunks, without building it in memory first."""
+        blocks, separators = self._api_items(minimal)
+        return iter_json_chunks(blocks, separators=separators, chunk_size=chunk_size)
+
+    def write_api(self, fp: IO, chunk_size: int = DEFAULT_CHUNK_SIZE, minimal: bool = False) -> int:
+        """Stream the `to_api()` JSON into a text or binary file-like object.
+
+        Returns:
+            The number of bytes written.
+        """
+        blocks, separators = self._api_items(minimal)
+        return write_json(blocks, fp, separators=separators, chunk_size=chunk_size)
 
-        return json.dumps(render_blocks)
+    def _api_items(self, minimal: bool) -> tuple[Iterable, tuple[str, str]]:
+        self._validate_deferred()
+        if minimal:
+            return (serialize_minimal(block) for block in self.blocks if block is not None), COMPACT_SEPARATORS
+        return self.blocks, DEFAULT_SEPARATORS
@@ -1,4 +1,5 @@
-from typing import Any, Literal, Self, Sequence, TypeAlias
+from dataclasses import fields
+from typing import Any, Literal, Self, Sequence, TypeAlias, overload
 
 from slack_tools.actions.schemas import ActionCallback
 from slack_tools.blocks.interactive import (
@@ -43,8 +44,11 @@ from slack_tools.blocks.schemas.blocks import (
     SectionBlockSchema,
 )
 from slack_tools.blocks.schemas.rich_text import StyleRichTextSchema
+from slack_tools.blocks.schemas.type_defs import Overflow
 from slack_tools.blocks.text import MarkdownText, PlainText
+from slack_tools.blocks.validation import check_assignment
 from slack_tools.mrkdwn.base import MarkdownStr, SyntaxToken
+from slack_tools.mrkdwn.chunking import split_text, truncate_text
 from slack_tools.mrkdwn.syntax import Bold, CodeInline, Italic, Strikethrough
 
 AnyElement = (
@@ -107,13 +111,75 @@ class DividerBlock(DividerBlockSchema):
         return cls()
 
 
+def _max_length(cls: type, name: str) -> int:
+    return next(f.metadata['max_length'] for f in fields(cls) if f.name == name)
+
+
 class HeaderBlock(HeaderBlockSchema):
+    @overload
     @classmethod
-    def create(cls, text: str) -> Self:
+    def create(cls, text: str, /, *, overflow: Literal['error', 'truncate'] = 'error') -> Self: ...
+
+    @overload
+    @classmethod
+    def create(cls, text: str, /, *, overflow: Literal['split']) -> list[Self]: ...
+
+    @overload
+    @classmethod
+    def create(cls, text: str, /, *, overflow: Overflow) -> Self | list[Self]: ...
+
+    @classmethod
+    def create(cls, text: str, /, *, overflow: Overflow = 'error') -> Self | list[Self]:
+        """Create a header block.
+
+        Args:
+            text: The header text.
+            overflow: What to do with text over the 150 character limit: raise
+                (`error`), cut it into several headers (`split`, which returns
+                a list), or cut it short with an ellipsis (`truncate`). Cuts
+                never land inside a mrkdwn token.
+        """
+        if overflow == 'split':
+            return [cls(text=PlainText(text=chunk)) for chunk in split_text(text, _max_length(cls, 'text'))]
+        if overflow == 'truncate':
+            text = truncate_text(text, _max_length(cls, 'text'))
         return cls(text=PlainText(text=text))
 
 
 class SectionBlock(SectionBlockSchema):
+    @overload
+    @classmethod
+    def create(
+        cls,
+        text: str | SyntaxToken,
+        /,
+        *,
+        accessory: Button | None = None,
+        overflow: Literal['error', 'truncate'] = 'error',
+    ) -> Self: ...
+
+    @overload
+    @classmethod
+    def create(
+        cls,
+        text: str | SyntaxToken,
+        /,
+        *,
+        accessory: Button | None = None,
+        overflow: Literal['split'],
+    ) -> list[Self]: ...
+
+    @overload
+    @classmethod
+    def create(
+        cls,
+        text: str | SyntaxToken,
+        /,
+        *,
+        accessory: Button | None = None,
+        overflow: Overflow,
+    ) -> Self | list[Self]: ...
+
     @classmethod
     def create(
         cls,
@@ -121,14 +187,29 @@ class SectionBlock(SectionBlockSchema):
         /,
         *,
         accessory: Button | None = None,  # Image
-    ) -> Self:
-        """Create a section block."""
-        # print(isinstance(text, SyntaxToken))
-        if isinstance(text, MarkdownStr) or isinstance(text, SyntaxToken):
-            text = MarkdownText(text=text)
-        else:
-            text = PlainText(text=text)
-        return cls(text=text, accessory=accessory)
+        overflow: Overflow = 'error',
+    ) -> Self | list[Self]:
+        """Create a section block.
+
+        Args:
+            text: The section text; mrkdwn if it's a `MarkdownStr` or token.
+            accessory: An element shown next to the text.
+            overflow: What to do with text over the 3000 character limit:
+                raise (`error`), cut it into several sections (`split`, which
+                returns a list, with `accessory` on the first), or cut it short
+                with an ellipsis (`truncate`). Cuts never land inside a
+                `Bold`, `Link`, `Mention`, `CodeBlock` or other mrkdwn token.
+        """
+        text_cls = MarkdownText if isinstance(text, MarkdownStr) or isinstance(text, SyntaxToken) else PlainText
+        if overflow == 'split':
+            chunks = split_text(text, _max_length(cls, 'text'))
+            return [
+                cls(text=text_cls(text=chunk), accessory=accessory if index == 0 else None)
+                for index, chunk in enumerate(chunks)
+            ]
+        if overflow == 'truncate':
+            text = truncate_text(text, _max_length(cls, 'text'))
+        return cls(text=text_cls(text=text), accessory=accessory)
 
     def get_action(self) -> ActionCallback | None:
         if self.accessory and isinstance(self.accessory, Button):
@@ -179,10 +260,12 @@ class RichSection(RichSectionSchema, CollectableElementMixin[AnyRichElement]):
             else:
                 new_elements.append(element)
 
-        return self.__class__(**{'elements': new_elements})
+        return self._collect(new_elements)
 
 
 class StyleBlock:
+    __slots__ = ('value',)
+
     def __init__(self, value: Any):
         self.value = value
 
@@ -193,18 +276,17 @@ class StyleBlock:
         offset: int | None = None,
         border: int | None = None,
     ):
-        if indent is not None and indent > 8:
-            raise ValueError('indent must be less than 8.')
-
-        self.value.style = 'ordered' if ordered else 'bullet'
-        self.value.indent = indent
-        self.value.offset = offset
-        self.value.border = border
+        changes = {'style': 'ordered' if ordered else 'bullet', 'indent': indent, 'offset': offset, 'border': border}
+        # Check every change before making any, against the limits construction checks.
+        for name, value in changes.items():
+            check_assignment(self.value, name, value)
+        for name, value in changes.items():
+            setattr(self.value, name, value)
 
         return self.value
 
 
-class RichTextList(RichTextListSchema, StyleBlock):
+class RichTextList(RichTextListSchema, CollectableElementMixin[RichSection]):
     @classmethod
     def create(
         cls,
@@ -220,11 +302,7 @@ class RichTextList(RichTextListSchema, StyleBlock):
 
     def __getitem__(self: Self, items: RichSection | tuple[RichSection, ...] | list[RichSection]) -> Self:
         """Add items to the designated collection field."""
-        if isinstance(items, tuple):
-            items = list(items)
-        elif not isinstance(items, list):
-            items = [items]
-        return StyleBlock(self.__class__(**{'elements': items}))
+        return StyleBlock(super().__getitem__(items))
 
 
 class RichPreformatted(RichPreformattedSchema, CollectableElementMixin[AnyRichElement]):
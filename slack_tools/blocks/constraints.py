@@ -0,0 +1,252 @@
+"""Block Kit: Declarative constraints.
+
+Cross-field rules and limits are declared on a schema class rather than written
+out in its `__post_init__`:
+
+    class SectionBlockSchema(BaseBlock, block_type='section'):
+        _constraints = (
+            exactly_one_of('text', 'fields'),
+            each_max_length('fields', 2000),
+        )
+
+`BlockMetaclass` compiles them, together with the `min_length`/`max_length`
+metadata of the class's fields, into two straight-line functions per class: one
+for rules, checked in `strict` mode, and one for length limits, checked in
+`strict` and `fast` mode. `validate_tree()` calls the same functions, collecting
+every violation instead of raising the first, and `to_json_schema()` turns the
+declarations into JSON Schema keywords.
+
+`compile_field_checks()` also builds a table of checks per field, of a new
+value about to be assigned to it, for validating in-place edits (see
+`assignment_checks()`) without re-running the whole class's checks.
+"""
+
+import re
+from dataclasses import MISSING, Field, dataclass
+from typing import Any, Callable, Iterable, Literal
+
+from slack_tools.exceptions import LengthValidationError
+
+__all__ = [
+    'Constraint',
+    'at_most',
+    'compile_checks',
+    'compile_field_checks',
+    'each_max_length',
+    'exactly_one_of',
+    'max_items',
+    'startswith',
+    'to_json_schema',
+]
+
+Check = Callable[..., None]
+"""`check(obj, errors=None)`: raises the first violation, or appends `(field name or None, error)` to `errors`."""
+
+
+@dataclass(frozen=True)
+class Constraint:
+    """A declared rule or limit on one or more fields."""
+
+    kind: Literal['exactly_one_of', 'max_items', 'each_max_length', 'startswith', 'at_most']
+    names: tuple[str, ...]
+    value: Any = None
+    attribute: str | None = None
+
+    @property
+    def checks_lengths(self) -> bool:
+        """Whether this is a limit (checked in `fast` mode too) rather than a rule."""
+        return self.kind in ('max_items', 'each_max_length', 'at_most')
+
+
+def exactly_one_of(*names: str) -> Constraint:
+    """One of the fields must be given (not `None`), and at most one can be non-empty."""
+    return Constraint('exactly_one_of', names)
+
+
+def max_items(name: str, limit: int) -> Constraint:
+    """The list field can hold at most `limit` items."""
+    return Constraint('max_items', (name,), limit)
+
+
+def each_max_length(name: str, limit: int, attribute: str = 'text') -> Constraint:
+    """The `attribute` of each item of the list field (or the item, if it's a string) is at most `limit` long."""
+    return Constraint('each_max_length', (name,), limit, attribute)
+
+
+def startswith(name: str, prefix: str) -> Constraint:
+    """The string field, if set, starts with `prefix`."""
+    return Constraint('startswith', (name,), prefix)
+
+
+def at_most(name: str, limit: int) -> Constraint:
+    """The number field, if set, is at most `limit`."""
+    return Constraint('at_most', (name,), limit)
+
+
+def _fail(errors: list | None, name: str | None, error: Exception) -> None:
+    if errors is None:
+        raise error
+    errors.append((name, error))
+
+
+def _either(names: tuple[str, ...]) -> str:
+    return names[0] if len(names) == 1 else f'{", ".join(names[:-1])} or {names[-1]}'
+
+
+def _load(name: str, assigned: str | None) -> list[str]:
+    """Read the field into `value`, unless `value` is already the one being assigned to it."""
+    return [] if assigned is not None else [f'    value = obj.{name}']
+
+
+def _constraint_lines(
+    constraint: Constraint, index: int, namespace: dict[str, Any], assigned: str | None = None
+) -> list[str]:
+    names, value = constraint.names, constraint.value
+    name = names[0]
+    if constraint.kind == 'exactly_one_of':
+        count = ' + '.join('bool(value)' if n == assigned else f'bool(obj.{n})' for n in names)
+        extra = f'fail(errors, None, ValueError({f"Only one of {_either(names)} can be provided."!r}))'
+        if assigned is not None:
+            # Clearing a field is allowed, so one can be swapped for another.
+            return [f'    if {count} > 1:', f'        {extra}']
+        missing = ' and '.join(f'obj.{n} is None' for n in names)
+        return [
+            f'    if {missing}:',
+            f'        fail(errors, None, ValueError({f"{_either(names)} is required."!r}))',
+            f'    elif {count} > 1:',
+            f'        {extra}',
+        ]
+    if constraint.kind == 'startswith':
+        namespace[f'PREFIX_{index}'] = value
+        return [
+            *_load(name, assigned),
+            f'    if value and not value.startswith(PREFIX_{index}):',
+            f'        fail(errors, {name!r}, ValueError({f"{name} must start with {value}"!r}))',
+        ]
+    if constraint.kind == 'at_most':
+        return [
+            *_load(name, assigned),
+            f'    if value is not None and value > {value!r}:',
+            f'        fail(errors, {name!r}, ValueError({f"{name} must be at most {value}."!r}))',
+        ]
+    if constraint.kind == 'max_items':
+        return [
+            *_load(name, assigned),
+            f'    if value is not None and len(value) > {value}:',
+            f'        fail(errors, {name!r}, LengthValidationError({name!r}, len(value), None, {value}))',
+        ]
+    # each_max_length
+    return [
+        *_load(name, assigned),
+        '    if value:',
+        '        for index, item in enumerate(value):',
+        f'            length = len(getattr(item, {constraint.attribute!r}, item))',
+        f'            if length > {value}:',
+        f'                label = f"{name}[{{index}}].{constraint.attribute}"',
+        f'                fail(errors, {name!r}, LengthValidationError(label, length, None, {value}))',
+    ]
+
+
+def _length_lines(name: str, field: Field, namespace: dict[str, Any], assigned: str | None = None) -> list[str]:
+    """Check a field's `min_length`/`max_length` metadata; `None` and the field's default are exempt."""
+    min_length, max_length = field.metadata.get('min_length'), field.metadata.get('max_length')
+    bounds = []
+    if min_length:
+        bounds.append(f'length < {min_length}')
+    if max_length:
+        bounds.append(f'length > {max_length}')
+    if not bounds:
+        return []
+
+    condition = 'value is not None'
+    if field.default is not MISSING and field.default is not None:
+        namespace[f'DEFAULT_{name}'] = field.default
+        condition += f' and value != DEFAULT_{name}'
+    return [
+        *_load(name, assigned),
+        f'    if {condition}:',
+        '        length = len(value) if isinstance(value, SIZED) else len(str(value))',
+        f'        if {" or ".join(bounds)}:',
+        f'            fail(errors, {name!r}, LengthValidationError({name!r}, length, {min_length!r}, {max_length!r}))',
+    ]
+
+
+def _namespace() -> dict[str, Any]:
+    return {'fail': _fail, 'LengthValidationError': LengthValidationError, 'SIZED': (str, list, tuple, dict)}
+
+
+def _compile(qualname: str, lines: list[str], namespace: dict[str, Any], signature: str = 'obj') -> Check | None:
+    if not lines:
+        return None
+    exec('\n'.join([f'def check({signature}, errors=None):', *lines]), namespace)
+    check = namespace['check']
+    check.__qualname__ = qualname
+    return check
+
+
+def compile_checks(
+    qualname: str, length_fields: dict[str, Field], constraints: Iterable[Constraint]
+) -> tuple[Check | None, Check | None]:
+    """Generate the `(rules, lengths)` checks for a class; either is `None` if there's nothing to check."""
+    namespace = _namespace()
+    rules: list[str] = []
+    lengths: list[str] = []
+    for name, field in length_fields.items():
+        lengths.extend(_length_lines(name, field, namespace))
+    for index, constraint in enumerate(constraints):
+        lines = lengths if constraint.checks_lengths else rules
+        lines.extend(_constraint_lines(constraint, index, namespace))
+
+    return (
+        _compile(f'{qualname}.check_rules', rules, namespace.copy()),
+        _compile(f'{qualname}.check_lengths', lengths, namespace.copy()),
+    )
+
+
+def compile_field_checks(
+    qualname: str, length_fields: dict[str, Field], constraints: Iterable[Constraint]
+) -> dict[str, tuple[Check | None, Check | None]]:
+    """Generate `(rules, lengths)` checks of a new value for each constrained field.
+
+    Each is called as `check(obj, value)` before `value` is assigned, and only
+    covers what involves that field.
+    """
+    constraints = tuple(constraints)
+    names = dict.fromkeys([*length_fields, *(name for constraint in constraints for name in constraint.names)])
+    table = {}
+    for name in names:
+        namespace = _namespace()
+        rules: list[str] = []
+        lengths = _length_lines(name, length_fields[name], namespace, name) if name in length_fields else []
+        for index, constraint in enumerate(constraints):
+            if name in constraint.names:
+                lines = lengths if constraint.checks_lengths else rules
+                lines.extend(_constraint_lines(constraint, index, namespace, name))
+        table[name] = (
+            _compile(f'{qualname}.check_{name}_rules', rules, namespace.copy(), 'obj, value'),
+            _compile(f'{qualname}.check_{name}_lengths', lengths, namespace.copy(), 'obj, value'),
+        )
+    return table
+
+
+def to_json_schema(constraints: Iterable[Constraint]) -> dict[str, Any]:
+    """Return the JSON Schema keywords for constraints, to merge into a class's object schema."""
+    schema: dict[str, Any] = {}
+    properties: dict[str, dict[str, Any]] = {}
+    for constraint in constraints:
+        name, value = constraint.names[0], constraint.value
+        if constraint.kind == 'exactly_one_of':
+            one_of = {'oneOf': [{'required': [n]} for n in constraint.names]}
+            schema.setdefault('allOf', []).append(one_of)
+        elif constraint.kind == 'max_items':
+            properties.setdefault(name, {})['maxItems'] = value
+        elif constraint.kind == 'each_max_length':
+            item = {'properties': {constraint.attribute: {'maxLength': value}}}
+            properties.setdefault(name, {})['items'] = item
+        elif constraint.kind == 'startswith':
+            properties.setdefault(name, {})['pattern'] = '^' + re.escape(value)
+        else:
+            properties.setdefault(name, {})['maximum'] = value
+    if properties:
+        schema['properties'] = properties
+    return schema
@@ -0,0 +1,183 @@
+"""Block Kit: Layout index.
+
+Every `BlockKit` and `ModalSurface` keeps an index of where each `block_id`
+and `action_id` in its blocks is, however deeply nested, so the element a
+`block_actions` payload refers to is found without scanning the layout:
+
+    button = kit.index.find(action_id=action['action_id'], block_id=action['block_id'])
+    kit.index.pointer(block_id='summary')  # '/blocks/3', for a JSON Patch
+
+The index is built as blocks are added (`kit[...]`): each new block is walked
+once, and the callbacks of the elements found on the way (e.g. `Button`s
+inside an `actions` block) are returned so the layout can register them with
+its `ActionHandler`. The walk is compiled per class, like the serializers, and
+skips objects that can't hold ids (e.g. text objects) without visiting them.
+
+Entries are paths from the layout's `blocks`, resolved on lookup. If the
+layout was changed in place and an entry no longer points at its id, the index
+is rebuilt once and the lookup retried.
+"""
+
+from dataclasses import MISSING, is_dataclass
+from typing import Any, Callable, Iterable, Literal
+
+from slack_tools.actions.schemas import ActionCallback
+
+__all__ = ['LayoutIndex', 'Path']
+
+Path = tuple[str | int, ...]
+"""Keys from a layout's `blocks` to a block or element, e.g. `(3, 'elements', 0)`."""
+
+Walker = Callable[[Any, Path, dict, dict, list], None]
+"""`walk(node, path, block_ids, action_ids, callbacks)`: indexes `node` and everything under it."""
+
+_WALKERS: dict[type, Walker | None] = {}
+"""Compiled walkers by class; `None` for classes with nothing to index (non-dataclasses, text objects)."""
+
+
+def _walker(cls: type) -> Walker | None:
+    """Return the walker for `cls`, compiling it on first use."""
+    try:
+        return _WALKERS[cls]
+    except KeyError:
+        pass
+    # Imported here: the decoder imports the block classes.
+    from slack_tools.serialization.decoder import field_classes
+
+    lines = []
+    if is_dataclass(cls):
+        fields = cls.__dataclass_fields__
+        if 'block_id' in fields:
+            lines += ['    if node.block_id is not None:', '        block_ids.setdefault(node.block_id, path)']
+        if 'action_id' in fields:
+            lines += [
+                '    if node.action_id is not None:',
+                '        action_ids.setdefault(node.action_id, []).append(path)',
+            ]
+        if callable(getattr(cls, 'get_action', None)):
+            lines += ['    callback = node.get_action()', '    if callback:', '        callbacks.append(callback)']
+        # Lists are walked inline, and children with nothing to index are skipped without a call.
+        for name in field_classes(cls):
+            lines += [
+                f'    child = node.{name}',
+                '    if child is not None:',
+                '        cls = child.__class__',
+                '        if cls is list or cls is tuple:',
+                '            for index, item in enumerate(child):',
+                '                if item is not None:',
+                '                    walk = WALKERS.get(item.__class__, MISSING)',
+                '                    if walk is MISSING:',
+                '                        walk = walker(item.__class__)',
+                '                    if walk is not None:',
+                f'                        walk(item, (*path, {name!r}, index), block_ids, action_ids, callbacks)',
+                '        else:',
+                '            walk = WALKERS.get(cls, MISSING)',
+                '            if walk is MISSING:',
+                '                walk = walker(cls)',
+                '            if walk is not None:',
+                f'                walk(child, (*path, {name!r}), block_ids, action_ids, callbacks)',
+            ]
+    if not lines:
+        _WALKERS[cls] = None
+        return None
+
+    namespace: dict[str, Any] = {'WALKERS': _WALKERS, 'MISSING': MISSING, 'walker': _walker}
+    exec('\n'.join(['def walk(node, path, block_ids, action_ids, callbacks):', *lines]), namespace)
+    walk = _WALKERS[cls] = namespace['walk']
+    walk.__qualname__ = f'{cls.__qualname__}.walk'
+    return walk
+
+
+class LayoutIndex:
+    """Paths of the blocks and elements with a `block_id` or `action_id` in a list of blocks.
+
+    Args:
+        blocks: The layout's `blocks` list; the index reads it, but never changes it.
+    """
+
+    def __init__(self, blocks: list):
+        self.blocks = blocks
+        self.block_ids: dict[str, Path] = {}
+        """Path of each `block_id`. Slack requires them to be unique; the first one is kept."""
+        self.action_ids: dict[str, list[Path]] = {}
+        """Paths of each `action_id`, in layout order. They only need to be unique within a block."""
+        self.indexed = 0
+        """Number of blocks indexed so far."""
+
+    def add(self, blocks: Iterable[Any]) -> list[ActionCallback]:
+        """Index blocks about to be appended to the layout; returns the callbacks found in them."""
+        callbacks: list[ActionCallback] = []
+        for block in blocks:
+            walk = None if block is None else _walker(block.__class__)
+            if walk is not None:
+                walk(block, (self.indexed,), self.block_ids, self.action_ids, callbacks)
+            self.indexed += 1
+        return callbacks
+
+    def sync(self) -> list[ActionCallback]:
+        """Index blocks appended to the layout without `add()`, e.g. with `blocks.extend()`."""
+        if self.indexed >= len(self.blocks):
+            return []
+        return self.add(self.blocks[self.indexed :])
+
+    def rebuild(self) -> None:
+        """Index the layout from scratch, after blocks were replaced, removed or reordered."""
+        self.block_ids.clear()
+        self.action_ids.clear()
+        self.indexed = 0
+        self.sync()
+
+    def _resolve(self, path: Path) -> Any:
+        node: Any = self.blocks
+        for key in path:
+            node = node[key] if isinstance(key, int) else getattr(node, key)
+        return node
+
+    def _lookup(self, block_id: str | None, action_id: str | None) -> tuple[Path, Any] | Literal[False] | None:
+        """Return `(path, node)`, `None` if there's no entry, or `False` if the entry is out of date."""
+        if action_id is None:
+            path = self.block_ids.get(block_id)  # type: ignore[arg-type]
+        else:
+            paths = self.action_ids.get(action_id, [])
+            if block_id is not None:
+                prefix = self.block_ids.get(block_id)
+                paths = [] if prefix is None else [path for path in paths if path[: len(prefix)] == prefix]
+            path = paths[0] if paths else None
+        if path is None:
+            return None
+
+        try:
+            node = self._resolve(path)
+        except (AttributeError, IndexError, TypeError):
+            return False
+        key, value = ('block_id', block_id) if action_id is None else ('action_id', action_id)
+        if getattr(node, key, None) != value:
+            return False
+        return path, node
+
+    def locate(self, *, block_id: str | None = None, action_id: str | None = None) -> tuple[Path, Any] | None:
+        """Return the path of, and the block or element with, `block_id` and/or `action_id`.
+
+        With both, the element with `action_id` inside the block with
+        `block_id`, as in a `block_actions` payload. `None` if there's none.
+        """
+        if block_id is None and action_id is None:
+            raise ValueError('block_id or action_id is required')
+        self.sync()
+        found = self._lookup(block_id, action_id)
+        if found is False:
+            self.rebuild()
+            found = self._lookup(block_id, action_id)
+        return found or None
+
+    def find(self, *, block_id: str | None = None, action_id: str | None = None) -> Any:
+        """Return the block or element with `block_id` and/or `action_id` (see `locate()`), or `None`."""
+        found = self.locate(block_id=block_id, action_id=action_id)
+        return None if found is None else found[1]
+
+    def pointer(self, *, block_id: str | None = None, action_id: str | None = None) -> str | None:
+        """Return the JSON pointer of the block or element in the layout's `to_dict()`, e.g. `/blocks/3/elements/0`."""
+        found = self.locate(block_id=block_id, action_id=action_id)
+        if found is None:
+            return None
+        return '/blocks' + ''.join(f'/{key}' for key in found[0])
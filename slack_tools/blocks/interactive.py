@@ -25,6 +25,8 @@ from slack_tools.blocks.schemas.objects import PlainTextSchema
 class Button(ButtonSchema, CallableElementMixin):
     """Button."""
 
+    __slots__ = ('_callback',)
+
     @classmethod
     def create(
         cls,
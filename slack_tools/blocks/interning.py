@@ -0,0 +1,141 @@
+"""Block Kit: Interning.
+
+Opt-in hash-consing of structurally identical subtrees. When thousands of
+layouts are built in one process, the same labels, options, confirmation
+dialogs and even whole blocks are allocated over and over; interning replaces
+each of them with one shared instance.
+
+Shared instances are frozen (see `SerializableMixin.freeze`), so they can't be
+changed through one layout and leak into another. The table holds them weakly,
+and entries disappear once no layout uses them.
+
+Interning happens when blocks are added to a `BlockKit` or `ModalSurface`, after
+builders such as `Button.create(..., callback=...)` are done with them:
+
+    with interning():
+        layout = bk[bk.header('Hi'), bk.actions[bk.button('Approve', action_id='approve')]]
+
+`intern()` can also be called directly on any block or element.
+"""
+
+import contextlib
+import weakref
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Hashable, Iterator, TypeVar
+
+from slack_tools.blocks.mixins.serializable import SerializableMixin
+from slack_tools.serialization.encoder import wire_fields
+
+__all__ = ['intern', 'interning', 'interning_enabled', 'set_interning']
+
+T = TypeVar('T')
+
+_TABLE: weakref.WeakValueDictionary[Hashable, Any] = weakref.WeakValueDictionary()
+"""Shared instances, keyed by class and field values."""
+
+
+@dataclass
+class _Settings:
+    enabled: bool = False
+
+
+_SETTINGS = _Settings()
+
+_OVERRIDE: ContextVar[bool | None] = ContextVar('interning', default=None)
+"""Whether blocks are interned, set by `interning()` for the current context, if any."""
+
+
+def interning_enabled() -> bool:
+    """Whether blocks are interned when added to a layout, in the current context."""
+    enabled = _OVERRIDE.get()
+    return _SETTINGS.enabled if enabled is None else enabled
+
+
+def set_interning(enabled: bool) -> None:
+    """Turn interning on or off for the whole process, outside any `interning()` block."""
+    _SETTINGS.enabled = enabled
+
+
+@contextlib.contextmanager
+def interning(enabled: bool = True) -> Iterator[None]:
+    """Intern blocks added to layouts inside the `with` block (or not, with `enabled=False`).
+
+    The setting is kept in a `ContextVar`, so other threads and asyncio tasks keep their own.
+    """
+    token = _OVERRIDE.set(enabled)
+    try:
+        yield
+    finally:
+        _OVERRIDE.reset(token)
+
+
+_CACHE_STATE = frozenset(SerializableMixin.__slots__)
+
+_STATE_NAMES: dict[type, tuple[str, ...]] = {}
+"""Slots other than wire fields and cache state (e.g. `Button._callback`), keyed by class."""
+
+
+def _state_names(cls: type) -> tuple[str, ...]:
+    """Return the slots of `cls` that aren't sent to Slack but still tell instances apart."""
+    names = _STATE_NAMES.get(cls)
+    if names is None:
+        wire = set(wire_fields(cls))
+        slots = (name for base in cls.__mro__ for name in base.__dict__.get('__slots__', ()))
+        names = _STATE_NAMES[cls] = tuple(
+            dict.fromkeys(name for name in slots if name not in wire and name not in _CACHE_STATE)
+        )
+    return names
+
+
+def _key(value: Any) -> Hashable:
+    """Return the part of an interning key for one (already interned) field value."""
+    if isinstance(value, SerializableMixin):
+        # Children are interned first, so equal children are the same object.
+        # The parent holds a strong reference, so the id stays valid while its entry lives.
+        return id(value)
+    if isinstance(value, tuple):
+        return tuple(_key(item) for item in value)
+    hash(value)
+    return value.__class__, value
+
+
+def intern(node: T) -> T:
+    """Return the shared, frozen instance that is structurally identical to `node`.
+
+    Children are interned first. Instances are only shared if their non-wire
+    state (e.g. a button's callback) is the same too. Objects holding
+    unhashable values (e.g. `dict` fields) are returned unchanged.
+    """
+    if isinstance(node, (list, tuple)):
+        return type(node)(intern(item) for item in node)
+    if not isinstance(node, SerializableMixin):
+        return node
+
+    names = wire_fields(type(node))
+    values = []
+    for name in names:
+        value = getattr(node, name)
+        if isinstance(value, (list, tuple)):
+            value = tuple(intern(item) for item in value)
+        elif isinstance(value, SerializableMixin):
+            value = intern(value)
+        values.append(value)
+
+    # Non-wire state is part of the key, so e.g. buttons with different callbacks aren't merged.
+    state = tuple(getattr(node, name, None) for name in _state_names(type(node)))
+    try:
+        key = (type(node), tuple(_key(value) for value in values), tuple(_key(value) for value in state))
+    except TypeError:
+        return node
+
+    shared = _TABLE.get(key)
+    if shared is not None:
+        return shared
+
+    for name, value in zip(names, values):
+        if value is not getattr(node, name):
+            object.__setattr__(node, name, value)
+    node.freeze()
+    _TABLE[key] = node
+    return node
@@ -0,0 +1,215 @@
+"""Block Kit: Platform limits.
+
+Slack rejects messages with more than 50 blocks, and modals and Home tabs with
+more than 100. A `LayoutBudget` keeps the block count and an estimate of the
+encoded size of a layout up to date as blocks are added, so a layout that's
+about to go over is caught when it's built rather than by a failed API call:
+
+    kit = BlockKit().track_limits('message')
+    kit[bk.section(...)]  # raises LimitExceededError on the 51st block
+
+Each added block is measured once, from its fields (or its pre-encoded JSON
+if it's frozen); the layout is never re-serialized. The estimate is the size of
+the `blocks` array as `to_api()` encodes it, and is exact for blocks that
+aren't changed after they're added.
+
+`split_blocks()` (and `BlockKit.split()`) cuts a layout that's over the limits
+into several that aren't.
+
+Slack doesn't document a byte limit for every surface, so `max_bytes` is unset
+by default; pass `SurfaceLimits(max_blocks=..., max_bytes=...)` to enforce one.
+"""
+
+import json
+import warnings
+from dataclasses import dataclass, is_dataclass
+from typing import Any, Iterable, Iterator, Literal
+
+from slack_tools.exceptions import LimitExceededError
+from slack_tools.serialization.encoder import serialize, wire_fields
+
+__all__ = ['SURFACE_LIMITS', 'LayoutBudget', 'LimitWarning', 'SurfaceLimits', 'estimate_size', 'split_blocks']
+
+
+@dataclass(frozen=True)
+class SurfaceLimits:
+    """Limits for one kind of surface."""
+
+    max_blocks: int
+    max_bytes: int | None = None
+
+
+SURFACE_LIMITS: dict[str, SurfaceLimits] = {
+    'message': SurfaceLimits(max_blocks=50),
+    'modal': SurfaceLimits(max_blocks=100),
+    'home': SurfaceLimits(max_blocks=100),
+}
+"""Default limits by surface."""
+
+
+class LimitWarning(UserWarning):
+    """Warns that a layout has gone over, or is close to, a platform limit."""
+
+
+def estimate_size(value: Any) -> int:
+    """Return the length of `value` encoded as in `to_api()`, without encoding it.
+
+    Strings that need escaping (quotes, control or non-ASCII characters) are
+    measured with their escapes.
+    """
+    cls = value.__class__
+    if cls is str:
+        if value.isascii() and value.isprintable() and '"' not in value and '\\' not in value:
+            return len(value) + 2
+        return len(json.dumps(value))
+    if cls is bool:
+        return 4 if value else 5
+    if cls is int or cls is float:
+        return len(repr(value))
+    if cls is list or cls is tuple:
+        items = [estimate_size(item) for item in value if item is not None]
+        return 2 + sum(items) + 2 * max(len(items) - 1, 0)
+    if cls is dict:
+        items = [len(json.dumps(key)) + 2 + estimate_size(item) for key, item in value.items() if item is not None]
+        return 2 + sum(items) + 2 * max(len(items) - 1, 0)
+
+    frozen = getattr(value, '_frozen_json', None)
+    if frozen is not None:
+        return len(frozen)
+    if not is_dataclass(value):
+        return len(json.dumps(serialize(value)))
+
+    # `{"name": value, ...}`: quotes, colon and space around each key, and `, ` between fields.
+    items = [
+        len(name) + 4 + estimate_size(item) for name in wire_fields(cls) if (item := getattr(value, name)) is not None
+    ]
+    return 2 + sum(items) + 2 * max(len(items) - 1, 0)
+
+
+class LayoutBudget:
+    """Running block count and size estimate of a layout, checked against a surface's limits.
+
+    Args:
+        surface: `message`, `modal` or `home`, for the default limits.
+        limits: Limits to use instead of the surface's defaults.
+        on_exceed: Raise `LimitExceededError`, or emit a `LimitWarning` and
+            let the blocks be added anyway.
+        warn_at: Emit a `LimitWarning` once usage reaches this fraction of a
+            limit. `None` disables early warnings.
+    """
+
+    def __init__(
+        self,
+        surface: str = 'message',
+        *,
+        limits: SurfaceLimits | None = None,
+        on_exceed: Literal['raise', 'warn'] = 'raise',
+        warn_at: float | None = 0.9,
+    ):
+        self.surface = surface
+        self.limits = limits or SURFACE_LIMITS[surface]
+        self.on_exceed = on_exceed
+        self.warn_at = warn_at
+        self.blocks = 0
+        self.block_bytes = 0
+        """Sum of the encoded sizes of the blocks, without separators."""
+        self._warned = False
+
+    @property
+    def bytes(self) -> int:
+        """Estimated size of the encoded `blocks` array."""
+        return 2 + self.block_bytes + 2 * max(self.blocks - 1, 0)
+
+    @property
+    def remaining_blocks(self) -> int:
+        return self.limits.max_blocks - self.blocks
+
+    @property
+    def remaining_bytes(self) -> int | None:
+        return None if self.limits.max_bytes is None else self.limits.max_bytes - self.bytes
+
+    def add(self, blocks: Iterable[Any]) -> None:
+        """Account for blocks about to be added to the layout.
+
+        Raises:
+            LimitExceededError: If they'd take the layout over a limit, and
+                `on_exceed` is `raise`. Nothing is counted in that case.
+        """
+        blocks = [block for block in blocks if block is not None]
+        count = self.blocks + len(blocks)
+        block_bytes = self.block_bytes + sum(estimate_size(block) for block in blocks)
+        size = 2 + block_bytes + 2 * max(count - 1, 0)
+
+        problems = []
+        if count > self.limits.max_blocks:
+            problems.append(f'{count} blocks (limit {self.limits.max_blocks})')
+        if self.limits.max_bytes is not None and size > self.limits.max_bytes:
+            problems.append(f'~{size} bytes (limit {self.limits.max_bytes})')
+
+        if problems:
+            message = f'{self.surface} layout would have ' + ' and '.join(problems)
+            if self.on_exceed == 'raise':
+                raise LimitExceededError(message)
+            warnings.warn(message, LimitWarning, stacklevel=3)
+        elif self.warn_at is not None and not self._warned and self._near_limit(count, size):
+            self._warned = True
+            warnings.warn(
+                f'{self.surface} layout is at {count}/{self.limits.max_blocks} blocks, ~{size} bytes',
+                LimitWarning,
+                stacklevel=3,
+            )
+
+        self.blocks = count
+        self.block_bytes = block_bytes
+
+    def _near_limit(self, count: int, size: int) -> bool:
+        if count >= self.warn_at * self.limits.max_blocks:  # type: ignore[operator]
+            return True
+        return self.limits.max_bytes is not None and size >= self.warn_at * self.limits.max_bytes  # type: ignore[operator]
+
+
+def _groups(blocks: Iterable[Any]) -> Iterator[list[Any]]:
+    """Yield runs of blocks that must stay together: headers and the block after them."""
+    group: list[Any] = []
+    for block in blocks:
+        if block is None:
+            continue
+        group.append(block)
+        if getattr(block, 'type', None) != 'header':
+            yield group
+            group = []
+    if group:
+        yield group
+
+
+def split_blocks(blocks: Iterable[Any], limits: SurfaceLimits) -> Iterator[list[Any]]:
+    """Cut blocks into consecutive chunks that each fit within `limits`, in one pass.
+
+    Blocks are never cut, so elements of one `actions` or `rich_text` block
+    always end up in the same chunk, and a `header` always stays with the block
+    after it. Chunks are yielded as soon as they're full.
+
+    Raises:
+        LimitExceededError: If a block (or a header and its block) doesn't fit
+            within `limits` even on its own.
+    """
+    chunk: list[Any] = []
+    chunk_bytes = 0
+    for group in _groups(blocks):
+        group_bytes = sum(estimate_size(block) for block in group)
+        count = len(chunk) + len(group)
+        size = 2 + chunk_bytes + group_bytes + 2 * (count - 1)
+        if chunk and (count > limits.max_blocks or (limits.max_bytes is not None and size > limits.max_bytes)):
+            yield chunk
+            chunk, chunk_bytes = [], 0
+            count, size = len(group), 2 + group_bytes + 2 * (len(group) - 1)
+
+        if count > limits.max_blocks or (limits.max_bytes is not None and size > limits.max_bytes):
+            raise LimitExceededError(
+                f'{len(group)} block(s) of ~{size} bytes cannot fit within {limits.max_blocks} blocks'
+                + ('' if limits.max_bytes is None else f' and {limits.max_bytes} bytes')
+            )
+        chunk.extend(group)
+        chunk_bytes += group_bytes
+    if chunk:
+        yield chunk
@@ -3,6 +3,7 @@ from dataclasses import dataclass
 from slack_tools.blocks.mixins.collectable import CollectableElementMixin
 from slack_tools.blocks.objects import (
     Option,
+    OptionSet,
 )
 from slack_tools.blocks.schemas.base import BaseInteractiveElement
 from slack_tools.blocks.schemas.objects import (
@@ -15,7 +16,7 @@ from slack_tools.blocks.text import PlainText
 InteractiveElement = BaseInteractiveElement
 
 
-@dataclass
+@dataclass(slots=True)
 class OverflowMenu(
     InteractiveElement,
     CollectableElementMixin[Option],
@@ -23,12 +24,12 @@ class OverflowMenu(
 ):
     """Overflow Menu."""
 
-    options: list[Option]
+    options: list[Option] | OptionSet
     confirm: ConfirmationDialogSchema | None = None
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StaticMultiSelectMenu(
     InteractiveElement,
     CollectableElementMixin[Option],
@@ -36,9 +37,9 @@ class StaticMultiSelectMenu(
 ):
     """Static Multi-Select Menu."""
 
-    options: list[Option]
+    options: list[Option] | OptionSet
     option_groups: list[OptionGroupSchema] | None = None
-    initial_options: list[Option] | None = None
+    initial_options: list[Option] | OptionSet | None = None
 
     confirm: ConfirmationDialogSchema | None = None
     max_selected_items: int | None = None
@@ -47,7 +48,7 @@ class StaticMultiSelectMenu(
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StaticSelectMenu(
     InteractiveElement,
     CollectableElementMixin[Option],
@@ -55,7 +56,7 @@ class StaticSelectMenu(
 ):
     """Static Multi-Select Menu."""
 
-    options: list[Option]
+    options: list[Option] | OptionSet
     option_groups: list[OptionGroupSchema] | None = None
     initial_option: Option | None = None
 
@@ -66,7 +67,7 @@ class StaticSelectMenu(
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalSelectMenu(
     InteractiveElement,
     CollectableElementMixin[Option],
@@ -74,7 +75,7 @@ class ExternalSelectMenu(
 ):
     """External Select Menu."""
 
-    options: list[Option]
+    options: list[Option] | OptionSet
     option_groups: list[OptionGroupSchema] | None = None
     min_query_length: int = 3
     initial_option: Option | None = None
@@ -86,7 +87,7 @@ class ExternalSelectMenu(
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ExternalMultiSelectMenu(
     InteractiveElement,
     CollectableElementMixin[Option],
@@ -94,7 +95,7 @@ class ExternalMultiSelectMenu(
 ):
     """External Static Multi-Select Menu."""
 
-    initial_options: list[Option] | None = None
+    initial_options: list[Option] | OptionSet | None = None
     min_query_length: int = 3
 
     confirm: ConfirmationDialogSchema | None = None
@@ -104,7 +105,7 @@ class ExternalMultiSelectMenu(
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSelectMenu(
     InteractiveElement,
     CollectableElementMixin[Option],
@@ -121,7 +122,7 @@ class UserSelectMenu(
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMultiSelectMenu(
     InteractiveElement,
     CollectableElementMixin[Option],
@@ -138,7 +139,7 @@ class UserMultiSelectMenu(
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSelectMenu(
     InteractiveElement,
     CollectableElementMixin[Option],
@@ -159,7 +160,7 @@ class ConversationSelectMenu(
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationMultiSelectMenu(
     InteractiveElement,
     CollectableElementMixin[Option],
@@ -179,7 +180,7 @@ class ConversationMultiSelectMenu(
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelSelectMenu(
     InteractiveElement,
     CollectableElementMixin[Option],
@@ -197,7 +198,7 @@ class ChannelSelectMenu(
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class ChannelMultiSelectMenu(
     InteractiveElement,
     CollectableElementMixin[Option],
@@ -1,23 +1,26 @@
-from dataclasses import dataclass, field
 from typing import Callable, Self
 
 from slack_tools.actions.schemas import ActionCallback
 
 
-@dataclass
 class CallableElementMixin:
-    """Mixin for elements that can be called."""
+    """Mixin for elements that can be called.
 
-    _callback: Callable | None = field(default=None, repr=False, init=False)
+    It holds no state itself, so it can be mixed into slotted schema classes;
+    the class using it declares a `_callback` slot.
+    """
+
+    __slots__ = ()
 
     def get_action(self) -> ActionCallback | None:
-        if self._callback:
+        callback: Callable | None = getattr(self, '_callback', None)
+        if callback:
             return ActionCallback(
                 action_id=self.action_id,
-                callback=self._callback,
+                callback=callback,
             )
         return None
 
     def action(self, callback: Callable) -> Self:
-        self._callback = callback
+        setattr(self, '_callback', callback)  # declared by the class using the mixin
         return self
@@ -1,29 +1,48 @@
-from typing import Generic, Self, TypeVar
+from dataclasses import Field, replace
+from typing import Any, ClassVar, Generic, Iterable, Protocol, Self, TypeVar
 
-from slack_tools.blocks.schemas.base import BaseElement, BaseRichElement
+from slack_tools.blocks.schemas.base import BaseElement
 
 T = TypeVar('T', bound=BaseElement)
 
 
+class _Collector(Protocol):
+    """What the mixin needs from the schema dataclass it's mixed into."""
+
+    __dataclass_fields__: ClassVar[dict[str, Field[Any]]]
+
+    @property
+    def is_frozen(self) -> bool: ...
+
+    def _frozen_with(self, name: str, items: Iterable[Any]) -> Self: ...
+
+    def _collect(self, items: list[Any]) -> Self: ...
+
+
+C = TypeVar('C', bound=_Collector)
+
+
 class CollectableElementMixin(Generic[T]):
-    """Mixin to allow adding items via obj[item, item, item] syntax."""
+    """Mixin to allow adding items via obj[item, item, item] syntax.
 
-    _collect_field: str = 'options'
-    """Defines the field to collect items into."""
+    Items are added to the class's `elements`, or else `options`, in a copy of
+    the block. The copy of a frozen block is frozen too, and shares the items
+    already there with the original instead of rebuilding and revalidating them
+    (see `SerializableMixin._frozen_with`).
+    """
 
-    def __getitem__(self: Self, items: T | tuple[T, ...] | list[T]) -> Self:
+    __slots__ = ()
+
+    def __getitem__(self: C, items: T | tuple[T, ...] | list[T]) -> C:
         """Add items to the designated collection field."""
         if isinstance(items, tuple):
             items = list(items)
         elif not isinstance(items, list):
             items = [items]
+        return self._collect(items)
 
-        # Need to rethink this...
-        if all(hasattr(item, 'elements') for item in items):
-            self._collect_field = 'elements'
-        elif all(isinstance(item, BaseRichElement) for item in items):
-            self._collect_field = 'elements'
-        else:
-            self._collect_field = 'elements'
-
-        return self.__class__(**{self._collect_field: items})
+    def _collect(self: C, items: list[T]) -> C:
+        collect_field = 'elements' if 'elements' in self.__dataclass_fields__ else 'options'
+        if self.is_frozen:
+            return self._frozen_with(collect_field, items)
+        return replace(self, **{collect_field: [*(getattr(self, collect_field) or ()), *items]})
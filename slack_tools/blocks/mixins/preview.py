@@ -1,10 +1,9 @@
 import json
 import re
-from dataclasses import asdict
 from urllib.parse import quote
 
 from slack_tools.blocks.mixins.copyable import CopyableStrMixin
-from slack_tools.utils.dataclass_utils import remove_none
+from slack_tools.serialization.encoder import serialize
 
 
 class SlackBlockKitPreviewURL(CopyableStrMixin):
@@ -27,8 +26,7 @@ class BlockKitPreviewMixin:
 
     def as_builder_url(self, team_id: str | None = None) -> SlackBlockKitPreviewURL:
         """Generates a URL to preview the block in Slack's Block Kit Builder."""
-        block_dict = asdict(self)
-        block_dict = remove_none(block_dict)
+        block_dict = serialize(self)
 
         # Wrap blocks in the expected format if not already wrapped
         if 'blocks' not in block_dict:
@@ -1,22 +1,349 @@
 import json
-from dataclasses import asdict, is_dataclass
+from dataclasses import is_dataclass
+from typing import Any, Iterable, Self
 
-from slack_tools.utils.dataclass_utils import remove_none
+from slack_tools.blocks.validation import (
+    ValidationMode,
+    assignment_checks_enabled,
+    check_assignment,
+    validation_mode,
+)
+from slack_tools.exceptions import DecodeError, FrozenBlockError
+from slack_tools.serialization import binary
+from slack_tools.serialization.canonical import content_hash, to_canonical_bytes
+from slack_tools.serialization.decoder import decode
+from slack_tools.serialization.encoder import (
+    get_minimal_serializer,
+    get_serializer,
+    parent_refs,
+    serialize,
+    wire_fields,
+)
+from slack_tools.serialization.stream import COMPACT_SEPARATORS
+
+_new = object.__new__
+_set = object.__setattr__
+
+
+_SLOT_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    """Every slot an instance of `cls` can hold, fields and cache state alike."""
+    slots = _SLOT_NAMES.get(cls)
+    if slots is None:
+        names = (name for base in cls.__mro__ for name in base.__dict__.get('__slots__', ()))
+        slots = _SLOT_NAMES[cls] = tuple(dict.fromkeys(name for name in names if name != '__weakref__'))
+    return slots
+
+
+def _frozen_json_of(item: Any) -> str:
+    frozen = getattr(item, '_frozen_json', None)
+    return frozen if frozen is not None else json.dumps(serialize(item))
+
+
+def _cache_subtree(value: Any) -> None:
+    """Turn caching on for `value`, a block or a list of them, and everything below it."""
+    if isinstance(value, SerializableMixin):
+        value.cache()
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            if isinstance(item, SerializableMixin):
+                item.cache()
 
 
 class SerializableMixin:
-    """Mixin for serializing dataclasses."""
+    """Mixin for serializing dataclasses.
+
+    Layouts that are serialized more than once (e.g. sent to many channels)
+    can keep their serialized `dict` on each instance with `cache()`. Assigning
+    any attribute of a cached instance then marks it and every cached ancestor
+    dirty, so the next serialization only rebuilds the changed path. In-place
+    changes to a list field (e.g. `block.elements.append(...)`) can't be
+    observed; call `mark_dirty()` after making them. Without `cache()` (or
+    `freeze()`), instances are serialized from scratch every time, with no
+    tracking overhead.
+
+    The cache state lives in slots, and schema classes are slotted dataclasses
+    (`@dataclass(slots=True)`), so instances have no `__dict__`. It isn't
+    pickled or copied: a restored instance has no cached forms or parent links.
+
+    Frozen instances (see `freeze()`) are hashable, by content, and compare
+    equal to other frozen instances with the same fields.
+    """
+
+    __slots__ = {
+        '__weakref__': None,
+        '_cached': 'Whether serialized forms are cached and changes tracked; see `cache()`.',
+        '_canonical_cache': '`(wire dict, canonical JSON)`, from the last `to_canonical_bytes()`.',
+        '_frozen_json': 'Pre-encoded JSON of a frozen subtree.',
+        '_hash_cache': '`(canonical JSON, SHA-256)`, from the last `content_hash()`.',
+        '_linked': 'Whether the children in `_wire_cache` are linked to this instance (after its first hit).',
+        '_parent_refs': 'Weak reference(s) to parents whose cached form includes this instance.',
+        '_validated': 'Whether this frozen subtree is known to pass `validate_tree()`, which then skips it.',
+        '_wire_cache': 'Cached wire `dict`, or `None` when dirty or not cached.',
+    }
+
+    _cached: bool
+    _canonical_cache: tuple[dict, bytes] | None
+    _frozen_json: str | None
+    _hash_cache: tuple[bytes, str] | None
+    _linked: bool
+    _parent_refs: Any
+    _validated: bool
+    _wire_cache: dict | None
+
+    _initial_state = {'_frozen_json': None, '_wire_cache': None, '_cached': False, '_parent_refs': None}
+    """Slots `__new__` fills in, since they're read before they're first assigned; the rest start unset."""
+
+    _transient_state = frozenset({'_canonical_cache', '_hash_cache', '_linked', '_parent_refs', '_wire_cache'})
+    """Slots left out when pickling or copying: caches, and links to this process's parents."""
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> Self:
+        # Slots have no class-level defaults, so the state every serialization reads is filled in
+        # before `__init__` assigns the fields. Unrolled: this runs for every block built.
+        self = _new(cls)
+        _set(self, '_frozen_json', None)
+        _set(self, '_wire_cache', None)
+        _set(self, '_cached', False)
+        _set(self, '_parent_refs', None)
+        return self
+
+    def __getstate__(self) -> dict[str, Any]:
+        transient = self._transient_state
+        return {
+            name: getattr(self, name)
+            for name in _slot_names(type(self))
+            if name not in transient and hasattr(self, name)
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        # Not through `__setattr__`: a frozen instance's fields are restored after `_frozen_json`.
+        for name, value in state.items():
+            _set(self, name, value)
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # `@dataclass` makes classes that compare by value unhashable unless they define `__hash__`.
+        if cls.__dict__.get('__hash__') is None:
+            cls.__hash__ = SerializableMixin.__hash__  # type: ignore[method-assign]
+
+    def __hash__(self) -> int:
+        if self._frozen_json is None:
+            raise TypeError(f'unhashable type: {type(self).__name__!r} (freeze() it first)')
+        # The canonical form sorts keys, so equal instances hash equally however they were built.
+        return hash(self.content_hash())
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._frozen_json is None:
+            # Schema classes' compiled `__init__` doesn't come through here; other `__init__`s set
+            # each field once before it has a value, and only later assignments are checked.
+            if assignment_checks_enabled() and hasattr(self, name):
+                check_assignment(self, name, value)
+            _set(self, name, value)
+            if self._cached:
+                _cache_subtree(value)
+                if self._wire_cache is not None:
+                    self._invalidate()
+        elif name[0] == '_':
+            object.__setattr__(self, name, value)
+        else:
+            raise FrozenBlockError(f'Cannot set {name!r} on a frozen {type(self).__name__}')
+
+    def _invalidate(self) -> None:
+        """Drop the cached form of this instance and of every cached ancestor."""
+        if self._frozen_json is not None:
+            return
+        object.__setattr__(self, '_wire_cache', None)
+        object.__setattr__(self, '_canonical_cache', None)
+        object.__setattr__(self, '_hash_cache', None)
+
+        if self._parent_refs is not None:
+            parents = parent_refs(self)
+            object.__setattr__(self, '_parent_refs', None)
+            for parent in parents:
+                parent.mark_dirty()
+
+    def mark_dirty(self) -> Self:
+        """Invalidate the cached serialization after an in-place change."""
+        self._invalidate()
+        if self._cached:
+            self._cache_children()
+        return self
+
+    def cache(self) -> Self:
+        """Cache the serialized form of this subtree between calls, and track changes to it.
 
-    def to_dict(self) -> dict:
-        """Return dictionary representation."""
+        For layouts serialized more than once, e.g. sent to many channels: an
+        unchanged layout is then served from the cache, and after an edit only
+        the changed path is rebuilt. Blocks assigned or added to a cached
+        block later are cached too.
+        """
+        if not self._cached:
+            _set(self, '_cached', True)
+            self._cache_children()
+        return self
+
+    def _cache_children(self) -> None:
+        for name in wire_fields(type(self)):
+            _cache_subtree(getattr(self, name))
+
+    @property
+    def is_frozen(self) -> bool:
+        """Whether the subtree has been frozen with `freeze()`."""
+        return self._frozen_json is not None
+
+    @property
+    def is_validated(self) -> bool:
+        """Whether the subtree is frozen and known to pass `validate_tree()`."""
+        return self._frozen_json is not None and self._validated
+
+    def freeze(self) -> Self:
+        """Validate and pre-encode this subtree so it can be spliced into payloads verbatim.
+
+        Child blocks and elements are frozen too, list fields become tuples
+        (`to_dict()` still emits lists), and any further assignment to a wire
+        field raises `FrozenBlockError`.
+
+        Freezing in `strict` mode validates the subtree, and marks it so
+        `validate_tree()` can skip it wherever it's reused.
+        """
+        if self._frozen_json is not None:
+            return self
+
+        validated = validation_mode() is ValidationMode.STRICT
+        for name in wire_fields(type(self)):
+            value = getattr(self, name)
+            if isinstance(value, SerializableMixin):
+                value.freeze()
+                validated = validated and value.is_validated
+            elif isinstance(value, (list, tuple)):
+                for item in value:
+                    if isinstance(item, SerializableMixin):
+                        item.freeze()
+                        validated = validated and item.is_validated
+                if isinstance(value, list):
+                    object.__setattr__(self, name, tuple(value))
+
+        post_init = getattr(self, '__post_init__', None)
+        if post_init is not None:
+            post_init()
+
+        self._invalidate()
+        object.__setattr__(self, '_cached', True)
+        object.__setattr__(self, '_validated', validated)
+        object.__setattr__(self, '_frozen_json', json.dumps(self.to_dict()))
+        # Frozen children never change, so the cached form needs no links to them.
+        object.__setattr__(self, '_linked', True)
+        object.__setattr__(self, '_parent_refs', None)
+        return self
+
+    def _frozen_with(self, name: str, items: Iterable[Any]) -> Self:
+        """Return a frozen copy of this frozen instance with `items` appended to the list field `name`.
+
+        The copy shares every other field, the items already there, and their
+        pre-encoded JSON with this instance; nothing is rebuilt or revalidated.
+        Only the new items are frozen, and only the checks on `name` run, in
+        the current validation mode.
+        """
+        items = tuple(items)
+        value = (*(getattr(self, name) or ()), *items)
+        check_assignment(self, name, value, items)
+
+        validated = self._validated and validation_mode() is ValidationMode.STRICT
+        for item in items:
+            if isinstance(item, SerializableMixin):
+                item.freeze()
+                validated = validated and item.is_validated
+
+        data = dict(self.to_dict())
+        data[name] = [*data.get(name, ()), *(serialize(item) for item in items if item is not None)]
+        # Spliced from the items' pre-encoded JSON; the same text `json.dumps(data)` would produce.
+        parts = []
+        for key, field_data in data.items():
+            if key == name:
+                encoded = '[' + ', '.join(_frozen_json_of(item) for item in value if item is not None) + ']'
+            else:
+                encoded = json.dumps(field_data)
+            parts.append(f'{json.dumps(key)}: {encoded}')
+
+        copy = _new(type(self))
+        for slot in _slot_names(type(self)):
+            if hasattr(self, slot):
+                _set(copy, slot, getattr(self, slot))
+        _set(copy, name, value)
+        _set(copy, '_canonical_cache', None)
+        _set(copy, '_hash_cache', None)
+        _set(copy, '_linked', True)
+        _set(copy, '_parent_refs', None)
+        _set(copy, '_validated', validated)
+        _set(copy, '_wire_cache', data)
+        _set(copy, '_frozen_json', '{' + ', '.join(parts) + '}')
+        return copy
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Self:
+        """Build an instance from its dictionary representation.
+
+        Nested blocks and elements are decoded into their typed classes by
+        `type`. If `data` has a `type`, it may decode into a subclass of `cls`
+        (e.g. `SectionBlockSchema.from_dict` returns a `SectionBlock`).
+        """
+        return decode(data, cls)
+
+    @classmethod
+    def from_json(cls, text: str | bytes) -> Self:
+        """Build an instance from its JSON representation."""
+        return cls.from_dict(json.loads(text))
+
+    def to_dict(self, minimal: bool = False) -> dict:
+        """Return dictionary representation, without `None` values.
+
+        The result may be cached and shared with parent blocks (see `cache()`); treat it as read-only.
+
+        Args:
+            minimal: Also omit fields left at Slack's default value. Not cached.
+        """
         if is_dataclass(self):
-            return asdict(self)
+            if minimal:
+                return get_minimal_serializer(type(self))(self)
+            return get_serializer(type(self))(self)
         elif isinstance(self, dict):
             return self
         else:
             raise ValueError(f'Invalid type: {type(self)}')
 
-    def to_json(self) -> str:
-        """Return JSON string representation."""
-        dict_repr = remove_none(self.to_dict())
-        return json.dumps(dict_repr)
+    def to_json(self, minimal: bool = False) -> str:
+        """Return JSON string representation.
+
+        Args:
+            minimal: Omit fields left at Slack's default value and use compact separators.
+        """
+        if minimal:
+            return json.dumps(self.to_dict(minimal=True), separators=COMPACT_SEPARATORS)
+        if self._frozen_json is not None:
+            return self._frozen_json
+        return json.dumps(self.to_dict())
+
+    def to_canonical_bytes(self) -> bytes:
+        """Return canonical JSON: sorted keys, compact, UTF-8, without `None` values."""
+        return to_canonical_bytes(self)
+
+    def content_hash(self) -> str:
+        """Return the SHA-256 of `to_canonical_bytes()`, e.g. for deduplication or ETags.
+
+        On cached blocks (see `cache()`), kept until this block or one of its children changes.
+        """
+        return content_hash(self)
+
+    def to_binary(self) -> bytes:
+        """Return the compact binary encoding of `to_dict()`, for storage."""
+        return binary.encode(self)
+
+    @classmethod
+    def from_binary(cls, data: bytes) -> Self:
+        """Restore an instance from `to_binary()` output, without re-running validation."""
+        result = binary.decode_objects(data, cls)
+        if not isinstance(result, cls):
+            raise DecodeError(f'Expected {cls.__name__}, got {type(result).__name__}')
+        return result
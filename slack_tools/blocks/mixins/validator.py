@@ -1,10 +1,106 @@
-from typing import TypeVar, Union, get_args, get_origin
+import types
+import typing
+from typing import Any, Callable, ClassVar, TypeVar, Union, get_args, get_origin
 
 T = TypeVar('T')
 
+TypeCheck = Callable[[Any], None]
+"""Raises `ValueError` if a (non-`None`) field value doesn't match the field's annotation."""
+
+
+def _union_members(annotation: Any) -> tuple:
+    """Return the members of a `Union`/`X | Y` annotation (without `None`), or the annotation itself."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        return tuple(member for member in get_args(annotation) if member is not type(None))
+    return (annotation,)
+
+
+def _class_of(annotation: Any) -> type | None:
+    """Return the class `isinstance` should check for an annotation, if there is one."""
+    if isinstance(annotation, type):
+        return annotation
+    origin = get_origin(annotation)
+    return origin if isinstance(origin, type) else None
+
+
+def _classes_of(members: tuple) -> tuple[type, ...]:
+    """Return the class of each member, or an empty tuple if any of them has none."""
+    classes = tuple(cls for cls in map(_class_of, members) if cls is not None)
+    return classes if len(classes) == len(members) else ()
+
+
+def _names(classes: tuple[type, ...]) -> str:
+    return ' or '.join(cls.__name__ for cls in classes)
+
+
+def compile_type_check(field_name: str, annotation: Any) -> TypeCheck | None:
+    """Resolve an annotation into a check against cached class tuples.
+
+    Handles plain classes, `Optional`/`Union`/`X | Y`, and `list[...]` of those.
+    A `list[...]` also accepts a collection whose `item_class` is one of its
+    element classes (e.g. `OptionSet` for `list[Option]`), without checking
+    each item. Returns `None` for annotations `isinstance` can't check (e.g. `Any`, `Literal`).
+    """
+    members = _union_members(annotation)
+    classes = _classes_of(members)
+    if not classes:
+        return None
+
+    element_classes: tuple[type, ...] | None = None
+    for member, cls in zip(members, classes):
+        if cls is list:
+            args = get_args(member)
+            elements = _classes_of(_union_members(args[0])) if args else (object,)
+            if not elements:
+                return None
+            element_classes = (element_classes or ()) + elements
+
+    message = f'{field_name} must be an instance of {_names(classes)}'
+    if element_classes is None:
+
+        def check(value: Any) -> None:
+            if not isinstance(value, classes):
+                raise ValueError(message)
+
+        return check
+
+    sequence_classes = tuple(dict.fromkeys(classes + (tuple,)))
+    element_message = f'All elements in {field_name} must be instances of {_names(element_classes)}'
+
+    def check_elements(value: Any) -> None:
+        if not isinstance(value, sequence_classes):
+            item_class = getattr(value.__class__, 'item_class', None)
+            if item_class is not None and issubclass(item_class, element_classes):
+                return
+            raise ValueError(message)
+        if isinstance(value, (list, tuple)):
+            for element in value:
+                if not isinstance(element, element_classes):
+                    raise ValueError(element_message)
+
+    return check_elements
+
+
+def compile_type_checks(annotations: dict[str, Any]) -> dict[str, TypeCheck | None]:
+    """Compile a check for each annotated field; string annotations are left for later."""
+    return {
+        name: compile_type_check(name, annotation)
+        for name, annotation in annotations.items()
+        if not isinstance(annotation, str) and get_origin(annotation) is not ClassVar
+    }
+
 
 class TypeValidatorMixin:
-    """Mixin to validate field types in block schemas."""
+    """Mixin to validate field types in block schemas.
+
+    `BlockMetaclass` compiles each annotated field into a check when the class
+    is created, so validation is an `isinstance` against a cached tuple.
+    """
+
+    __slots__ = ()
+
+    _type_checks: ClassVar[dict[str, TypeCheck | None]] = {}
+    """Compiled checks by field name, set per class by `BlockMetaclass`."""
 
     def validate_field_type(self, field_name: str) -> None:
         """Validate that a field's value matches its type annotation.
@@ -16,45 +112,24 @@ class TypeValidatorMixin:
             ValueError: If field value doesn't match the type annotation
             AttributeError: If field doesn't exist
         """
-        value = getattr(self, field_name)
-        if value is None:
-            return
+        self.check_field_type(field_name, getattr(self, field_name))
 
-        field_type = self.__annotations__[field_name]
-        origin_type = get_origin(field_type)
-
-        # Handle Optional/Union types
-        if origin_type is Union:
-            allowed_types = get_args(field_type)
-            # Filter out NoneType for Optional fields
-            allowed_types = tuple(t for t in allowed_types if t != type(None))
-            if not isinstance(value, allowed_types):
-                type_names = ' or '.join(t.__name__ for t in allowed_types)
-                raise ValueError(f'{field_name} must be an instance of {type_names}')
-            return
+    def check_field_type(self, field_name: str, value: Any) -> None:
+        """Validate that `value` matches a field's type annotation, e.g. before assigning it.
 
-        # Handle list types
-        if origin_type is list:
-            element_type = get_args(field_type)[0]
-            element_origin = get_origin(element_type)
-
-            # Handle Union types within lists
-            if element_origin is Union:
-                allowed_types = get_args(element_type)
-                if not all(isinstance(elem, allowed_types) for elem in value):
-                    type_names = ' or '.join(t.__name__ for t in allowed_types)
-                    raise ValueError(
-                        f'All elements in {field_name} must be instances of {type_names}'
-                    )
-            else:
-                if not all(isinstance(elem, element_type) for elem in value):
-                    raise ValueError(
-                        f'All elements in {field_name} must be instances of {element_type.__name__}'
-                    )
+        Raises:
+            ValueError: If `value` doesn't match the type annotation
+            KeyError: If the field isn't annotated
+        """
+        if value is None:
             return
 
-        # Handle single value types (non-Union)
-        if not isinstance(value, field_type):
-            # For non-Union types, we can use __name__ directly
-            type_name = getattr(field_type, '__name__', str(field_type))
-            raise ValueError(f'{field_name} must be an instance of {type_name}')
+        checks = self._type_checks
+        try:
+            check = checks[field_name]
+        except KeyError:
+            # A forward reference, resolvable now that its module has loaded.
+            annotation = typing.get_type_hints(type(self))[field_name]
+            check = checks[field_name] = compile_type_check(field_name, annotation)
+        if check is not None:
+            check(value)
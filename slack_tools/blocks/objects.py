@@ -1,5 +1,15 @@
-from slack_tools.blocks.schemas.objects import OptionSchema
+from dataclasses import fields
+from itertools import repeat
+from typing import Any, Iterable, Iterator, Mapping, Self, Sequence, overload
+
+from slack_tools.blocks.schemas.objects import OptionSchema, PlainTextSchema
 from slack_tools.blocks.text import PlainText
+from slack_tools.blocks.validation import validation_mode
+from slack_tools.exceptions import LengthValidationError
+from slack_tools.serialization.encoder import register_serializer
+from slack_tools.utils import contains_emoji
+
+__all__ = ['Option', 'OptionSet']
 
 
 class Option(OptionSchema):
@@ -20,3 +30,165 @@ class Option(OptionSchema):
             description=PlainText(text=description) if description else None,
             url=url,
         )
+
+
+_TEXT_MAX_LENGTH: int = next(f.metadata['max_length'] for f in fields(PlainTextSchema) if f.name == 'text')
+
+
+class OptionSet:
+    """Options stored as parallel columns, for large static menus, checkboxes and radio buttons.
+
+    Accepted wherever a list of `Option`s is (`options=`, `initial_options=`,
+    option groups), and serialized straight from its columns into the same
+    JSON the `Option`s would produce, without creating an object per option.
+    The serialized list is built once, and shared by every menu using the set.
+
+        menu = StaticSelectMenu(options=OptionSet.from_records((user.name, user.id) for user in users))
+
+    Indexing or iterating a set creates the `Option`s, e.g. when options are
+    added to it with `menu[option]`; slicing it gives a new set.
+
+    Args:
+        texts: The option labels.
+        values: The option values, one per label.
+        descriptions: Descriptions, one per label (`None` or empty for none).
+        urls: URLs (for overflow menus), one per label (`None` for none).
+
+    Raises:
+        ValueError: If the columns have different lengths, or (in `strict`
+            mode) hold something other than strings.
+        LengthValidationError: If a label or description is over the text
+            object limit (in `strict` and `fast` mode).
+    """
+
+    __slots__ = ('_wire', 'descriptions', 'texts', 'urls', 'values')
+
+    item_class = Option
+    """What the set holds, for the type checks of `list[Option]` fields."""
+
+    def __init__(
+        self,
+        texts: Iterable[str],
+        values: Iterable[str],
+        descriptions: Iterable[str | None] | None = None,
+        urls: Iterable[str | None] | None = None,
+    ):
+        self.texts = tuple(texts)
+        self.values = tuple(values)
+        self.descriptions = None if descriptions is None else tuple(descriptions)
+        self.urls = None if urls is None else tuple(urls)
+        self._wire: list[dict] | None = None
+        self._validate()
+
+    @classmethod
+    def from_values(cls, values: Iterable[str]) -> Self:
+        """Build a set whose labels are the values themselves."""
+        values = tuple(values)
+        return cls(values, values)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Sequence[str | None] | Mapping[str, str | None]]) -> Self:
+        """Build a set from `(text, value[, description[, url]])` tuples or `text`/`value`/... mappings."""
+        rows = [
+            (row['text'], row['value'], row.get('description'), row.get('url')) if isinstance(row, Mapping) else row
+            for row in records
+        ]
+        columns = [list(column) for column in zip(*(tuple(row) + (None,) * (4 - len(row)) for row in rows))]
+        if not columns:
+            return cls((), ())
+        texts, values, descriptions, urls = columns
+        return cls(
+            texts,
+            values,
+            descriptions if any(descriptions) else None,
+            urls if any(url is not None for url in urls) else None,
+        )
+
+    def _validate(self) -> None:
+        count = len(self.texts)
+        columns = {'values': self.values, 'descriptions': self.descriptions, 'urls': self.urls}
+        for name, column in columns.items():
+            if column is not None and len(column) != count:
+                raise ValueError(f'OptionSet has {count} texts but {len(column)} {name}')
+
+        mode = validation_mode()
+        if mode.checks_rules:
+            if not all(text.__class__ is str for text in self.texts):
+                raise ValueError('OptionSet texts must be strings')
+            if not all(value.__class__ is str for value in self.values):
+                raise ValueError('OptionSet values must be strings')
+            for name in ('descriptions', 'urls'):
+                column = columns[name]
+                if column is not None and not all(item is None or item.__class__ is str for item in column):
+                    raise ValueError(f'OptionSet {name} must be strings or None')
+        if mode.checks_lengths:
+            for name, column in (('texts', self.texts), ('descriptions', self.descriptions)):
+                if column and max(len(item or '') for item in column) > _TEXT_MAX_LENGTH:
+                    index, item = next((i, item) for i, item in enumerate(column) if len(item or '') > _TEXT_MAX_LENGTH)
+                    raise LengthValidationError(f'{name}[{index}]', len(item or ''), None, _TEXT_MAX_LENGTH)
+
+    def __len__(self) -> int:
+        return len(self.texts)
+
+    @overload
+    def __getitem__(self, index: int) -> Option: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Self: ...
+
+    def __getitem__(self, index: int | slice) -> Option | Self:
+        if isinstance(index, slice):
+            return type(self)(
+                self.texts[index],
+                self.values[index],
+                None if self.descriptions is None else self.descriptions[index],
+                None if self.urls is None else self.urls[index],
+            )
+        return Option.create(
+            self.texts[index],
+            value=self.values[index],
+            description=None if self.descriptions is None else self.descriptions[index],
+            url=None if self.urls is None else self.urls[index],
+        )
+
+    def __iter__(self) -> Iterator[Option]:
+        return (self[index] for index in range(len(self.texts)))
+
+    def __eq__(self, other: Any) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._columns() == other._columns()
+
+    def __hash__(self) -> int:
+        return hash(self._columns())
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({len(self)} options)'
+
+    def _columns(self) -> tuple:
+        return self.texts, self.values, self.descriptions, self.urls
+
+    def to_list(self) -> list[dict]:
+        """Return the options as `Option.to_dict()` would, in a list; cached, so treat it as read-only."""
+        if self._wire is None:
+            descriptions = repeat(None) if self.descriptions is None else self.descriptions
+            urls = repeat(None) if self.urls is None else self.urls
+            wire = []
+            for text, value, description, url in zip(self.texts, self.values, descriptions, urls):
+                option: dict[str, Any] = {'text': _plain_text(text), 'value': value}
+                if description:
+                    option['description'] = _plain_text(description)
+                if url is not None:
+                    option['url'] = url
+                wire.append(option)
+            self._wire = wire
+        return self._wire
+
+
+def _plain_text(text: str) -> dict:
+    """The wire form of `PlainText(text=text)`; emoji are never ASCII, so most labels skip the search."""
+    return {'text': text, 'emoji': not text.isascii() and contains_emoji(text), 'type': 'plain_text'}
+
+
+# `Option` has no Slack-default fields, so its minimal form is its full form.
+register_serializer(OptionSet, OptionSet.to_list, minimal=OptionSet.to_list)
@@ -16,6 +16,8 @@ class BaseSchema(SerializableMixin):
     ensuring that everything plays nicely with Slack's structure.
     """
 
+    __slots__ = ()
+
 
 class BaseObject(BaseSchema, metaclass=BlockMetaclass):
     """Base class for Block Kit `Composition Objects`.
@@ -72,7 +74,7 @@ class BaseLayout(BaseSchema, metaclass=BlockMetaclass):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class BaseBlock(BaseLayout, metaclass=BlockMetaclass):
     """Base class for `Blocks`.
 
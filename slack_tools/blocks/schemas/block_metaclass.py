@@ -1,47 +1,96 @@
 from abc import ABCMeta
-from dataclasses import Field
-from typing import Any, Type
+from dataclasses import MISSING, Field, InitVar, fields
+from typing import Any, Callable, Type
 
-from slack_tools.exceptions import LengthValidationError
+from slack_tools.blocks.constraints import compile_checks, compile_field_checks
+from slack_tools.blocks.mixins.validator import TypeCheck, compile_type_checks
+from slack_tools.blocks.validation import validation_mode
 
 
-class FieldValidator:
-    """Handles validation of field constraints like min/max length."""
+class _Factory:
+    """Default of fields with a `default_factory` in compiled `__init__` signatures."""
 
-    @staticmethod
-    def validate_length(field_name: str, value: Any, field: Field):
-        """Validates that the value meets min/max length constraints."""
-        if value is None or value == field.default:
-            return  # Skip validation for None or default values
-
-        metadata = field.metadata
-        min_length = metadata.get('min_length')
-        max_length = metadata.get('max_length')
-
-        if min_length is None and max_length is None:
-            return  # No length constraints
-
-        value_length = (
-            len(value)
-            if isinstance(value, (str, list, tuple, dict))
-            else len(str(value))
-        )
+    def __repr__(self) -> str:
+        return '<factory>'
+
+
+_FACTORY = _Factory()
 
-        if (min_length and value_length < min_length) or (
-            max_length and value_length > max_length
-        ):
-            raise LengthValidationError(
-                field_name, value_length, min_length, max_length
-            )
+
+def compile_init(cls: type) -> Callable[..., None] | None:
+    """Generate an `__init__` for a slotted schema dataclass that stores fields with `object.__setattr__`.
+
+    It takes the same arguments as the one `@dataclass` writes, but skips the
+    class's `__setattr__` hook (assignment checks, dirty tracking), which only
+    applies to fields that already have a value. Returns `None` for classes
+    with `InitVar`s, which keep the generated `__init__`.
+    """
+    if any(isinstance(f.type, InitVar) for f in cls.__dataclass_fields__.values()):  # type: ignore[attr-defined]
+        return None
+
+    namespace: dict[str, Any] = {'FACTORY': _FACTORY, 'SET': object.__setattr__}
+    positional: list[str] = []
+    keyword: list[str] = []
+    body: list[str] = []
+    for index, f in enumerate(fields(cls)):
+        if f.default is not MISSING:
+            namespace[f'DEFAULT_{index}'] = f.default
+            default, value = f'DEFAULT_{index}', f.name
+        elif f.default_factory is not MISSING:
+            namespace[f'FACTORY_{index}'] = f.default_factory
+            default, value = 'FACTORY', f'FACTORY_{index}() if {f.name} is FACTORY else {f.name}'
+        else:
+            default, value = None, f.name
+
+        if f.init:
+            param = f.name if default is None else f'{f.name}={default}'
+            (keyword if f.kw_only else positional).append(param)
+        elif default is None:
+            continue
+        elif default == 'FACTORY':
+            value = f'FACTORY_{index}()'
+        else:
+            value = default
+        body.append(f'    SET(self, {f.name!r}, {value})')
+
+    if hasattr(cls, '__post_init__'):
+        body.append('    self.__post_init__()')
+    if not body:
+        body.append('    pass')
+    params = ', '.join(['self', *positional, *(['*', *keyword] if keyword else [])])
+    exec('\n'.join([f'def __init__({params}):', *body]), namespace)
+
+    init = namespace['__init__']
+    generated = cls.__dict__['__init__']
+    init.__qualname__ = f'{cls.__qualname__}.__init__'
+    init.__doc__ = generated.__doc__
+    init.__annotations__ = dict(getattr(generated, '__annotations__', {}))
+    return init
 
 
 class BlockMetaclass(ABCMeta):
     """Metaclass for Block Kit schemas.
 
     - Automatically sets the `type` attribute for blocks.
-    - Runs validation on fields using standalone validators.
+    - Compiles the class's field length limits and declared `_constraints`
+      into straight-line checks, run after `__post_init__` unless the
+      validation mode is `off` or `deferred`.
+    - Compiles the type checks used by `TypeValidatorMixin` once per class.
+    - Keeps a `type` -> class registry, used to decode payloads.
+    - Gives classes that declare no fields (the `Base*` categories, builder
+      facades) empty `__slots__`, so the slotted dataclasses below and above
+      them keep instances free of a `__dict__`. Schema classes that declare
+      fields are `@dataclass(slots=True)`, which rebuilds the class; the
+      rebuilt class replaces the original in the registry, and gets an
+      `__init__` from `compile_init()` that skips the `__setattr__` hook.
     """
 
+    registry: dict[str, type] = {}
+    """Schema class for each `block_type`."""
+
+    facades: dict[type, type] = {}
+    """Builder class (e.g. `Button`) for each schema class it wraps without adding fields."""
+
     def __new__(
         mcls: Type['BlockMetaclass'],
         name: str,
@@ -55,8 +104,61 @@ class BlockMetaclass(ABCMeta):
             mcls.set_block_type(namespace, block_type)
             fields = mcls.extract_fields(namespace)
             mcls.inject_post_init(namespace, fields)
-
-        return super().__new__(mcls, name, bases, namespace, **kwargs)
+        if '__slots__' not in namespace and not namespace.get('__annotations__'):
+            namespace['__slots__'] = ()
+
+        cls = super().__new__(mcls, name, bases, namespace, **kwargs)
+        if '__dataclass_fields__' in namespace and '__init__' in namespace:
+            init = compile_init(cls)
+            if init is not None:
+                cls.__init__ = init  # type: ignore[misc]
+        mcls._register_schema(cls, bases, namespace, block_type)
+        mcls.attach_type_checks(cls, bases, namespace)
+        return cls
+
+    @classmethod
+    def attach_type_checks(mcls, cls: type, bases: tuple, namespace: dict[str, Any]):
+        """Sets `_type_checks`: the inherited checks plus one per field annotated here."""
+        checks: dict[str, TypeCheck | None] = {}
+        for base in reversed(bases):
+            checks.update(getattr(base, '_type_checks', {}))
+        checks.update(compile_type_checks(namespace.get('__annotations__', {})))
+        cls._type_checks = checks  # type: ignore[attr-defined]
+
+    @classmethod
+    def _register_schema(
+        mcls,
+        cls: type,
+        bases: tuple,
+        namespace: dict[str, Any],
+        block_type: str | None,
+    ):
+        """Records `cls` in the registry, or as the facade of its schema base."""
+        if block_type is not None:
+            mcls.registry.setdefault(block_type, cls)
+            return
+        if '__dataclass_fields__' in namespace:
+            # `dataclass(slots=True)` rebuilding a class declared with `block_type`.
+            for key, registered in mcls.registry.items():
+                if registered.__module__ == cls.__module__ and registered.__qualname__ == cls.__qualname__:
+                    mcls.registry[key] = cls
+            return
+
+        # The abstract `Base*` categories in `schemas.base` are not schemas.
+        schema_bases = [
+            base
+            for base in bases
+            if isinstance(base, BlockMetaclass)
+            and base.__module__ != 'slack_tools.blocks.schemas.base'
+        ]
+        if len(schema_bases) == 1 and not namespace.get('__annotations__'):
+            mcls.facades[schema_bases[0]] = cls
+
+    @classmethod
+    def lookup(mcls, block_type: str | None) -> type | None:
+        """Returns the class to decode a `block_type` into, preferring its facade."""
+        cls = mcls.registry.get(block_type)  # type: ignore[arg-type]
+        return mcls.facades.get(cls, cls) if cls is not None else None
 
     @staticmethod
     def set_block_type(namespace: dict[str, Any], block_type: str):
@@ -85,16 +187,33 @@ class BlockMetaclass(ABCMeta):
 
     @staticmethod
     def inject_post_init(namespace: dict[str, Any], fields: dict[str, Field]):
-        """Wraps `__post_init__` to perform field validation."""
+        """Wraps `__post_init__` to run the class's compiled rules and length checks.
+
+        The checks are generated by `compile_checks` from the fields' length
+        metadata and the class's `_constraints`, and kept in `_checks` as
+        `(rules, lengths)` for `validate_tree()`. The same limits, split by
+        field, are kept in `_field_checks` for validating assignments.
+        """
         original_post_init = namespace.get('__post_init__')
+        check_rules, check_lengths = compile_checks(
+            namespace.get('__qualname__', ''), fields, namespace.get('_constraints', ())
+        )
 
         def __post_init__(self):
             """Runs validation logic after object initialization."""
             if original_post_init:
                 original_post_init(self)
 
-            for field_name, field in fields.items():
-                value = getattr(self, field_name, None)
-                FieldValidator.validate_length(field_name, value, field)
+            mode = validation_mode()
+            if check_rules is not None and mode.checks_rules:
+                check_rules(self)
+            if check_lengths is not None and mode.checks_lengths:
+                check_lengths(self)
 
+        __post_init__.__wrapped__ = original_post_init  # type: ignore[attr-defined]
         namespace['__post_init__'] = __post_init__
+        namespace['_length_fields'] = fields
+        namespace['_checks'] = (check_rules, check_lengths)
+        namespace['_field_checks'] = compile_field_checks(
+            namespace.get('__qualname__', ''), fields, namespace.get('_constraints', ())
+        )
@@ -24,6 +24,7 @@ References:
 from dataclasses import dataclass, field
 from typing import Final, Literal
 
+from slack_tools.blocks.constraints import at_most, each_max_length, exactly_one_of, startswith
 from slack_tools.blocks.mixins.validator import TypeValidatorMixin
 from slack_tools.blocks.schemas.base import BaseBlock, BaseRichBlock
 from slack_tools.blocks.schemas.elements import (
@@ -36,6 +37,7 @@ from slack_tools.blocks.schemas.objects import (
     PlainTextSchema,
     SlackFileSchema,
 )
+from slack_tools.blocks.validation import validation_mode
 from slack_tools.mrkdwn.extras.text import Paragraph
 from slack_tools.mrkdwn.slack import Link
 from slack_tools.mrkdwn.syntax import (
@@ -54,7 +56,7 @@ from slack_tools.mrkdwn.syntax import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionsBlockSchema(BaseBlock, block_type='actions'):
     """Actions Block.
 
@@ -97,7 +99,7 @@ class ActionsBlockSchema(BaseBlock, block_type='actions'):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class ImageBlockSchema(BaseBlock, block_type='image'):
     """Image Block.
 
@@ -122,6 +124,11 @@ class ImageBlockSchema(BaseBlock, block_type='image'):
 
     _VALID_IMAGE_TYPES = ['png', 'jpg', 'jpeg', 'gif']
 
+    _constraints = (
+        exactly_one_of('image_url', 'slack_file'),
+        startswith('image_url', 'https://'),
+    )
+
     alt_text: str = field(
         metadata={
             'title': 'alt_text',
@@ -158,11 +165,8 @@ class ImageBlockSchema(BaseBlock, block_type='image'):
 
     def __post_init__(self):
         """Validate image types."""
-        if self.image_url and self.slack_file:
-            raise ValueError('Only one of image_url or slack_file can be provided.')
-
-        if self.image_url and not self.image_url.startswith('https://'):
-            raise ValueError('image_url must start with https://')
+        if not validation_mode().checks_rules:
+            return
 
         # check file types
         if self.slack_file and self.slack_file.source == 'remote':
@@ -170,7 +174,7 @@ class ImageBlockSchema(BaseBlock, block_type='image'):
                 raise ValueError('Invalid file type.')
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextBlockSchema(BaseBlock, TypeValidatorMixin, block_type='context'):
     """Context Block.
 
@@ -200,10 +204,11 @@ class ContextBlockSchema(BaseBlock, TypeValidatorMixin, block_type='context'):
 
     def __post_init__(self):
         """Validate elements types."""
-        self.validate_field_type('elements')
+        if validation_mode().checks_rules:
+            self.validate_field_type('elements')
 
 
-@dataclass
+@dataclass(slots=True)
 class DividerBlockSchema(BaseBlock, block_type='divider'):
     """Divider Block.
 
@@ -225,7 +230,7 @@ class DividerBlockSchema(BaseBlock, block_type='divider'):
     """
 
 
-@dataclass
+@dataclass(slots=True)
 class FileBlockSchema(BaseBlock, block_type='file'):
     """File Block.
 
@@ -262,11 +267,12 @@ class FileBlockSchema(BaseBlock, block_type='file'):
         metadata={
             'title': 'source',
             'description': 'At the moment, source will always be remote for a remote file.',
+            'emit_default': True,
         },
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class HeaderBlockSchema(BaseBlock, block_type='header'):
     """Header block that displays a larger-sized text.
 
@@ -294,7 +300,7 @@ class HeaderBlockSchema(BaseBlock, block_type='header'):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class SectionBlockSchema(BaseBlock, TypeValidatorMixin, block_type='section'):
     """Section block for displaying text and interactive elements.
 
@@ -366,26 +372,20 @@ class SectionBlockSchema(BaseBlock, TypeValidatorMixin, block_type='section'):
         },
     )
 
+    _constraints = (
+        exactly_one_of('text', 'fields'),
+        each_max_length('fields', 2000),
+    )
+
     def __post_init__(self):
         """Validate field types."""
-        self.validate_field_type('text')
-        self.validate_field_type('accessory')
-        self.validate_field_type('fields')
+        if validation_mode().checks_rules:
+            self.validate_field_type('text')
+            self.validate_field_type('accessory')
+            self.validate_field_type('fields')
 
-        if self.text is None and self.fields is None:
-            raise ValueError('text or fields is required.')
 
-        if self.text and self.fields:
-            raise ValueError('Only one of text or fields can be provided.')
-
-        # Validate `field` contents
-        if self.fields:
-            for field in self.fields:
-                if len(field.text) > 2000:
-                    raise ValueError('Maximum length for the text in each item is 2000 characters.')
-
-
-@dataclass
+@dataclass(slots=True)
 class InputBlockSchema(BaseBlock, block_type='input'):
     """Input Block.
     Collects information from users via block elements.
@@ -469,7 +469,7 @@ class InputBlockSchema(BaseBlock, block_type='input'):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class MarkdownBlockSchema(BaseBlock, block_type='markdown'):
     """Markdown block.
 
@@ -523,7 +523,7 @@ class MarkdownBlockSchema(BaseBlock, block_type='markdown'):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RichSectionSchema(BaseRichBlock, block_type='rich_text_section'):
     """Rich text section."""
 
@@ -536,13 +536,11 @@ class RichSectionSchema(BaseRichBlock, block_type='rich_text_section'):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RichTextListSchema(BaseRichBlock, block_type='rich_text_list'):
     """Rich text list."""
 
-    def __post_init__(self):
-        if self.indent is not None and self.indent > 8:
-            raise ValueError('indent must be less than 8.')
+    _constraints = (at_most('indent', 8),)
 
     elements: list[RichSectionSchema] | tuple[RichSectionSchema, ...] = field(
         default_factory=list,
@@ -587,7 +585,7 @@ class RichTextListSchema(BaseRichBlock, block_type='rich_text_list'):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RichPreformattedSchema(BaseRichBlock, block_type='rich_text_preformatted'):
     """Rich text preformatted."""
 
@@ -607,7 +605,7 @@ class RichPreformattedSchema(BaseRichBlock, block_type='rich_text_preformatted')
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RichQuoteSchema(BaseRichBlock, block_type='rich_text_quote'):
     """Rich text quote."""
 
@@ -627,7 +625,7 @@ class RichQuoteSchema(BaseRichBlock, block_type='rich_text_quote'):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class RichTextBlockSchema(BaseBlock, block_type='rich_text'):
     """Rich Text Block.
 
@@ -676,7 +674,7 @@ class RichTextBlockSchema(BaseBlock, block_type='rich_text'):
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class VideoBlockSchema(BaseBlock, block_type='video'):
     """Video block for embedding video content in Slack.
 
@@ -11,7 +11,7 @@ from slack_tools.blocks.schemas.objects import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class ButtonSchema(BaseInteractiveElement, block_type='button'):
     """Button. Allows users a direct path to performing basic actions.
 
@@ -38,7 +38,7 @@ class ButtonSchema(BaseInteractiveElement, block_type='button'):
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckboxesSchema(BaseInteractiveElement, block_type='checkboxes'):
     """Checkbox Collection.
 
@@ -52,7 +52,7 @@ class CheckboxesSchema(BaseInteractiveElement, block_type='checkboxes'):
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RadioButtonsSchema(BaseInteractiveElement, block_type='radio_buttons'):
     """Radio Buttons.
 
@@ -64,7 +64,7 @@ class RadioButtonsSchema(BaseInteractiveElement, block_type='radio_buttons'):
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EmailInputSchema(BaseInteractiveElement, block_type='email_text_input'):
     """Email Input."""
 
@@ -75,7 +75,7 @@ class EmailInputSchema(BaseInteractiveElement, block_type='email_text_input'):
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PlainTextInputSchema(BaseInteractiveElement, block_type='plain_text_input'):
     """Plain Text Input."""
 
@@ -89,7 +89,7 @@ class PlainTextInputSchema(BaseInteractiveElement, block_type='plain_text_input'
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class URLInputSchema(BaseInteractiveElement, block_type='url_text_input'):
     """URL Input."""
 
@@ -100,11 +100,18 @@ class URLInputSchema(BaseInteractiveElement, block_type='url_text_input'):
     action_id: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NumberInputSchema(BaseInteractiveElement, block_type='number_input'):
     """Number Input."""
 
-    is_decimal_allowed: bool = False
+    is_decimal_allowed: bool = field(
+        default=False,
+        metadata={
+            'title': 'is_decimal_allowed',
+            'description': 'Whether decimal numbers are allowed. Required by Slack, so always sent.',
+            'emit_default': True,
+        },
+    )
     min_value: int | float | None = None
     max_value: int | float | None = None
     dispatch_action_config: DispatchActionConfigSchema | None = None
@@ -117,7 +124,7 @@ class NumberInputSchema(BaseInteractiveElement, block_type='number_input'):
 #
 # File block_block_type Element
 #
-@dataclass
+@dataclass(slots=True)
 class FileInputSchema(BaseInteractiveElement, block_type='file_input'):
     """File Input."""
 
@@ -129,7 +136,7 @@ class FileInputSchema(BaseInteractiveElement, block_type='file_input'):
 #
 # Date and Time block_type Elements
 #
-@dataclass
+@dataclass(slots=True)
 class DatePickerSchema(BaseInteractiveElement, block_type='datepicker'):
     """Datepicker."""
 
@@ -139,7 +146,7 @@ class DatePickerSchema(BaseInteractiveElement, block_type='datepicker'):
     placeholder: PlainTextSchema | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class DateTimePickerSchema(BaseInteractiveElement, block_type='datetimepicker'):
     """DateTime Picker."""
 
@@ -148,7 +155,7 @@ class DateTimePickerSchema(BaseInteractiveElement, block_type='datetimepicker'):
     focus_on_load: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TimePickerSchema(BaseInteractiveElement, block_type='timepicker'):
     """Time Picker."""
 
@@ -10,7 +10,7 @@ from slack_tools.mrkdwn.base import SyntaxToken
 from slack_tools.utils import contains_emoji
 
 
-@dataclass
+@dataclass(slots=True)
 class PlainTextSchema(BaseObject, block_type='plain_text'):
     """Plain Text: Defines an object containing some text.
 
@@ -26,7 +26,17 @@ class PlainTextSchema(BaseObject, block_type='plain_text'):
             'max_length': 3000,
         },
     )
-    emoji: bool = False
+    emoji: bool = field(
+        default=False,
+        metadata={
+            'title': 'emoji',
+            'description': """
+                Indicates whether emojis in a text field should be escaped into the
+                colon emoji format. Slack defaults to true, so this is always sent.
+            """,
+            'emit_default': True,
+        },
+    )
 
     def __post_init__(self):
         if contains_emoji(self.text):
@@ -36,7 +46,7 @@ class PlainTextSchema(BaseObject, block_type='plain_text'):
         return self.text
 
 
-@dataclass
+@dataclass(slots=True)
 class MarkdownTextSchema(BaseObject, block_type='mrkdwn'):
     """Markdown Text: Defines an object containing some text.
 
@@ -50,8 +60,11 @@ class MarkdownTextSchema(BaseObject, block_type='mrkdwn'):
         if isinstance(self.text, SyntaxToken):
             self.text = str(self.text)
 
+    def __str__(self) -> str:
+        return self.text
+
 
-@dataclass
+@dataclass(slots=True)
 class ConfirmationDialogSchema(BaseObject):
     """Confirmation Dialog: A confirmation dialog step.
 
@@ -65,7 +78,7 @@ class ConfirmationDialogSchema(BaseObject):
     style: ButtonStyle | None = 'primary'
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationFilterSchema(BaseObject):
     """Filter."""
 
@@ -74,7 +87,7 @@ class ConversationFilterSchema(BaseObject):
     exclude_bot_users: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class DispatchActionConfigSchema(BaseObject):
     """Dispatch action config.
 
@@ -84,7 +97,7 @@ class DispatchActionConfigSchema(BaseObject):
     trigger_actions_on: list[KeyboardEvent]
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionSchema(BaseObject):
     """Option: An item in a number of item selection elements.
 
@@ -97,7 +110,7 @@ class OptionSchema(BaseObject):
     url: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class OptionGroupSchema(BaseObject):
     """Option Group: Defines a way to group options in a menu.
 
@@ -110,7 +123,7 @@ class OptionGroupSchema(BaseObject):
     options: list[OptionSchema]
 
 
-@dataclass
+@dataclass(slots=True)
 class SlackFileSchema(BaseObject):
     """Slack File object.
 
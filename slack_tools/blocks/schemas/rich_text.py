@@ -18,7 +18,7 @@ __all__ = [
 ]
 
 
-@dataclass
+@dataclass(slots=True)
 class StyleRichTextSchema:
     """Rich text style."""
 
@@ -28,7 +28,7 @@ class StyleRichTextSchema:
     code: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class StyleRichMentionSchema:
     """Rich mention style."""
 
@@ -40,21 +40,21 @@ class StyleRichMentionSchema:
     unlink: bool | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RichBroadcastSchema(BaseRichElement, block_type='broadcast'):
     """Rich broadcast."""
 
     range: Literal['here', 'channel', 'everyone']
 
 
-@dataclass
+@dataclass(slots=True)
 class RichColorSchema(BaseRichElement, block_type='color'):
     """Rich color."""
 
     color: str
 
 
-@dataclass
+@dataclass(slots=True)
 class RichChannelSchema(BaseRichElement, block_type='channel'):
     """Rich channel."""
 
@@ -62,7 +62,7 @@ class RichChannelSchema(BaseRichElement, block_type='channel'):
     style: StyleRichMentionSchema | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RichDateSchema(BaseRichElement, block_type='date'):
     """Rich date."""
 
@@ -72,7 +72,7 @@ class RichDateSchema(BaseRichElement, block_type='date'):
     fallback: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RichEmojiSchema(BaseRichElement, block_type='emoji'):
     """Rich emoji."""
 
@@ -80,7 +80,7 @@ class RichEmojiSchema(BaseRichElement, block_type='emoji'):
     unicode: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RichLinkSchema(BaseRichElement, block_type='link'):
     """Rich link."""
 
@@ -90,7 +90,7 @@ class RichLinkSchema(BaseRichElement, block_type='link'):
     style: StyleRichTextSchema | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RichTextSchema(BaseRichElement, block_type='text'):
     """Rich text."""
 
@@ -98,7 +98,7 @@ class RichTextSchema(BaseRichElement, block_type='text'):
     style: StyleRichTextSchema | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RichUserSchema(BaseRichElement, block_type='user'):
     """Rich user."""
 
@@ -106,7 +106,7 @@ class RichUserSchema(BaseRichElement, block_type='user'):
     style: StyleRichMentionSchema | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RichUserGroupSchema(BaseRichElement, block_type='usergroup'):
     """Rich user group."""
 
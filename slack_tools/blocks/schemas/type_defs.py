@@ -5,3 +5,4 @@ ButtonStyle = Literal['primary', 'danger']
 ListStyle = Literal['ordered', 'bullet']
 KeyboardEvent = Literal['on_character_entered', 'on_enter_pressed']
 ConversationType = Literal['im', 'mpim', 'private', 'public']
+Overflow = Literal['error', 'split', 'truncate']
@@ -1,11 +1,16 @@
 from dataclasses import dataclass, field
 from typing import Any, Final, Literal, Self
 
+from slack_tools.actions.handler import ActionHandler
+from slack_tools.blocks.index import LayoutIndex
+from slack_tools.blocks.interning import intern, interning_enabled
+from slack_tools.blocks.limits import LayoutBudget
 from slack_tools.blocks.schemas.base import BaseLayout, BaseSurface
 from slack_tools.blocks.schemas.objects import PlainTextSchema
+from slack_tools.blocks.validation import ValidationMode, validate_tree, validation_mode
 
 
-@dataclass
+@dataclass(kw_only=True, slots=True)
 class ModalSurface(BaseSurface, block_type='modal'):
     """Modal Surface.
 
@@ -123,19 +128,91 @@ class ModalSurface(BaseSurface, block_type='modal'):
         },
     )
 
+    _deferred_validation: bool = field(default=False, init=False, repr=False, compare=False)
+    """Whether the modal was built or added to in `deferred` validation mode."""
+
+    _budget: LayoutBudget | None = field(default=None, init=False, repr=False, compare=False)
+
+    _index: LayoutIndex | None = field(default=None, init=False, repr=False, compare=False)
+
+    _action_handler: ActionHandler | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def budget(self) -> LayoutBudget | None:
+        """Platform-limits tracker, set by `track_limits()`."""
+        return self._budget
+
+    @property
+    def action_handler(self) -> ActionHandler:
+        """The handler callbacks of the modal's elements are registered with, created on first use.
+
+        `ActionHandler` keeps its callbacks process-wide, so they're also
+        visible to other modals and to `BlockKit` layouts.
+        """
+        handler = self._action_handler
+        if handler is None:
+            handler = ActionHandler()
+            object.__setattr__(self, '_action_handler', handler)
+        return handler
+
+    @property
+    def index(self) -> LayoutIndex:
+        """Where each `block_id` and `action_id` in the modal is. See `BlockKit.index`."""
+        index = self._index
+        if index is None or index.blocks is not self.blocks:
+            index = LayoutIndex(self.blocks)
+            object.__setattr__(self, '_index', index)
+        for callback in index.sync():
+            self.action_handler.add_callback(callback.action_id, callback.callback)
+        return index
+
+    def __post_init__(self):
+        if validation_mode() is ValidationMode.DEFERRED:
+            object.__setattr__(self, '_deferred_validation', True)
+
     def __getitem__(self, blocks: Any | tuple[Any, ...]) -> Self:
         """Add blocks to the Modal."""
         if not isinstance(blocks, tuple):
             blocks = (blocks,)
+        if any(isinstance(block, list) for block in blocks):
+            # e.g. the sections from `section(text, overflow='split')`
+            blocks = tuple(item for block in blocks for item in (block if isinstance(block, list) else (block,)))
+
+        if self.budget is not None:
+            self.budget.add(blocks)
+
+        # Before interning, which may swap a `Button` for an equal one with another callback.
+        for callback in self.index.add(blocks):
+            self.action_handler.add_callback(callback.action_id, callback.callback)
+
+        if interning_enabled():
+            blocks = intern(blocks)
 
-        for block in blocks:
-            if hasattr(block, 'get_action') and callable(getattr(block, 'get_action')):
-                callback = block.get_action()
-                if callback:
-                    self.action_handler.add_callback(
-                        callback.action_id,
-                        callback.callback,
-                    )
+        if validation_mode() is ValidationMode.DEFERRED:
+            object.__setattr__(self, '_deferred_validation', True)
 
         self.blocks.extend(blocks)
+        self.mark_dirty()
         return self
+
+    def track_limits(self, surface: str = 'modal', **kwargs) -> Self:
+        """Check Slack's platform limits for `surface` (`modal` or `home`) as blocks are added.
+
+        See `BlockKit.track_limits`.
+        """
+        object.__setattr__(self, '_budget', LayoutBudget(surface, **kwargs))
+        self.budget.add(self.blocks)  # type: ignore[union-attr]
+        return self
+
+    def to_dict(self, minimal: bool = False) -> dict:
+        """Return dictionary representation, without `None` values.
+
+        Raises:
+            BlockValidationError: If the modal was built in `deferred` validation mode and is invalid.
+        """
+        if self._deferred_validation:
+            validate_tree(self)
+            object.__setattr__(self, '_deferred_validation', False)
+        # Not `super()`: `dataclass(slots=True)` rebuilds the class, and the zero-argument form would
+        # refer to the original.
+        return super(ModalSurface, self).to_dict(minimal)
@@ -0,0 +1,273 @@
+"""Block Kit: Validation modes.
+
+How much checking block construction does:
+
+- `strict` (default): everything, i.e. field types, rules such as "one of
+  `text` or `fields`", and length limits.
+- `fast`: length limits only, e.g. for layouts whose structure is covered by
+  tests but whose text comes from users.
+- `off`: nothing, for trusted, pre-tested layouts rebuilt in hot loops.
+- `deferred`: nothing while building; layouts assembled in this mode
+  (`kit[...]`) are checked as a whole by `validate_tree()` when they're
+  serialized, and every violation is reported at once, each with the JSON
+  pointer of the offending object or field.
+
+Normalization done at construction (e.g. detecting emoji in `PlainText`) runs
+in every mode.
+
+The mode is set for the whole process with `set_validation_mode()`, and can be
+overridden for a block of code with `validation()`. Overrides are stored in a
+`ContextVar`, so they don't leak into other threads or asyncio tasks:
+
+    with validation('off'):
+        layout = build_digest(rows)
+
+    with validation('deferred'):
+        layout = build_form(fields)
+        layout.to_api()  # raises BlockValidationError listing every problem
+
+Construction is the only time blocks are checked, unless assignment checks
+are turned on with `set_assignment_checks()`, or for a block of code (again
+through a `ContextVar`) with `assignment_checks()`: then
+assigning to a field (`section.text = ...`, `rich_list.indent = 9`) checks the
+new value against that field's limits and constraints, in the current mode,
+before it's stored. Only the assigned field is checked, so in-place edits stay
+cheap and safe without rebuilding the block.
+"""
+
+import contextlib
+from contextvars import ContextVar
+from dataclasses import dataclass, is_dataclass
+from enum import StrEnum
+from typing import Any, Iterator
+
+from slack_tools.blocks.mixins.validator import TypeValidatorMixin
+from slack_tools.exceptions import BlockValidationError, ValidationError
+
+__all__ = [
+    'ValidationMode',
+    'assignment_checks',
+    'assignment_checks_enabled',
+    'check_assignment',
+    'set_assignment_checks',
+    'set_validation_mode',
+    'validate_tree',
+    'validation',
+    'validation_mode',
+]
+
+
+class ValidationMode(StrEnum):
+    """How much checking block construction does."""
+
+    STRICT = 'strict'
+    FAST = 'fast'
+    OFF = 'off'
+    DEFERRED = 'deferred'
+
+    @property
+    def checks_rules(self) -> bool:
+        """Whether construction checks field types and cross-field rules."""
+        return self is ValidationMode.STRICT
+
+    @property
+    def checks_lengths(self) -> bool:
+        """Whether construction checks length limits."""
+        return self is ValidationMode.STRICT or self is ValidationMode.FAST
+
+
+@dataclass
+class _Settings:
+    mode: ValidationMode = ValidationMode.STRICT
+    assignments: bool = False
+
+
+_SETTINGS = _Settings()
+
+_OVERRIDE: ContextVar[ValidationMode | None] = ContextVar('validation_mode', default=None)
+"""Mode set by `validation()` for the current context, if any."""
+
+_ASSIGNMENTS_OVERRIDE: ContextVar[bool | None] = ContextVar('assignment_checks', default=None)
+"""Whether assignments are checked, set by `assignment_checks()` for the current context, if any."""
+
+
+def validation_mode() -> ValidationMode:
+    """Return the mode in effect for the current context."""
+    return _OVERRIDE.get() or _SETTINGS.mode
+
+
+def set_validation_mode(mode: ValidationMode | str) -> None:
+    """Set the mode for the whole process, outside any `validation()` block.
+
+    Raises:
+        ValueError: If `mode` isn't `strict`, `fast`, `off` or `deferred`.
+    """
+    _SETTINGS.mode = ValidationMode(mode)
+
+
+@contextlib.contextmanager
+def validation(mode: ValidationMode | str) -> Iterator[None]:
+    """Use `mode` for blocks built inside the `with` block."""
+    token = _OVERRIDE.set(ValidationMode(mode))
+    try:
+        yield
+    finally:
+        _OVERRIDE.reset(token)
+
+
+def assignment_checks_enabled() -> bool:
+    """Whether assigning to a field of a block checks the new value first, in the current context."""
+    enabled = _ASSIGNMENTS_OVERRIDE.get()
+    return _SETTINGS.assignments if enabled is None else enabled
+
+
+def set_assignment_checks(enabled: bool) -> None:
+    """Turn checking of field assignments on or off for the whole process, outside any `assignment_checks()` block."""
+    _SETTINGS.assignments = enabled
+
+
+@contextlib.contextmanager
+def assignment_checks(enabled: bool = True) -> Iterator[None]:
+    """Check field assignments made inside the `with` block (or not, with `enabled=False`)."""
+    token = _ASSIGNMENTS_OVERRIDE.set(enabled)
+    try:
+        yield
+    finally:
+        _ASSIGNMENTS_OVERRIDE.reset(token)
+
+
+def check_assignment(obj: Any, name: str, value: Any, added: tuple | None = None) -> None:
+    """Check `value` before it's assigned to `obj.name`, as construction would in the current mode.
+
+    Only what involves that field is checked: its type (for classes that
+    validate types), its length limits, and the declared constraints that
+    name it, from the tables `BlockMetaclass` compiles per class.
+
+    Args:
+        obj: The instance being assigned to.
+        name: The field being assigned.
+        value: The new value.
+        added: If `value` is the list field's current items followed by
+            these, only these are type-checked; the rest have been already.
+
+    Raises:
+        ValueError, ValidationError: If the assignment would make `obj` invalid.
+    """
+    mode = validation_mode()
+    if mode.checks_rules and isinstance(obj, TypeValidatorMixin) and name in getattr(obj, '__dataclass_fields__', ()):
+        obj.check_field_type(name, value if added is None else added)
+
+    checks = getattr(obj, '_field_checks', {}).get(name)
+    if checks is None:
+        return
+    check_rules, check_lengths = checks
+    if check_rules is not None and mode.checks_rules:
+        check_rules(obj, value)
+    if check_lengths is not None and mode.checks_lengths:
+        check_lengths(obj, value)
+
+
+def validate_tree(value: Any) -> None:
+    """Check a whole layout, block or list of blocks in one pass, as in `strict` mode.
+
+    Frozen subtrees skip the rules written out in `__post_init__`, which
+    can't run again, but not the declared `_constraints`. Frozen subtrees that
+    pass (or were frozen in `strict` mode) are marked, and skipped from then
+    on, so layouts sharing templates only pay for their new content.
+
+    Raises:
+        BlockValidationError: Listing every violation with its JSON pointer,
+            e.g. `/blocks/3/accessory/text`.
+    """
+    errors: list[tuple[Path, Exception]] = []
+    token = _OVERRIDE.set(ValidationMode.STRICT)
+    try:
+        _walk(value, None, errors)
+    finally:
+        _OVERRIDE.reset(token)
+    if errors:
+        raise BlockValidationError([(_pointer(path), error) for path, error in errors])
+
+
+Path = tuple[Any, str | int] | None
+"""`(parent path, key)`, turned into a JSON pointer only when there's an error."""
+
+
+def _pointer(path: Path) -> str:
+    parts = []
+    while path is not None:
+        path, key = path
+        parts.append(str(key))
+    return ''.join(f'/{part}' for part in reversed(parts))
+
+
+_SCALARS = frozenset({str, int, float, bool})
+
+_PLANS: dict[type, tuple[Any, Any, Any, tuple[str, ...]] | None] = {}
+"""Compiled rules and length checks, hand-written rules, and fields that can hold blocks, by class;
+`None` for non-dataclasses."""
+
+
+def _plan(cls: type) -> tuple[Any, Any, Any, tuple[str, ...]] | None:
+    # Imported here: the decoder imports the block classes, which import this module.
+    from slack_tools.serialization.decoder import field_classes
+
+    if not is_dataclass(cls):
+        _PLANS[cls] = None
+        return None
+
+    check_rules, check_lengths = getattr(cls, '_checks', (None, None))
+    post_init = getattr(cls, '__post_init__', None)
+    # The `__post_init__` written on the class, without the checks `BlockMetaclass` wraps around it.
+    rules = getattr(post_init, '__wrapped__', post_init)
+    plan = _PLANS[cls] = (check_rules, check_lengths, rules, tuple(field_classes(cls)))
+    return plan
+
+
+def _check(check: Any, node: Any, path: Path, errors: list[tuple[Path, Exception]]) -> None:
+    """Run a compiled check, collecting its violations under `path`."""
+    start = len(errors)
+    check(node, errors)
+    for index in range(start, len(errors)):
+        # The check appends `(field name or None, error)`; rewrite it in place as `(path, error)`.
+        name: Any
+        name, error = errors[index]
+        errors[index] = ((path, name) if name is not None else path, error)
+
+
+def _walk(node: Any, path: Path, errors: list[tuple[Path, Exception]]) -> None:
+    cls = node.__class__
+    if cls is list or cls is tuple:
+        for index, item in enumerate(node):
+            if item.__class__ not in _SCALARS:
+                _walk(item, (path, index), errors)
+        return
+
+    try:
+        plan = _PLANS[cls]
+    except KeyError:
+        plan = _plan(cls)
+    if plan is None or getattr(node, 'is_validated', False):
+        return
+    check_rules, check_lengths, rules, names = plan
+    start = len(errors)
+    frozen = getattr(node, 'is_frozen', False)
+
+    if rules is not None and not frozen:
+        try:
+            rules(node)
+        except (ValueError, ValidationError) as e:
+            errors.append((path, e))
+    if check_rules is not None:
+        _check(check_rules, node, path, errors)
+    if check_lengths is not None:
+        _check(check_lengths, node, path, errors)
+
+    for name in names:
+        child = getattr(node, name)
+        if child is not None and child.__class__ not in _SCALARS:
+            _walk(child, (path, name), errors)
+
+    if frozen and len(errors) == start:
+        # Frozen subtrees can't change, so wherever this one is reused it can be skipped.
+        object.__setattr__(node, '_validated', True)
@@ -10,8 +10,11 @@ class ValidationError(BaseSlackToolsError):
     pass
 
 
-class LengthValidationError(ValidationError):
-    """Raised when field length validation fails."""
+class LengthValidationError(ValidationError, ValueError):
+    """Raised when field length validation fails.
+
+    Also a `ValueError`, like the checks it replaced (e.g. on section `fields`).
+    """
 
     def __init__(
         self,
@@ -33,12 +36,44 @@ class LengthValidationError(ValidationError):
         super().__init__(message)
 
 
+class BlockValidationError(ValidationError):
+    """Raised when validating a whole layout finds one or more violations.
+
+    Attributes:
+        errors: `(path, error)` pairs, where `path` is the JSON pointer of the
+            offending object or field in the layout's `to_dict()` form.
+    """
+
+    def __init__(self, errors: list[tuple[str, Exception]]):
+        self.errors = errors
+        lines = '\n'.join(f'  {path or "/"}: {error}' for path, error in errors)
+        super().__init__(f'{len(errors)} validation error(s):\n{lines}')
+
+
 class BlockKitError(BaseSlackToolsError):
     """Base exception for all BlockKit-related errors."""
 
     pass
 
 
+class FrozenBlockError(BlockKitError):
+    """Raised when modifying a block that has been frozen."""
+
+    pass
+
+
+class LimitExceededError(BlockKitError):
+    """Raised when adding blocks would take a layout over a Slack platform limit."""
+
+    pass
+
+
+class DecodeError(BlockKitError):
+    """Raised when a payload can't be decoded into Block Kit classes."""
+
+    pass
+
+
 class ActionHandlerError(BaseSlackToolsError):
     """Raised when there are issues with action handling."""
 
@@ -0,0 +1,111 @@
+"""Markdown: Chunking.
+
+Cuts long mrkdwn into pieces that fit Slack's text limits without breaking
+formatting: a cut never lands inside `*bold*`, `_italic_`, `~strike~`,
+`` `code` ``, a code block, or a `<link>`, `<@mention>` or `<!here>`. Cuts
+prefer a line break in the second half of the allowed length, then a space,
+and only then fall between two characters.
+
+Tokens are plain strings once they're joined into a message, so they're found
+by scanning the text: one regex pass per kind of token, each linear, merged
+into sorted, non-overlapping spans. Each cut then searches back through at most
+one chunk's worth of text, so chunking is linear in the length of the text.
+"""
+
+import heapq
+import re
+from bisect import bisect_right
+
+from slack_tools.exceptions import MarkdownError
+
+__all__ = ['split_text', 'truncate_text']
+
+_TOKENS = (
+    re.compile(r'```.*?```', re.DOTALL),  # CodeBlock
+    re.compile(r'(?<!`)`[^`\n]+`(?!`)'),  # CodeInline, but not the fences between two code blocks
+    re.compile(r'<[^<>\n]+>'),  # Link, Mention, BangMention
+    # Emphasis only opens and closes at word boundaries, as in Slack, so `snake_case` and
+    # `<https://example.com/a_b>` aren't italic.
+    re.compile(r'(?<!\w)\*(?!\s)[^*\n]+(?<!\s)\*(?!\w)'),  # Bold
+    re.compile(r'(?<!\w)_(?!\s)[^_\n]+(?<!\s)_(?!\w)'),  # Italic
+    re.compile(r'(?<!\w)~(?!\s)[^~\n]+(?<!\s)~(?!\w)'),  # Strikethrough
+)
+"""Token patterns. Matches may overlap (e.g. `_see <url>_`); overlapping spans are merged."""
+
+
+class _Spans:
+    """Where the tokens in a text start and end."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        matches = heapq.merge(*(pattern.finditer(text) for pattern in _TOKENS), key=lambda match: match.start())
+        for match in matches:
+            start, end = match.span()
+            if self.ends and start < self.ends[-1]:
+                self.ends[-1] = max(self.ends[-1], end)
+            else:
+                self.starts.append(start)
+                self.ends.append(end)
+
+    def enclosing(self, position: int) -> int | None:
+        """Return the start of the token `position` is strictly inside, if any."""
+        index = bisect_right(self.starts, position) - 1
+        if index >= 0 and self.starts[index] < position < self.ends[index]:
+            return self.starts[index]
+        return None
+
+    def cut(self, start: int, end: int) -> tuple[int, int]:
+        """Find where to end a chunk starting at `start` that can't go past `end`.
+
+        Returns the end of the chunk and where the next one starts (after the
+        line break or space cut at, if any). The end is `start` if the chunk
+        would have to cut a token.
+        """
+        text = self.text
+        for separator, floor in (('\n', (start + end) // 2), (' ', start + 1)):
+            position = end + 1
+            while (index := text.rfind(separator, floor, position)) != -1:
+                token_start = self.enclosing(index)
+                if token_start is None:
+                    return index, index + 1
+                position = token_start
+
+        token_start = self.enclosing(end)
+        if token_start is None:
+            return end, end
+        return token_start, token_start
+
+
+def split_text(text: str, limit: int) -> list[str]:
+    """Cut `text` into chunks of at most `limit` characters, none of which splits a token.
+
+    The line break or space a chunk is cut at is dropped.
+
+    Raises:
+        MarkdownError: If a token is longer than `limit` on its own.
+    """
+    if len(text) <= limit:
+        return [text]
+
+    spans = _Spans(text)
+    chunks = []
+    start = 0
+    while len(text) - start > limit:
+        end, start_next = spans.cut(start, start + limit)
+        if end == start:
+            raise MarkdownError(f'Cannot split text at {start}: a token is longer than {limit} characters')
+        chunks.append(text[start:end])
+        start = start_next
+    if start < len(text):
+        chunks.append(text[start:])
+    return chunks
+
+
+def truncate_text(text: str, limit: int, *, ellipsis: str = '…') -> str:
+    """Cut `text` short to at most `limit` characters, ending outside any token, with `ellipsis`."""
+    if len(text) <= limit:
+        return text
+    end, _ = _Spans(text).cut(0, limit - len(ellipsis))
+    return text[:end].rstrip() + ellipsis
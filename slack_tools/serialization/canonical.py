@@ -0,0 +1,60 @@
+"""Serialization: Canonical.
+
+Canonical JSON and content hashes, for deduplicating payloads and as cache
+keys or ETags for rendered layouts.
+
+Canonical JSON has sorted keys, compact separators, UTF-8 output and no `None`
+values (they are dropped, as in `to_dict()`). `content_hash()` is the SHA-256
+of the canonical JSON, so equal content always hashes the same.
+
+Both are kept per instance together with the serialized `dict` they were
+built from, and reused for as long as `to_dict()` returns that same `dict`:
+on cached layouts (see `SerializableMixin.cache()`), until the instance or one
+of its children changes. A cached `BlockKit` assembles its canonical JSON from
+the cached bytes of each block, so after an edit only the changed block is
+re-encoded before hashing.
+"""
+
+import hashlib
+import json
+from typing import Any
+
+from slack_tools.serialization.stream import COMPACT_SEPARATORS
+
+__all__ = ['canonical_json', 'content_hash', 'to_canonical_bytes']
+
+_ENCODER = json.JSONEncoder(sort_keys=True, separators=COMPACT_SEPARATORS, ensure_ascii=False)
+"""Shared encoder; `json.dumps` builds a new one per call for non-default options."""
+
+
+def canonical_json(data: Any) -> bytes:
+    """Encode wire data (`dict`s, lists and scalars) as canonical JSON."""
+    return _ENCODER.encode(data).encode()
+
+
+def to_canonical_bytes(value: Any) -> bytes:
+    """Return the canonical JSON of a layout, block or wire `dict`, using the cache if possible."""
+    # Checked on the class: on slotted blocks the cache starts out unset.
+    if not hasattr(value.__class__, '_canonical_cache'):
+        return canonical_json(value.to_dict() if hasattr(value, 'to_dict') else value)
+
+    data = value.to_dict()
+    cached = getattr(value, '_canonical_cache', None)
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    encoded = canonical_json(data)
+    if data is getattr(value, '_wire_cache', None):
+        object.__setattr__(value, '_canonical_cache', (data, encoded))
+    return encoded
+
+
+def content_hash(value: Any) -> str:
+    """Return the hex SHA-256 of the canonical JSON of a layout, block or wire `dict`."""
+    data = value.to_canonical_bytes() if hasattr(value, 'to_canonical_bytes') else to_canonical_bytes(value)
+    cached = getattr(value, '_hash_cache', None)
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    digest = hashlib.sha256(data).hexdigest()
+    if getattr(value, '_cached', False):
+        object.__setattr__(value, '_hash_cache', (data, digest))
+    return digest
@@ -0,0 +1,206 @@
+"""Serialization: Decoder.
+
+Compiled, per-class decoders that turn wire `dict`s (e.g. views returned in
+`view_submission` payloads) back into the typed classes in `slack_tools.blocks`.
+
+Dispatch uses the `type` -> class registry kept by `BlockMetaclass`, so finding
+the class for a payload is a single `dict` lookup. Objects without a `type`
+key (options, confirmation dialogs, styles, ...) are decoded into the class
+named by the field's annotation. Builder classes such as `Button` are preferred
+over the schema classes they wrap.
+
+Each decoder is generated from the class's dataclass fields the first time the
+class is decoded. Fields whose annotation can't hold a schema are copied as-is.
+Unknown keys are ignored, since Slack adds its own (`id`, `state`, `hash`, ...)
+to returned views.
+"""
+
+import importlib
+import typing
+from dataclasses import MISSING, fields, is_dataclass
+from typing import Any, Callable
+
+from slack_tools.blocks.schemas.block_metaclass import BlockMetaclass
+from slack_tools.exceptions import DecodeError
+
+__all__ = ['decode', 'field_classes', 'get_decoder', 'resolve_type']
+
+Decoder = Callable[[dict], Any]
+
+_DECODERS: dict[type, Decoder] = {}
+"""Compiled decoders, keyed by class."""
+
+_TYPE_DECODERS: dict[str, Decoder] = {}
+"""Compiled decoders, keyed by `type`."""
+
+_BUILDER_MODULES = ('slack_tools.block_kit', 'slack_tools.blocks.surfaces.modals')
+"""Modules that define every registered class and builder."""
+
+
+def _schema_classes(hint: Any) -> list[type]:
+    """Return the schema classes an annotation can hold."""
+    if isinstance(hint, type):
+        return [hint] if isinstance(hint, BlockMetaclass) or is_dataclass(hint) else []
+    return [cls for arg in typing.get_args(hint) for cls in _schema_classes(arg)]
+
+
+def _untyped_class(hint: Any) -> type | None:
+    """Return the class to decode `type`-less objects of a field into, if any."""
+    candidates = [
+        cls for cls in _schema_classes(hint) if is_dataclass(cls) and 'type' not in {f.name for f in fields(cls)}
+    ]
+    if len(candidates) != 1:
+        return None
+    return BlockMetaclass.facades.get(candidates[0], candidates[0])
+
+
+def decode_value(value: Any, hint: type | None) -> Any:
+    """Decode a field value; `hint` is the class for objects without a `type`."""
+    cls = value.__class__
+    if cls is dict:
+        decoder = _TYPE_DECODERS.get(value.get('type'))
+        if decoder is not None:
+            return decoder(value)
+        if 'type' in value:
+            return _decode_type(value)
+        if hint is None:
+            raise DecodeError(f'Cannot decode object without a type: {value!r}')
+        return get_decoder(hint)(value)
+    if cls is list:
+        return [decode_value(item, hint) for item in value if item is not None]
+    return value
+
+
+def resolve_type(block_type: str) -> type:
+    """Return the class to decode a `type` into, preferring builder classes.
+
+    Raises:
+        DecodeError: If no class is registered for `block_type`.
+    """
+    cls = BlockMetaclass.lookup(block_type)
+    if cls is None:
+        for module in _BUILDER_MODULES:
+            importlib.import_module(module)
+        cls = BlockMetaclass.lookup(block_type)
+    if cls is None:
+        raise DecodeError(f'Unknown block type: {block_type!r}')
+    return cls
+
+
+def field_classes(cls: type) -> dict[str, type | None]:
+    """Map each wire field of `cls` that can hold a schema to its class for `type`-less objects."""
+    hints = typing.get_type_hints(cls)
+    return {
+        f.name: _untyped_class(hints.get(f.name, f.type))
+        for f in fields(cls)
+        if not f.name.startswith('_') and _schema_classes(hints.get(f.name, f.type))
+    }
+
+
+def _decode_type(data: dict) -> Any:
+    """Decode an object whose `type` hasn't been seen yet, caching its decoder."""
+    block_type = data['type']
+    decoder = _TYPE_DECODERS[block_type] = get_decoder(resolve_type(block_type))
+    return decoder(data)
+
+
+def _missing_field_error(cls: type, data: dict, kwargs: dict, required: tuple[str, ...]) -> DecodeError | None:
+    """Return the error for a constructor `TypeError` caused by a missing required field, if it was one."""
+    missing = [name for name in required if name not in kwargs]
+    if not missing:
+        return None
+    label = repr(data['type']) if 'type' in data else cls.__name__
+    names = ', '.join(repr(name) for name in missing)
+    return DecodeError(f'Cannot decode {label}: missing required field{"s" if len(missing) > 1 else ""} {names}')
+
+
+def compile_decoder(cls: type) -> Decoder:
+    """Generate a straight-line decoder for a dataclass.
+
+    A missing required field raises `DecodeError` naming the object's `type`
+    and the field, rather than the constructor's `TypeError`.
+    """
+    classes = field_classes(cls)
+    required = tuple(f.name for f in fields(cls) if f.init and f.default is MISSING and f.default_factory is MISSING)
+    namespace: dict[str, Any] = {
+        'cls': cls,
+        'decode_value': decode_value,
+        'missing_field_error': _missing_field_error,
+        'REQUIRED': required,
+    }
+
+    lines = ['def decode(data):', '    kwargs = {}']
+    late = []
+    for f in fields(cls):
+        if f.name.startswith('_'):
+            continue
+
+        if f.name in classes:
+            namespace[f'HINT_{f.name}'] = classes[f.name]
+            expression = f'decode_value(value, HINT_{f.name})'
+        else:
+            expression = 'value'
+
+        if not f.init:
+            late.append((f.name, expression))
+            continue
+        lines.append(f'    value = data.get({f.name!r})')
+        lines.append('    if value is not None:')
+        lines.append(f'        kwargs[{f.name!r}] = {expression}')
+
+    if required:
+        lines += [
+            '    try:',
+            '        obj = cls(**kwargs)',
+            '    except TypeError as e:',
+            '        error = missing_field_error(cls, data, kwargs, REQUIRED)',
+            '        if error is None:',
+            '            raise',
+            '        raise error from e',
+        ]
+    else:
+        lines.append('    obj = cls(**kwargs)')
+    for name, expression in late:
+        lines.append(f'    value = data.get({name!r})')
+        lines.append('    if value is not None:')
+        lines.append(f'        obj.{name} = {expression}')
+    lines.append('    return obj')
+
+    exec('\n'.join(lines), namespace)
+    decoder = namespace['decode']
+    decoder.__qualname__ = f'{cls.__qualname__}.decode'
+    return decoder
+
+
+def get_decoder(cls: type) -> Decoder:
+    """Return the decoder for `cls`, compiling it on first use."""
+    decoder = _DECODERS.get(cls)
+    if decoder is None:
+        decoder = _DECODERS[cls] = compile_decoder(cls)
+    return decoder
+
+
+def decode(data: dict | list, cls: type | None = None) -> Any:
+    """Decode a wire `dict` (or a list of them) into typed Block Kit classes.
+
+    Args:
+        data: The payload, e.g. a block, a list of blocks, or a view.
+        cls: Class for objects without a `type` key. When given, objects with a
+            `type` must decode into a subclass of it.
+
+    Raises:
+        DecodeError: If an object has an unknown `type`, doesn't match `cls`, or
+            is missing a required field.
+    """
+    if isinstance(data, list):
+        return [decode(item, cls) for item in data if item is not None]
+    if not isinstance(data, dict):
+        raise DecodeError(f'Expected a JSON object, got {type(data).__name__}')
+
+    if cls is not None and 'type' not in data:
+        return get_decoder(BlockMetaclass.facades.get(cls, cls))(data)
+
+    result = decode_value(data, None)
+    if cls is not None and not isinstance(result, cls):
+        raise DecodeError(f'Expected {cls.__name__}, got {type(result).__name__} for type {data.get("type")!r}')
+    return result
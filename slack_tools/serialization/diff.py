@@ -0,0 +1,164 @@
+"""Serialization: Diff.
+
+Structural diff between two layouts (`BlockKit`, `ModalSurface` or any block),
+returned as a JSON Patch (RFC 6902) against their `to_dict()` form.
+
+Blocks are matched by `block_id`, falling back to their position for blocks
+without one. Subtrees are compared on their cached wire `dict`s, so any part of
+the tree shared between both layouts, or left untouched since the last
+serialization, compares by identity without being walked. Everything else is
+compared with C-level `dict`/`list` equality, never with the dataclasses'
+recursive `__eq__`.
+"""
+
+import json
+from typing import Any
+
+__all__ = ['apply_patch', 'diff', 'is_unchanged']
+
+Patch = list[dict[str, Any]]
+
+
+def _wire(value: Any) -> Any:
+    return value.to_dict() if hasattr(value, 'to_dict') else value
+
+
+def _escape(key: str) -> str:
+    return key.replace('~', '~0').replace('/', '~1')
+
+
+def is_unchanged(old: Any, new: Any) -> bool:
+    """Return whether both layouts serialize the same, e.g. to skip an API call."""
+    old, new = _wire(old), _wire(new)
+    return old is new or old == new
+
+
+def diff(old: Any, new: Any) -> Patch:
+    """Return the JSON Patch operations that turn `old` into `new`.
+
+    An empty list means the layouts are unchanged.
+    """
+    ops: Patch = []
+    _diff_value(_wire(old), _wire(new), '', ops)
+    return ops
+
+
+def _diff_value(old: Any, new: Any, path: str, ops: Patch) -> None:
+    if old is new:
+        return
+    cls = old.__class__
+    if cls is not new.__class__:
+        if isinstance(old, (list, tuple)) and isinstance(new, (list, tuple)):
+            _diff_list(old, new, path, ops)
+        else:
+            ops.append({'op': 'replace', 'path': path, 'value': new})
+    elif cls is dict:
+        if old != new:
+            _diff_dict(old, new, path, ops)
+    elif cls is list or cls is tuple:
+        if old != new:
+            _diff_list(old, new, path, ops)
+    elif old != new:
+        ops.append({'op': 'replace', 'path': path, 'value': new})
+
+
+def _diff_dict(old: dict, new: dict, path: str, ops: Patch) -> None:
+    for key in old:
+        if key not in new:
+            ops.append({'op': 'remove', 'path': f'{path}/{_escape(key)}'})
+    for key, value in new.items():
+        if key in old:
+            _diff_value(old[key], value, f'{path}/{_escape(key)}', ops)
+        else:
+            ops.append({'op': 'add', 'path': f'{path}/{_escape(key)}', 'value': value})
+
+
+def _block_id(item: Any) -> Any:
+    return item.get('block_id') if item.__class__ is dict else None
+
+
+def _diff_list(old: list | tuple, new: list | tuple, path: str, ops: Patch) -> None:
+    # Skip the common prefix and suffix, so a single edit only pairs up what's in between.
+    start, old_end, new_end = 0, len(old), len(new)
+    while start < old_end and start < new_end and (old[start] is new[start] or old[start] == new[start]):
+        start += 1
+    while (
+        old_end > start
+        and new_end > start
+        and (old[old_end - 1] is new[new_end - 1] or old[old_end - 1] == new[new_end - 1])
+    ):
+        old_end -= 1
+        new_end -= 1
+    old, new = old[start:old_end], new[start:new_end]
+
+    # Pair each new item with an old one: same `block_id`, or else same position.
+    old_by_id = {block_id: i for i, item in enumerate(old) if (block_id := _block_id(item)) is not None}
+    matches: list[int | None] = []
+    used: set[int] = set()
+    for i, item in enumerate(new):
+        block_id = _block_id(item)
+        if block_id is not None:
+            match = old_by_id.get(block_id)
+        elif i < len(old) and _block_id(old[i]) is None:
+            match = i
+        else:
+            match = None
+        if match in used:
+            match = None
+        if match is not None:
+            used.add(match)
+        matches.append(match)
+
+    # Remove unmatched old items from the back, so earlier indexes stay valid.
+    current = list(range(len(old)))
+    for i in reversed(current):
+        if i not in used:
+            ops.append({'op': 'remove', 'path': f'{path}/{start + i}'})
+            del current[i]
+
+    for i, (match, item) in enumerate(zip(matches, new)):
+        if match is None:
+            ops.append({'op': 'add', 'path': f'{path}/{start + i}', 'value': item})
+            current.insert(i, -1)
+            continue
+        position = current.index(match, i)
+        if position != i:
+            ops.append({'op': 'move', 'from': f'{path}/{start + position}', 'path': f'{path}/{start + i}'})
+            current.insert(i, current.pop(position))
+        _diff_value(old[match], item, f'{path}/{start + i}', ops)
+
+
+def _resolve(doc: Any, path: str) -> tuple[Any, str | int]:
+    parts = [part.replace('~1', '/').replace('~0', '~') for part in path.split('/')[1:]]
+    for part in parts[:-1]:
+        doc = doc[int(part)] if isinstance(doc, list) else doc[part]
+    last = parts[-1]
+    if isinstance(doc, list):
+        return doc, len(doc) if last == '-' else int(last)
+    return doc, last
+
+
+def apply_patch(doc: Any, ops: Patch) -> Any:
+    """Apply JSON Patch operations from `diff()` to a copy of a wire `dict`.
+
+    Supports the `add`, `remove`, `replace` and `move` operations.
+    """
+    doc = json.loads(json.dumps(doc))
+    for op in ops:
+        if op['path'] == '':
+            doc = json.loads(json.dumps(op['value']))
+            continue
+        if op['op'] == 'move':
+            source, key = _resolve(doc, op['from'])
+            value = source.pop(key)
+        else:
+            value = json.loads(json.dumps(op.get('value')))
+
+        target, key = _resolve(doc, op['path'])
+        if op['op'] == 'remove':
+            del target[key]
+        elif op['op'] == 'replace' or not isinstance(target, list):
+            target[key] = value
+        else:
+            target.insert(int(key), value)
+    return doc
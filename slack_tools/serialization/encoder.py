@@ -0,0 +1,319 @@
+"""Serialization: Encoder.
+
+Compiled, per-class serializers that turn schema dataclasses into the plain
+`dict`/`list` structures Slack expects on the wire.
+
+Each serializer is generated from the class's dataclass fields the first time
+the class is serialized (the `@dataclass` decorator runs after `BlockMetaclass`,
+so the fields don't exist yet when the class itself is created). A serializer:
+
+    - emits only wire fields (private `_` fields are skipped),
+    - drops `None` values in the same pass,
+    - never deep-copies values.
+
+Minimal payloads:
+    `serialize_minimal()` additionally drops wire fields whose value equals the
+    field's dataclass default, for defaults that match Slack's own. The `type`
+    discriminator and fields marked with `'emit_default': True` metadata (where
+    the library default differs from Slack's, or Slack requires the field) are
+    always emitted. Minimal forms are not cached.
+
+Caching:
+    Classes that define a `_wire_cache` attribute (see `SerializableMixin`)
+    can keep their serialized `dict` on the instance, once caching is turned
+    on for it with `cache()` (or `freeze()`); other instances are serialized
+    from scratch every time, at no extra cost. Parents aren't linked to their
+    children while serializing: on the first hit of a cached `dict`,
+    `link_children()` checks that each child still has the form it was built
+    from and links it to the parent with a weak reference. From then on,
+    invalidating a child also invalidates every cached ancestor. Cached dicts
+    are shared between parents and must be treated as read-only.
+"""
+
+import weakref
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Any, Callable
+
+__all__ = [
+    'CacheStats',
+    'cache_stats',
+    'get_minimal_serializer',
+    'get_serializer',
+    'link_children',
+    'link_parent',
+    'parent_refs',
+    'register_serializer',
+    'serialize',
+    'serialize_minimal',
+    'slack_defaults',
+    'wire_fields',
+]
+
+Serializer = Callable[[Any], Any]
+"""Turns a value into its wire form: a `dict` for compiled ones, any wire value (e.g. a `list`) for registered ones."""
+
+SCALAR_TYPES = frozenset({str, int, float, bool})
+"""Exact types that are emitted as-is."""
+
+_SERIALIZERS: dict[type, Serializer] = {}
+"""Compiled serializers, keyed by class."""
+
+_MINIMAL_SERIALIZERS: dict[type, Serializer] = {}
+"""Compiled minimal-payload serializers, keyed by class."""
+
+_WIRE_FIELDS: dict[type, tuple[str, ...]] = {}
+"""Wire field names, keyed by class."""
+
+
+@dataclass
+class CacheStats:
+    """Serialization cache counters, for instances with caching turned on."""
+
+    hits: int = 0
+    misses: int = 0
+
+    def reset(self) -> None:
+        self.hits = 0
+        self.misses = 0
+
+
+_STATS = CacheStats()
+
+
+def cache_stats() -> CacheStats:
+    """Return the process-wide serialization cache counters."""
+    return _STATS
+
+
+def wire_fields(cls: type) -> tuple[str, ...]:
+    """Return the names of the fields of `cls` that are sent to Slack."""
+    names = _WIRE_FIELDS.get(cls)
+    if names is None:
+        names = _WIRE_FIELDS[cls] = tuple(f.name for f in fields(cls) if not f.name.startswith('_'))
+    return names
+
+
+def slack_defaults(cls: type) -> dict[str, Any]:
+    """Return the wire fields of `cls` that can be omitted when left at their default.
+
+    Only scalar defaults are considered; `type` and fields marked with
+    `'emit_default': True` metadata are never omitted.
+    """
+    return {
+        f.name: f.default
+        for f in fields(cls)
+        if not f.name.startswith('_')
+        and f.name != 'type'
+        and f.default.__class__ in SCALAR_TYPES
+        and not f.metadata.get('emit_default')
+    }
+
+
+def link_parent(child: Any, parent: Any) -> None:
+    """Record that `parent`'s cached form depends on `child`.
+
+    `_parent_refs` holds a single weak reference, or a list of them once a
+    child is shared by several parents. Frozen children never change, so
+    they aren't linked: a frozen block shared by many parents (e.g. through
+    `block[item]` on frozen blocks) doesn't accumulate references to them.
+    """
+    if getattr(child, '_frozen_json', None) is not None:
+        return
+    refs = getattr(child, '_parent_refs')
+    if refs is None:
+        object.__setattr__(child, '_parent_refs', weakref.ref(parent))
+    elif refs.__class__ is list:
+        for ref in refs:
+            if ref() is parent:
+                return
+        refs.append(weakref.ref(parent))
+    elif refs() is not parent:
+        object.__setattr__(child, '_parent_refs', [refs, weakref.ref(parent)])
+
+
+def parent_refs(node: Any) -> list:
+    """Return the live parents linked to `node`."""
+    refs = getattr(node, '_parent_refs')
+    if refs is None:
+        return []
+    if refs.__class__ is not list:
+        refs = [refs]
+    return [parent for parent in (ref() for ref in refs) if parent is not None]
+
+
+def link_children(node: Any, data: dict) -> bool:
+    """Link the children of `node` to it, on the first hit of its cached `data`.
+
+    Each child with a cache of its own must still have the `dict` embedded in
+    `data`, and be linked to its own children in turn; otherwise something
+    changed below `node` since `data` was built, and the cache is dropped.
+
+    Returns:
+        Whether `data` is still current.
+    """
+    for name in wire_fields(node.__class__):
+        value = getattr(node, name)
+        if value is None or value.__class__ in SCALAR_TYPES:
+            continue
+        embedded: Any = data.get(name)
+        if value.__class__ is list or value.__class__ is tuple:
+            items = [item for item in value if item is not None]
+            current = embedded.__class__ is list and len(items) == len(embedded)
+            current = current and all(_link_child(item, item_data, node) for item, item_data in zip(items, embedded))
+        else:
+            current = _link_child(value, embedded, node)
+        if not current:
+            object.__setattr__(node, '_wire_cache', None)
+            return False
+    object.__setattr__(node, '_linked', True)
+    return True
+
+
+def _link_child(child: Any, data: Any, parent: Any) -> bool:
+    """Link `child` to `parent` if it still serializes to `data`."""
+    if not hasattr(child, '_wire_cache'):
+        # Scalars and values without a cache (e.g. an `OptionSet`) are trusted, as they always were.
+        return True
+    if getattr(child, '_wire_cache') is not data or not (getattr(child, '_linked') or link_children(child, data)):
+        return False
+    link_parent(child, parent)
+    return True
+
+
+def compile_serializer(cls: type) -> Serializer:
+    """Generate a straight-line serializer for a dataclass."""
+    cached = hasattr(cls, '_wire_cache')
+
+    lines = ['def serialize(obj):']
+    if cached:
+        lines.append('    data = obj._wire_cache')
+        lines.append('    if data is not None and (obj._linked or link_children(obj, data)):')
+        lines.append('        STATS.hits += 1')
+        lines.append('        return data')
+    lines.append('    data = {}')
+    for name in wire_fields(cls):
+        lines.append(f'    value = obj.{name}')
+        lines.append('    if value is not None:')
+        lines.append('        cls = value.__class__')
+        lines.append('        if cls in SCALAR_TYPES:')
+        lines.append(f'            data[{name!r}] = value')
+        # Frozen blocks keep list fields as tuples; the wire form is always a `list`.
+        lines.append('        elif cls is list or cls is tuple:')
+        lines.append(f'            data[{name!r}] = [encode(item) for item in value if item is not None]')
+        lines.append('        else:')
+        lines.append('            serializer = SERIALIZERS.get(cls)')
+        lines.append(f'            data[{name!r}] = serializer(value) if serializer else encode(value)')
+    if cached:
+        lines.append('    if obj._cached:')
+        lines.append('        STATS.misses += 1')
+        lines.append("        object_setattr(obj, '_wire_cache', data)")
+        lines.append("        object_setattr(obj, '_linked', False)")
+    lines.append('    return data')
+
+    return _build(cls, lines, 'serialize')
+
+
+def compile_minimal_serializer(cls: type) -> Serializer:
+    """Generate a serializer for a dataclass that omits fields left at Slack's default."""
+    defaults = slack_defaults(cls)
+
+    lines = ['def serialize_minimal(obj):', '    data = {}']
+    for name in wire_fields(cls):
+        lines.append(f'    value = obj.{name}')
+        if name in defaults:
+            default = defaults[name]
+            at_default = f'value.__class__ is {type(default).__name__} and value == {default!r}'
+            lines.append(f'    if value is not None and not ({at_default}):')
+        else:
+            lines.append('    if value is not None:')
+        lines.append('        cls = value.__class__')
+        lines.append('        if cls in SCALAR_TYPES:')
+        lines.append(f'            data[{name!r}] = value')
+        lines.append('        elif cls is list or cls is tuple:')
+        lines.append(f'            data[{name!r}] = [encode_minimal(item) for item in value if item is not None]')
+        lines.append('        else:')
+        lines.append('            serializer = MINIMAL_SERIALIZERS.get(cls)')
+        lines.append(f'            data[{name!r}] = serializer(value) if serializer else encode_minimal(value)')
+    lines.append('    return data')
+
+    return _build(cls, lines, 'serialize_minimal')
+
+
+def _build(cls: type, lines: list[str], name: str) -> Serializer:
+    namespace: dict[str, Any] = {
+        'MINIMAL_SERIALIZERS': _MINIMAL_SERIALIZERS,
+        'SCALAR_TYPES': SCALAR_TYPES,
+        'SERIALIZERS': _SERIALIZERS,
+        'STATS': _STATS,
+        'encode': serialize,
+        'encode_minimal': serialize_minimal,
+        'link_children': link_children,
+        'object_setattr': object.__setattr__,
+    }
+    exec('\n'.join(lines), namespace)
+    serializer = namespace[name]
+    serializer.__qualname__ = f'{cls.__qualname__}.{name}'
+    return serializer
+
+
+def get_serializer(cls: type) -> Serializer:
+    """Return the serializer for `cls`, compiling it on first use."""
+    serializer = _SERIALIZERS.get(cls)
+    if serializer is None:
+        serializer = _SERIALIZERS[cls] = compile_serializer(cls)
+    return serializer
+
+
+def get_minimal_serializer(cls: type) -> Serializer:
+    """Return the minimal-payload serializer for `cls`, compiling it on first use."""
+    serializer = _MINIMAL_SERIALIZERS.get(cls)
+    if serializer is None:
+        serializer = _MINIMAL_SERIALIZERS[cls] = compile_minimal_serializer(cls)
+    return serializer
+
+
+def register_serializer(cls: type, serializer: Serializer, minimal: Serializer | None = None) -> None:
+    """Use a custom serializer for `cls` instead of a compiled one, and `minimal` for minimal payloads."""
+    _SERIALIZERS[cls] = serializer
+    if minimal is not None:
+        _MINIMAL_SERIALIZERS[cls] = minimal
+
+
+def serialize(value: Any) -> Any:
+    """Recursively convert `value` to its wire representation, dropping `None`."""
+    cls = value.__class__
+    if cls in SCALAR_TYPES:
+        return value
+
+    serializer = _SERIALIZERS.get(cls)
+    if serializer is not None:
+        return serializer(value)
+
+    if isinstance(value, (list, tuple)):
+        return [serialize(item) for item in value if item is not None]
+    if isinstance(value, dict):
+        return {k: serialize(v) for k, v in value.items() if v is not None}
+    if is_dataclass(value) and not isinstance(value, type):
+        return get_serializer(cls)(value)
+
+    return value
+
+
+def serialize_minimal(value: Any) -> Any:
+    """Like `serialize()`, but also drop fields left at Slack's default (see `slack_defaults()`)."""
+    cls = value.__class__
+    if cls in SCALAR_TYPES:
+        return value
+
+    serializer = _MINIMAL_SERIALIZERS.get(cls)
+    if serializer is not None:
+        return serializer(value)
+
+    if isinstance(value, (list, tuple)):
+        return [serialize_minimal(item) for item in value if item is not None]
+    if isinstance(value, dict):
+        return {k: serialize_minimal(v) for k, v in value.items() if v is not None}
+    if is_dataclass(value) and not isinstance(value, type):
+        return get_minimal_serializer(cls)(value)
+
+    return value
@@ -0,0 +1,187 @@
+"""Serialization: Stream.
+
+Writes the JSON form of a block tree as a sequence of fragments, without
+building the intermediate `dict` or the full `str` first.
+
+The output is byte-for-byte identical to `json.dumps(value.to_dict())` for the
+same separators, so a streamed payload can replace `to_api()` anywhere. Frozen
+subtrees (see `SerializableMixin.freeze`) are spliced in from their pre-encoded
+JSON instead of being walked.
+"""
+
+import io
+from dataclasses import is_dataclass
+from json.encoder import encode_basestring_ascii
+from typing import IO, Any, Callable, Iterable, Iterator
+
+from slack_tools.serialization.encoder import serialize, wire_fields
+
+__all__ = [
+    'COMPACT_SEPARATORS',
+    'DEFAULT_CHUNK_SIZE',
+    'DEFAULT_SEPARATORS',
+    'encode_fragments',
+    'iter_json_chunks',
+    'write_json',
+]
+
+DEFAULT_SEPARATORS = (', ', ': ')
+"""Same separators as `json.dumps`."""
+
+COMPACT_SEPARATORS = (',', ':')
+"""Separators without whitespace, for minimal payloads."""
+
+DEFAULT_CHUNK_SIZE = 16 * 1024
+"""Approximate size of each chunk handed to the writer."""
+
+Append = Callable[[str], Any]
+
+_PLANS: dict[tuple[type, str], tuple[tuple[str, str], ...]] = {}
+"""Per-class `(field_name, encoded_key + key_separator)` pairs."""
+
+
+def _plan(cls: type, key_sep: str) -> tuple[tuple[str, str], ...]:
+    plan = _PLANS.get((cls, key_sep))
+    if plan is None:
+        plan = _PLANS[cls, key_sep] = tuple(
+            (name, encode_basestring_ascii(name) + key_sep) for name in wire_fields(cls)
+        )
+    return plan
+
+
+def _encode_float(value: float) -> str:
+    if value != value:
+        return 'NaN'
+    if value == float('inf'):
+        return 'Infinity'
+    if value == -float('inf'):
+        return '-Infinity'
+    return float.__repr__(value)
+
+
+def encode_fragments(value: Any, append: Append, separators: tuple[str, str] = DEFAULT_SEPARATORS) -> None:
+    """Encode `value` as JSON, passing each fragment to `append`.
+
+    `None` values are dropped from objects and arrays, like `to_dict()`.
+    """
+    item_sep, key_sep = separators
+
+    if isinstance(value, str):
+        append(encode_basestring_ascii(value))
+    elif value is True:
+        append('true')
+    elif value is False:
+        append('false')
+    elif isinstance(value, int):
+        append(int.__repr__(value))
+    elif isinstance(value, float):
+        append(_encode_float(value))
+    elif isinstance(value, (list, tuple)):
+        append('[')
+        first = True
+        for item in value:
+            if item is None:
+                continue
+            if not first:
+                append(item_sep)
+            first = False
+            encode_fragments(item, append, separators)
+        append(']')
+    elif isinstance(value, dict):
+        append('{')
+        first = True
+        for key, item in value.items():
+            if item is None:
+                continue
+            if not first:
+                append(item_sep)
+            first = False
+            append(encode_basestring_ascii(str(key)) + key_sep)
+            encode_fragments(item, append, separators)
+        append('}')
+    elif is_dataclass(value) and not isinstance(value, type):
+        frozen = getattr(value, '_frozen_json', None)
+        if frozen is not None and separators == DEFAULT_SEPARATORS:
+            append(frozen)
+            return
+
+        append('{')
+        first = True
+        for name, key in _plan(value.__class__, key_sep):
+            item = getattr(value, name)
+            if item is None:
+                continue
+            if not first:
+                append(item_sep)
+            first = False
+            append(key)
+            encode_fragments(item, append, separators)
+        append('}')
+    elif value is None:
+        append('null')
+    elif (serialized := serialize(value)) is not value:
+        # Objects with a registered serializer, e.g. `OptionSet`.
+        encode_fragments(serialized, append, separators)
+    else:
+        raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+
+def iter_json_chunks(
+    items: Iterable[Any],
+    *,
+    separators: tuple[str, str] = DEFAULT_SEPARATORS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """Yield the JSON array of `items` in chunks of roughly `chunk_size` characters.
+
+    Chunks are cut between items, so peak memory is bounded by `chunk_size`
+    plus the encoded size of the largest single item.
+    """
+    item_sep = separators[0]
+    parts: list[str] = ['[']
+    append = parts.append
+    size = 1
+    first = True
+
+    for item in items:
+        if item is None:
+            continue
+        if not first:
+            append(item_sep)
+        first = False
+
+        start = len(parts)
+        encode_fragments(item, append, separators)
+        size += sum(map(len, parts[start:]))
+
+        if size >= chunk_size:
+            yield ''.join(parts)
+            parts.clear()
+            size = 0
+
+    append(']')
+    yield ''.join(parts)
+
+
+def write_json(
+    items: Iterable[Any],
+    fp: IO,
+    *,
+    separators: tuple[str, str] = DEFAULT_SEPARATORS,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    encoding: str = 'utf-8',
+) -> int:
+    """Write the JSON array of `items` into a text or binary file-like object.
+
+    Returns:
+        The number of characters (text) or bytes (binary) written.
+    """
+    binary = not isinstance(fp, io.TextIOBase)
+    written = 0
+    for chunk in iter_json_chunks(items, separators=separators, chunk_size=chunk_size):
+        if binary:
+            fp.write(chunk.encode(encoding))
+        else:
+            fp.write(chunk)
+        written += len(chunk)
+    return written
@@ -1,7 +1,28 @@
+import threading
+
 import pytest
 
-from slack_tools.blocks.schemas.blocks import ImageBlockSchema, SectionBlockSchema
+from slack_tools.block_kit import BlockKit
+from slack_tools.blocks.blocks import ActionsBlock, HeaderBlock, RichTextList, SectionBlock
+from slack_tools.blocks.constraints import to_json_schema
+from slack_tools.blocks.interactive import Button
+from slack_tools.blocks.limits import LimitWarning, SurfaceLimits
+from slack_tools.blocks.schemas.block_metaclass import BlockMetaclass
+from slack_tools.blocks.schemas.blocks import ContextBlockSchema, ImageBlockSchema, SectionBlockSchema
 from slack_tools.blocks.schemas.objects import PlainTextSchema
+from slack_tools.blocks.surfaces.modals import ModalSurface
+from slack_tools.blocks.text import MarkdownText, PlainText
+from slack_tools.blocks.validation import (
+    ValidationMode,
+    assignment_checks,
+    set_validation_mode,
+    validate_tree,
+    validation,
+    validation_mode,
+)
+from slack_tools.exceptions import BlockValidationError, LengthValidationError, LimitExceededError
+from slack_tools.mrkdwn import Bold, Link, Mention
+from slack_tools.mrkdwn.base import MarkdownStr
 
 
 def test_section_block_type_validation():
@@ -25,3 +46,282 @@ def test_section_block_type_validation():
             alt_text='test image', image_url='https://example.com/image.jpg'
         ),
     )
+
+
+def test_list_field_type_validation():
+    """Test that list fields check their elements, including `X | None` annotations."""
+    SectionBlockSchema(fields=[PlainTextSchema(text='a'), PlainTextSchema(text='b')])
+    ContextBlockSchema(elements=[PlainTextSchema(text='a')])
+
+    with pytest.raises(ValueError, match='All elements in fields'):
+        SectionBlockSchema(fields=['a'])
+
+    with pytest.raises(ValueError, match='All elements in elements'):
+        ContextBlockSchema(elements=['not a text object'])
+
+    with pytest.raises(ValueError, match='text must be an instance of PlainTextSchema or MarkdownTextSchema'):
+        SectionBlockSchema(text='plain str')
+
+
+def test_validation_modes():
+    """Test that `fast` only checks length limits and `off` checks nothing."""
+    with validation('fast'):
+        SectionBlockSchema(text='plain str')
+        with pytest.raises(LengthValidationError):
+            HeaderBlock.create('x' * 151)
+
+    with validation(ValidationMode.OFF):
+        SectionBlockSchema(text='plain str')
+        HeaderBlock.create('x' * 151)
+        with validation('strict'):
+            with pytest.raises(ValueError):
+                SectionBlockSchema(text='plain str')
+        assert validation_mode() is ValidationMode.OFF
+
+    assert validation_mode() is ValidationMode.STRICT
+    with pytest.raises(ValueError):
+        SectionBlockSchema(text='plain str')
+
+
+def test_process_validation_mode():
+    """Test that the process-wide mode applies outside `validation()` blocks."""
+    set_validation_mode('off')
+    try:
+        SectionBlockSchema(text='plain str')
+        with validation('strict'), pytest.raises(ValueError):
+            SectionBlockSchema(text='plain str')
+    finally:
+        set_validation_mode('strict')
+
+    with pytest.raises(ValueError):
+        set_validation_mode('lenient')
+
+
+def test_deferred_validation_reports_every_violation():
+    """Test that `deferred` mode validates the whole layout when it's serialized."""
+    with validation('deferred'):
+        kit = BlockKit()[
+            HeaderBlock.create('x' * 151),
+            SectionBlock.create('fine'),
+            SectionBlockSchema(text='plain str'),
+        ]
+        modal = ModalSurface(title=PlainText('A title that is far too long'))[SectionBlockSchema()]
+
+    with pytest.raises(BlockValidationError) as excinfo:
+        kit.to_api()
+    assert [path for path, _ in excinfo.value.errors] == ['/blocks/0/text', '/blocks/2']
+    assert isinstance(excinfo.value.errors[0][1], LengthValidationError)
+
+    with pytest.raises(BlockValidationError) as excinfo:
+        modal.to_json()
+    assert [path for path, _ in excinfo.value.errors] == ['/title', '/blocks/0']
+
+    kit.blocks[0] = HeaderBlock.create('Fixed')
+    kit.blocks[2] = SectionBlock.create('Fixed')
+    kit.mark_dirty()
+    assert kit.to_api()
+    validate_tree(kit)
+
+
+def test_limits_budget_tracks_blocks_and_bytes():
+    """Test that the budget matches `to_api()` and stops the 51st message block."""
+    kit = BlockKit()[SectionBlock.create('already here')].track_limits('message', warn_at=None)
+    for i in range(49):
+        kit[SectionBlock.create(f'Line "{i}" é')]
+    assert kit.budget.blocks == 50
+    assert kit.budget.bytes == len(kit.to_api())
+    assert BlockKit().budget is None
+
+    with pytest.raises(LimitExceededError):
+        kit[SectionBlock.create('one too many')]
+    assert len(kit.blocks) == 50
+
+    with pytest.warns(LimitWarning):
+        modal = ModalSurface(title=PlainText('Form'))
+        modal.track_limits(limits=SurfaceLimits(max_blocks=1, max_bytes=500), on_exceed='warn')
+        modal[SectionBlock.create('x' * 1000)]
+    assert len(modal.blocks) == 1
+
+
+def test_split_keeps_headers_with_their_blocks():
+    """Test that `split()` fills messages up to 50 blocks without orphaning a header."""
+    kit = BlockKit()[tuple(SectionBlock.create(f'Line {i}') for i in range(49))]
+    kit[HeaderBlock.create('Next'), SectionBlock.create('After header')]
+    kit[tuple(SectionBlock.create(f'More {i}') for i in range(60))]
+
+    parts = list(kit.split('message'))
+    assert [len(part.blocks) for part in parts] == [49, 50, 12]
+    assert parts[1].blocks[0].type == 'header'
+    assert [block for part in parts for block in part.blocks] == kit.blocks
+    assert all(part.action_handler is kit.action_handler for part in parts)
+
+    with pytest.raises(LimitExceededError):
+        list(kit.split(limits=SurfaceLimits(max_blocks=50, max_bytes=50)))
+
+
+def test_section_overflow_policies():
+    """Test that long section and header text is split or truncated at token boundaries."""
+    text = MarkdownStr(' '.join([Bold('bold text'), Link('https://example.com/a_b'), Mention('@U123')] * 200))
+
+    with pytest.raises(LengthValidationError):
+        SectionBlock.create(text)
+
+    sections = SectionBlock.create(text, overflow='split')
+    assert len(sections) > 1
+    assert all(isinstance(section.text, MarkdownText) and len(section.text.text) <= 3000 for section in sections)
+    assert ' '.join(section.text.text for section in sections) == text
+
+    section = SectionBlock.create(text, overflow='truncate')
+    assert section.text.text.endswith('*…') or section.text.text.endswith('>…')
+
+    header = HeaderBlock.create('word ' * 40, overflow='truncate')
+    assert len(header.text.text) <= 150 and header.text.text.endswith('word…')
+
+    kit = BlockKit()[HeaderBlock.create('Report'), sections]
+    assert len(kit.blocks) == len(sections) + 1
+
+
+def test_declared_constraints():
+    """Test that `_constraints` are enforced at construction, by `validate_tree()`, and exported."""
+    with pytest.raises(ValueError, match='image_url or slack_file is required'):
+        ImageBlockSchema(alt_text='x')
+    with pytest.raises(ValueError, match='image_url must start with https://'):
+        ImageBlockSchema(alt_text='x', image_url='http://example.com/a.png')
+    with pytest.raises(ValueError, match='Only one of text or fields'):
+        SectionBlockSchema(text=PlainTextSchema(text='a'), fields=[PlainTextSchema(text='b')])
+    with pytest.raises(ValueError, match=r'fields\[0\]\.text'):
+        SectionBlockSchema(fields=[PlainTextSchema(text='x' * 2001)])
+    SectionBlockSchema(fields=[])
+    SectionBlockSchema(text=PlainTextSchema(text='a'), fields=[])
+
+    with validation('fast'):
+        SectionBlockSchema()
+        with pytest.raises(LengthValidationError, match=r'fields\[1\]\.text'):
+            SectionBlockSchema(fields=[PlainTextSchema(text='a'), PlainTextSchema(text='x' * 2001)])
+
+    with validation('deferred'):
+        kit = BlockKit()[ImageBlockSchema(alt_text='x', image_url='ftp://a'), SectionBlockSchema()]
+    with pytest.raises(BlockValidationError) as excinfo:
+        validate_tree(kit)
+    assert [path for path, _ in excinfo.value.errors] == ['/blocks/0/image_url', '/blocks/1']
+
+    assert to_json_schema(getattr(ImageBlockSchema, '_constraints')) == {
+        'allOf': [{'oneOf': [{'required': ['image_url']}, {'required': ['slack_file']}]}],
+        'properties': {'image_url': {'pattern': '^https://'}},
+    }
+
+
+def test_validate_tree_skips_validated_frozen_subtrees():
+    """Test that frozen subtrees are marked once they pass, and only unmarked ones are walked."""
+    footer = ContextBlockSchema(elements=[PlainTextSchema(text='footer')]).freeze()
+    assert footer.is_validated and footer.elements[0].is_validated
+
+    with validation('off'):
+        bad = SectionBlockSchema(fields=[PlainTextSchema(text='x' * 2001)]).freeze()
+        unchecked = HeaderBlock.create('Fine').freeze()
+    assert not bad.is_validated and not unchecked.is_validated
+
+    section = SectionBlock.create('mutable')
+    validate_tree([footer, unchecked, section])
+    assert unchecked.is_validated and not section.is_validated
+
+    for _ in range(2):
+        with pytest.raises(BlockValidationError) as excinfo:
+            validate_tree([footer, bad])
+        assert [path for path, _ in excinfo.value.errors] == ['/1/fields']
+    assert not bad.is_validated
+
+
+def test_assignment_checks():
+    """Test that assignments are checked against the assigned field's constraints only when enabled."""
+    section = SectionBlock.create('text')
+    section.text = 'not a text object'  # Unchecked by default.
+    section.text = PlainText.create('text')
+
+    with assignment_checks():
+        with pytest.raises(ValueError, match='text must be an instance of'):
+            section.text = 'not a text object'
+        with pytest.raises(ValueError, match='Only one of text or fields'):
+            section.fields = [PlainText.create('a')]
+        section.text = None
+        section.fields = [PlainText.create('a')]
+        with pytest.raises(LengthValidationError, match=r'fields\[0\]\.text'):
+            section.fields = [PlainText.create('x' * 2001)]
+
+        rich_list = RichTextList(elements=[])
+        with pytest.raises(ValueError, match='indent must be at most 8'):
+            rich_list.indent = 9
+        with validation('off'):
+            rich_list.indent = 9
+
+        # Other threads (and asyncio tasks) keep their own setting.
+        other = threading.Thread(target=setattr, args=(rich_list, 'indent', 10))
+        other.start()
+        other.join()
+        assert rich_list.indent == 10
+    assert section.fields[0].text == 'a'
+
+    rich_list = RichTextList(elements=[])
+    with pytest.raises(ValueError, match='indent must be at most 8'):
+        rich_list['item'].styles(ordered=True, indent=9)
+    assert rich_list.style is None
+
+
+def test_schema_classes_are_slotted():
+    """Test that schema classes and their builders keep instances free of a `__dict__`."""
+    classes = {*BlockMetaclass.registry.values(), *BlockMetaclass.facades.values()}
+    assert [cls.__name__ for cls in classes if cls.__dictoffset__] == []
+    assert BlockMetaclass.lookup('section') is SectionBlock and SectionBlock.__mro__[1] is SectionBlockSchema
+
+    button = Button.create('Open', action_id='open', callback=print)
+    section = SectionBlock.create('text', accessory=button)
+    assert not hasattr(section, '__dict__')
+    assert section.get_action().callback is print
+    assert Button.create('Open').get_action() is None
+
+
+def test_schema_classes_support_virtual_subclasses():
+    """Test that the schema registry doesn't shadow `ABCMeta.register`."""
+
+    class ExternalBlock:
+        pass
+
+    SectionBlockSchema.register(ExternalBlock)
+    assert issubclass(ExternalBlock, SectionBlockSchema)
+    assert ExternalBlock not in BlockMetaclass.registry.values()
+
+
+def test_kit_builders_are_created_on_first_use():
+    """Test that collector prototypes are built lazily, once per kit, and never shared between kits."""
+    kit, other = BlockKit(), BlockKit()
+    assert 'actions' not in vars(kit)
+    assert kit.actions is kit.actions and kit.actions is not other.actions
+    assert kit.button == Button.create
+
+    kit.actions.block_id = 'changed'
+    assert other.actions.block_id is None
+    assert kit.rich_text[kit.rich_section['Hi']].to_dict()['type'] == 'rich_text'
+
+
+def test_layout_index_finds_nested_elements_and_registers_their_callbacks():
+    """Test that callbacks of nested elements are registered, and ids are found without scanning."""
+    approve = Button.create('Approve', action_id='approve', callback=print)
+    actions = ActionsBlock(elements=[Button.create('Open', action_id='open'), approve])
+    actions.block_id = 'buttons'
+    kit = BlockKit()[HeaderBlock.create('Hi'), actions]
+    assert kit.get_callback_fn('approve') is print
+
+    assert kit.index.find(action_id='approve') is approve
+    assert kit.index.find(action_id='approve', block_id='buttons') is approve
+    assert kit.index.find(action_id='approve', block_id='other') is None
+    assert kit.index.pointer(action_id='approve') == '/blocks/1/elements/1'
+    assert kit.index.pointer(block_id='buttons') == '/blocks/1'
+
+    kit.blocks.reverse()
+    assert kit.index.pointer(action_id='approve') == '/blocks/0/elements/1'
+
+    modal = ModalSurface(title=PlainText('Pick'), blocks=[SectionBlock.create('Hi')])
+    modal[ActionsBlock(elements=[Button.create('Reject', action_id='reject', callback=repr)])]
+    assert modal.index.pointer(action_id='reject') == '/blocks/1/elements/0'
+    assert modal.action_handler is modal.action_handler
+    assert modal.action_handler.get_callback_callable('reject') is repr
@@ -0,0 +1,86 @@
+import gc
+import threading
+import weakref
+
+import pytest
+
+from slack_tools.block_kit import BlockKit
+from slack_tools.blocks.blocks import ActionsBlock, HeaderBlock
+from slack_tools.blocks.interactive import Button
+from slack_tools.blocks.interning import _TABLE, intern, interning, interning_enabled
+from slack_tools.exceptions import FrozenBlockError
+
+
+def build_actions():
+    return ActionsBlock(
+        elements=[
+            Button.create('Approve', action_id='approve', style='primary'),
+            Button.create('Reject', action_id='reject', style='danger'),
+        ]
+    )
+
+
+def test_identical_subtrees_are_shared():
+    with interning():
+        first = BlockKit()[HeaderBlock.create('One'), build_actions()]
+        second = BlockKit()[HeaderBlock.create('Two'), build_actions()]
+
+    assert first.blocks[1] is second.blocks[1]
+    assert first.blocks[0] is not second.blocks[0]
+    assert first.blocks[0].text is not second.blocks[0].text
+    assert first.to_api() == BlockKit()[HeaderBlock.create('One'), build_actions()].to_api()
+
+
+def test_interning_is_scoped_to_the_current_context():
+    seen = []
+    with interning():
+        # Other threads (and asyncio tasks) keep their own setting.
+        other = threading.Thread(target=lambda: seen.append(interning_enabled()))
+        other.start()
+        other.join()
+        with interning(False):
+            assert not interning_enabled()
+        assert interning_enabled()
+
+    assert seen == [False]
+    assert not interning_enabled()
+
+
+def test_buttons_with_different_callbacks_are_not_shared():
+    def approve(payload):
+        return 'approve'
+
+    def reject(payload):
+        return 'reject'
+
+    first = intern(Button.create('Go', action_id='go', callback=approve))
+    second = intern(Button.create('Go', action_id='go', callback=reject))
+    assert first is not second
+    assert first.get_action().callback is approve and second.get_action().callback is reject
+    assert intern(Button.create('Go', action_id='go', callback=approve)) is first
+
+    with interning():
+        layout = BlockKit()[ActionsBlock(elements=[Button.create('Go', action_id='go', callback=reject)])]
+    layout.index.rebuild()
+    assert layout.index.find(action_id='go').get_action().callback is reject
+
+
+def test_shared_instances_are_frozen():
+    actions = intern(build_actions())
+
+    assert actions.is_frozen
+    with pytest.raises(FrozenBlockError):
+        actions.elements[0].value = 'changed'
+
+
+def test_interning_is_opt_in_and_entries_are_weak():
+    layout = BlockKit()[build_actions()]
+    assert not layout.blocks[0].is_frozen
+
+    header = intern(HeaderBlock.create('Short-lived'))
+    ref = weakref.ref(header)
+    assert header in _TABLE.values()
+
+    del header
+    gc.collect()
+    assert ref() is None
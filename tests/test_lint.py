@@ -0,0 +1,64 @@
+import json
+
+from slack_tools.__main__ import main
+from slack_tools.lint import lint_paths
+
+
+def write(path, data):
+    path.write_text(json.dumps(data))
+
+
+def test_lint_reports_every_error_with_its_pointer(tmp_path):
+    """Test that files are decoded, validated whole, and checked against their surface's limits."""
+    write(tmp_path / 'ok.json', {'blocks': [{'type': 'divider'}]})
+    write(
+        tmp_path / 'message.json',
+        {'blocks': [{'type': 'header', 'text': {'type': 'plain_text', 'text': 'x' * 151}}, {'type': 'section'}]},
+    )
+    (tmp_path / 'nested').mkdir()
+    modal = {'type': 'modal', 'title': {'type': 'plain_text', 'text': 'Form'}, 'blocks': [{'type': 'divider'}] * 101}
+    write(tmp_path / 'nested' / 'modal.json', modal)
+    (tmp_path / 'broken.json').write_text('{')
+
+    reports = {report.file.removeprefix(f'{tmp_path}/'): report for report in lint_paths([tmp_path], jobs=1)}
+    assert list(reports) == ['broken.json', 'message.json', 'nested/modal.json', 'ok.json']
+    assert reports['ok.json'].ok and reports['ok.json'].surface == 'message'
+    assert [error.path for error in reports['message.json'].errors] == ['/blocks/0/text', '/blocks/1']
+    assert [(error.path, error.type) for error in reports['nested/modal.json'].errors] == [
+        ('/blocks', 'LimitExceededError')
+    ]
+    assert reports['broken.json'].errors[0].type == 'JSONDecodeError'
+
+    pooled = lint_paths([tmp_path], jobs=2)
+    assert [(report.file, report.errors) for report in pooled] == [
+        (report.file, report.errors) for report in reports.values()
+    ]
+
+
+def test_lint_reports_undecodable_objects_with_their_pointer(tmp_path):
+    """Test that an object missing a required field is reported where it is, not as a file-level failure."""
+    button = {'type': 'button', 'action_id': 'go'}
+    write(tmp_path / 'message.json', {'blocks': [{'type': 'divider'}, {'type': 'actions', 'elements': [button]}]})
+    write(tmp_path / 'blocks.json', [{'type': 'divider'}, {'type': 'header'}])
+
+    reports = {report.file.removeprefix(f'{tmp_path}/'): report for report in lint_paths([tmp_path], jobs=1)}
+    assert [(error.path, error.type) for error in reports['message.json'].errors] == [
+        ('/blocks/1/elements/0', 'DecodeError')
+    ]
+    [error] = reports['blocks.json'].errors
+    assert (error.path, error.message) == ('/1', "Cannot decode 'header': missing required field 'text'")
+
+
+def test_lint_command_writes_json_report(tmp_path):
+    """Test the `python -m slack_tools lint` entry point and its exit status."""
+    write(tmp_path / 'ok.json', [{'type': 'divider'}])
+    output = tmp_path / 'report.out'
+
+    assert main(['lint', str(tmp_path / 'ok.json'), '--format', 'json', '-o', str(output)]) == 0
+    report = json.loads(output.read_text())
+    assert report['summary'] == {**report['summary'], 'files': 1, 'failed': 0, 'errors': 0}
+    assert report['files'][0]['ok'] and report['files'][0]['blocks'] == 1
+
+    write(tmp_path / 'bad.json', [{'type': 'section'}])
+    assert main(['lint', str(tmp_path), '-o', str(output)]) == 1
+    assert 'bad.json:/0: ValueError: text or fields is required.' in output.read_text()
@@ -1,5 +1,8 @@
 import pytest
 
+from slack_tools.exceptions import MarkdownError
+from slack_tools.mrkdwn.chunking import split_text, truncate_text
+from slack_tools.mrkdwn.slack import Link
 from slack_tools.mrkdwn.syntax import (
     Bold,
     Code,
@@ -101,3 +104,18 @@ class TestList:
     def test_list_formatting(self, items, style, expected):
         """Test list formatting with various configurations."""
         assert str(List(items, style=style)) == expected
+
+
+def test_split_text_never_cuts_tokens():
+    """Test that chunks end between tokens, and tokens longer than the limit are rejected."""
+    link = Link('https://example.com')
+    text = ' '.join(['see', Bold('a b c'), CodeBlock('x = 1\ny = 2'), link, 'end'])
+    for limit in range(len(link), len(text)):
+        chunks = split_text(text, limit)
+        assert all(len(chunk) <= limit for chunk in chunks)
+        assert ' '.join(chunks) == text
+
+    assert truncate_text(text, 12) == 'see *a b c*…'
+    assert truncate_text(text, 11) == 'see…'
+    with pytest.raises(MarkdownError):
+        split_text(text, len(link) - 1)
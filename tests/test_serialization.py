@@ -0,0 +1,325 @@
+import io
+import json
+import pickle
+from dataclasses import asdict
+
+import pytest
+
+from slack_tools.block_kit import BlockKit
+from slack_tools.blocks.blocks import ActionsBlock, ContextBlock, DividerBlock, SectionBlock
+from slack_tools.blocks.interactive import Button, Checkboxes, NumberInput, RadioButtons
+from slack_tools.blocks.menus import ExternalSelectMenu, StaticSelectMenu
+from slack_tools.blocks.objects import Option, OptionSet
+from slack_tools.blocks.schemas.blocks import HeaderBlockSchema
+from slack_tools.blocks.surfaces.modals import ModalSurface
+from slack_tools.blocks.text import PlainText
+from slack_tools.exceptions import DecodeError, FrozenBlockError
+from slack_tools.serialization import binary
+from slack_tools.serialization.diff import apply_patch, diff, is_unchanged
+from slack_tools.serialization.encoder import cache_stats
+from slack_tools.utils.dataclass_utils import remove_none
+
+
+def build_blocks():
+    return [
+        SectionBlock.create('Hello', accessory=Button.create('Click', action_id='click')),
+        DividerBlock.create(),
+        ActionsBlock(elements=[Button.create('Approve', action_id='approve', style='primary')]),
+    ]
+
+
+def test_to_dict_matches_asdict_without_none():
+    """Compiled serializers produce the same payload as `asdict` + `remove_none`."""
+    for block in build_blocks():
+        assert block.to_dict() == remove_none(asdict(block))
+
+
+def test_to_dict_skips_private_fields():
+    button = Button.create('Click', action_id='click', callback=lambda: None)
+    assert button.to_dict() == {
+        'text': {'text': 'Click', 'emoji': False, 'type': 'plain_text'},
+        'action_id': 'click',
+        'type': 'button',
+    }
+
+
+def test_streamed_api_matches_to_api():
+    layout = BlockKit()[tuple(build_blocks())]
+    assert ''.join(layout.iter_api_chunks(chunk_size=32)) == layout.to_api()
+
+    buffer = io.BytesIO()
+    written = layout.write_api(buffer)
+    assert buffer.getvalue() == layout.to_api().encode()
+    assert written == len(buffer.getvalue())
+
+
+def test_frozen_blocks_are_spliced_verbatim():
+    dynamic = BlockKit()[tuple(build_blocks())]
+    frozen = BlockKit()[tuple(block.freeze() for block in build_blocks())]
+
+    assert frozen.to_api() == dynamic.to_api()
+    assert ''.join(frozen.iter_api_chunks()) == dynamic.to_api()
+    assert frozen.to_dict() == dynamic.to_dict()
+    assert type(frozen.to_dict()['blocks'][2]['elements']) is list
+
+
+def test_frozen_blocks_reject_assignment():
+    actions = ActionsBlock(elements=[Button.create('Approve', action_id='approve')]).freeze()
+
+    assert actions.is_frozen
+    assert actions.elements[0].is_frozen
+    with pytest.raises(FrozenBlockError):
+        actions.elements[0].value = 'changed'
+    with pytest.raises(FrozenBlockError):
+        actions.block_id = 'changed'
+
+
+def test_frozen_collectors_extend_without_rebuilding():
+    approve = Button.create('Approve', action_id='approve')
+    actions = BlockKit().actions[approve].freeze()
+    reject = Button.create('Reject', action_id='reject')
+    extended = actions[reject]
+
+    assert extended.is_frozen and extended.is_validated and reject.is_frozen
+    assert extended.elements == (approve, reject) and extended.elements[0] is approve
+    assert actions.elements == (approve,)
+    rebuilt = BlockKit().actions[approve, reject].freeze()
+    assert extended == rebuilt and hash(extended) == hash(rebuilt)
+    assert extended.to_json() == rebuilt.to_json()
+    assert extended.to_dict() == BlockKit().actions[approve, reject].to_dict()
+    assert len({actions, extended, rebuilt}) == 2
+
+    with pytest.raises(TypeError, match='freeze'):
+        hash(BlockKit().actions[approve])
+    with pytest.raises(ValueError, match='must be instances of'):
+        BlockKit().context[PlainText('footer')].freeze()['not an element']
+
+    select = BlockKit().static_select[Option.create('A', value='a')]
+    assert [option.value for option in select.freeze()[Option.create('B', value='b')].options] == ['a', 'b']
+
+
+def test_option_sets_serialize_like_option_lists():
+    records = [('One', '1', 'First'), ('Två 👋', '2', None), ('Three', '3', '')]
+    options = [Option.create(text, value=value, description=description) for text, value, description in records]
+    option_set = OptionSet.from_records(records)
+
+    for cls in (StaticSelectMenu, Checkboxes, RadioButtons):
+        from_set = BlockKit()[ActionsBlock(elements=[cls(options=option_set, action_id='pick')])]
+        from_list = BlockKit()[ActionsBlock(elements=[cls(options=options, action_id='pick')])]
+        assert from_set.to_api() == from_list.to_api()
+        assert from_set.to_api(minimal=True) == from_list.to_api(minimal=True)
+        assert ''.join(from_set.iter_api_chunks(chunk_size=32)) == from_list.to_api()
+        assert BlockKit.from_json(from_set.to_api()).blocks[0].elements[0].options == options
+
+    assert len(option_set) == 3 and list(option_set) == options and option_set[1] == options[1]
+    assert OptionSet.from_values(['a', 'b']) == OptionSet(['a', 'b'], ['a', 'b'])
+    assert list(option_set[1:]) == options[1:] and option_set[::2] == OptionSet.from_records(records[::2])
+    assert StaticSelectMenu(options=option_set).freeze()[Option.create('Four', value='4')].options[-1].value == '4'
+
+    with pytest.raises(ValueError, match='2 values'):
+        OptionSet(['One'], ['1', '2'])
+    with pytest.raises(ValueError, match='must be an instance of'):
+        ContextBlock(elements=option_set)  # type: ignore[arg-type]
+
+
+def test_unchanged_layout_is_served_from_cache():
+    layout = BlockKit()[tuple(build_blocks())].cache()
+    first = layout.to_api()
+
+    stats = cache_stats()
+    stats.reset()
+    assert layout.to_api() is first
+    assert stats.hits == 1
+    assert stats.misses == 0
+
+
+def test_layouts_are_only_cached_on_request():
+    layout = BlockKit()[tuple(build_blocks())]
+    stats = cache_stats()
+    stats.reset()
+    assert layout.to_api() is not layout.to_api()
+    assert stats.hits == stats.misses == 0
+
+
+def test_nested_change_invalidates_ancestors():
+    button = Button.create('Approve', action_id='approve')
+    layout = BlockKit()[ActionsBlock(elements=[button])].cache()
+    layout.to_api()
+
+    # Changed before the first cache hit, when nothing is linked yet.
+    button.text = PlainText('Reject')
+    assert json.loads(layout.to_api())[0]['elements'][0]['text']['text'] == 'Reject'
+
+    # The first hit links the button to its ancestors, which it then invalidates.
+    layout.to_api()
+    button.style = 'primary'
+    assert json.loads(layout.to_api())[0]['elements'][0]['style'] == 'primary'
+
+    added = Button.create('Later', action_id='later')
+    layout.blocks[0].elements = [button, added]
+    layout.to_api()
+    added.text = PlainText('Sooner')
+    assert json.loads(layout.to_api())[0]['elements'][1]['text']['text'] == 'Sooner'
+
+
+def test_cached_blocks_pickle_without_cache_state():
+    layout = BlockKit()[tuple(build_blocks())].cache()
+    layout.to_api()
+    layout.to_api()
+    frozen = ActionsBlock(elements=[Button.create('Approve', action_id='approve')]).freeze()
+
+    for block in (*layout.blocks, frozen):
+        restored = pickle.loads(pickle.dumps(block))
+        assert restored == block and restored.to_dict() == block.to_dict()
+        assert restored.is_frozen == block.is_frozen
+
+    restored = pickle.loads(pickle.dumps(layout.blocks[0]))
+    restored.accessory.text = PlainText('Changed')
+    assert restored.to_dict()['accessory']['text']['text'] == 'Changed'
+    with pytest.raises(FrozenBlockError):
+        pickle.loads(pickle.dumps(frozen)).block_id = 'changed'
+
+
+def test_minimal_payload_omits_slack_defaults():
+    menu = ExternalSelectMenu(options=[], action_id='owner')
+    assert menu.to_json(minimal=True) == '{"options":[],"action_id":"owner","type":"external_select"}'
+
+    number = NumberInput.create(action_id='count').to_dict(minimal=True)
+    assert number['is_decimal_allowed'] is False
+
+    section = BlockKit()[SectionBlock.create('Hello')].to_dict(minimal=True)
+    assert section['blocks'][0]['text'] == {'text': 'Hello', 'emoji': False, 'type': 'plain_text'}
+
+
+def test_minimal_payload_is_compact():
+    layout = BlockKit()[tuple(build_blocks())]
+    minimal = layout.to_api(minimal=True)
+
+    assert ', ' not in minimal
+    assert len(minimal) < len(layout.to_api())
+    assert ''.join(layout.iter_api_chunks(chunk_size=32, minimal=True)) == minimal
+
+
+def test_from_api_round_trips_into_builder_classes():
+    layout = BlockKit()[tuple(build_blocks())]
+    loaded = BlockKit.from_json(layout.to_api())
+
+    assert loaded.to_api() == layout.to_api()
+    assert [type(block) for block in loaded.blocks] == [type(block) for block in layout.blocks]
+    assert isinstance(loaded.blocks[0].accessory, Button)
+
+
+def test_from_dict_decodes_untyped_objects_and_ignores_unknown_keys():
+    menu = ExternalSelectMenu(options=[Option.create('One', value='1')], action_id='pick')
+    view = ModalSurface(title=PlainText('Pick'), blocks=[ActionsBlock(elements=[menu])])
+    payload = dict(view.to_dict(), id='V123', hash='abc', state={'values': {}})
+
+    loaded = ModalSurface.from_dict(payload)
+    assert loaded.to_dict() == view.to_dict()
+    assert isinstance(loaded.blocks[0].elements[0].options[0], Option)
+
+
+def test_from_dict_rejects_mismatched_or_unknown_types():
+    with pytest.raises(DecodeError):
+        HeaderBlockSchema.from_dict(DividerBlock.create().to_dict())
+    with pytest.raises(DecodeError):
+        BlockKit.from_api([{'type': 'not_a_block'}])
+    with pytest.raises(DecodeError, match="'header': missing required field 'text'"):
+        BlockKit.from_api([{'type': 'header'}])
+
+
+def test_diff_matches_blocks_by_block_id():
+    old = BlockKit()[tuple(build_blocks())]
+    new = BlockKit()[tuple(build_blocks())]
+    for layout in (old, new):
+        layout.blocks[0].block_id = 'greeting'
+        layout.blocks[2].block_id = 'buttons'
+    new.blocks.reverse()
+    new.blocks[0].elements[0].text = PlainText('Approved')
+    new.mark_dirty()
+
+    ops = diff(old, new)
+    assert {'op': 'replace', 'path': '/blocks/0/elements/0/text/text', 'value': 'Approved'} in ops
+    assert all(op['op'] != 'add' for op in ops)
+    assert apply_patch(old.to_dict(), ops) == new.to_dict()
+
+
+def test_unchanged_layouts_produce_no_patch():
+    old = BlockKit()[tuple(build_blocks())]
+    new = BlockKit()[tuple(build_blocks())]
+    assert is_unchanged(old, new)
+    assert diff(old, new) == []
+
+    frozen = BlockKit()[tuple(block.freeze() for block in build_blocks())]
+    assert is_unchanged(old, frozen) and is_unchanged(frozen, old)
+    assert diff(old, frozen) == []
+
+    new[DividerBlock.create()]
+    assert not is_unchanged(old, new)
+    assert diff(old, new) == [{'op': 'add', 'path': '/blocks/3', 'value': {'type': 'divider'}}]
+
+
+def test_canonical_bytes_are_sorted_and_compact():
+    layout = BlockKit()[DividerBlock.create(), SectionBlock.create('Héllo')]
+    expected = (
+        '{"blocks":[{"type":"divider"},'
+        '{"expand":false,"text":{"emoji":false,"text":"Héllo","type":"plain_text"},"type":"section"}]}'
+    )
+    assert layout.to_canonical_bytes() == expected.encode()
+
+
+def test_content_hash_tracks_content_not_identity():
+    old = BlockKit()[tuple(build_blocks())]
+    new = BlockKit()[tuple(build_blocks())]
+    assert old.content_hash() == new.content_hash()
+
+    button = new.blocks[2].elements[0]
+    button.text = PlainText('Approved')
+    assert new.content_hash() != old.content_hash()
+    assert button.content_hash() != old.blocks[2].elements[0].content_hash()
+
+    button.text = PlainText('Approve')
+    assert new.content_hash() == old.content_hash()
+
+
+def test_binary_round_trips_to_dict():
+    layout = BlockKit()[tuple(build_blocks())][
+        SectionBlock.create('Héllo 👋'),
+        ActionsBlock(elements=[NumberInput.create(action_id='n', min_value='1.5')]),
+    ]
+    data = layout.to_binary()
+    assert binary.decode(data) == layout.to_dict()
+    assert json.dumps(binary.decode(data)) == json.dumps(layout.to_dict())
+
+    wire = {'a': [None, True, False, 1, -2, 2.5, 10**20, ''], 'b': {'type': 0}, 'c': 'x' * 70000}
+    assert binary.decode(binary.encode(wire)) == wire
+
+
+def test_binary_decodes_into_typed_blocks():
+    layout = BlockKit()[tuple(build_blocks())]
+    restored = BlockKit.from_binary(layout.to_binary())
+    assert restored.blocks == BlockKit.from_json(layout.to_json()).blocks
+    assert isinstance(restored.blocks[2].elements[0], Button)
+
+    restored.blocks[2].elements[0].text = PlainText('Approved')
+    assert restored.to_dict()['blocks'][2]['elements'][0]['text']['text'] == 'Approved'
+
+    view = ModalSurface(title=PlainText('Settings'), blocks=[DividerBlock.create()])
+    assert ModalSurface.from_binary(view.to_binary()).to_dict() == view.to_dict()
+
+
+def test_binary_rejects_corrupt_payloads():
+    data = BlockKit()[tuple(build_blocks())].to_binary()
+    with pytest.raises(DecodeError):
+        binary.decode(data[:-1])
+    with pytest.raises(DecodeError):
+        binary.decode(b'{"blocks": []}')
+    with pytest.raises(DecodeError):
+        Button.from_binary(DividerBlock.create().to_binary())
+
+    section = SectionBlock.create('Héllo').to_binary()
+    for corrupt in (data[:4] + b'x' + data[5:], section.replace('é'.encode(), b'\xff\xff')):
+        with pytest.raises(DecodeError):
+            binary.decode(corrupt)
+        with pytest.raises(DecodeError):
+            binary.decode_objects(corrupt)